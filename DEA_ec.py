@@ -1,642 +1,399 @@
-'''
-    ===============================================
-       Changed version of inspyred.ec
-    ===============================================
-
-    -- Is called when using DEA strategies
-    -- DEA strategies implementation is based on PAGMO
-
-    modified by: Andreas Tsichritzis <tsadreas@gmail.com>
-'''
-
-import collections
-import copy
-import functools
-from inspyred.ec import archivers
-from inspyred.ec import generators
-from inspyred.ec import migrators
-from inspyred.ec import observers
-from inspyred.ec import replacers
-from inspyred.ec import selectors
-from inspyred.ec import terminators
-from inspyred.ec import variators
-import itertools
-import logging
-import math
-import time
-import random
-import numpy as np
-import custom_replacer
-
-class Error(Exception):
-    """An empty base exception."""
-    pass
-
-
-class EvolutionExit(Error):
-    """An exception that may be raised and caught to end the evolution.
-
-    This is an empty exception class that can be raised by the user
-    at any point in the code and caught outside of the ``evolve``
-    method.
-
-    .. note::
-
-       Be aware that ending the evolution in such a way will almost
-       certainly produce an erroneous population (e.g., not all
-       individuals will have been reevaluated, etc.). However, this
-       approach can be viable if solutions have been archived such
-       that the current population is not of critical importance.
-
-    """
-    pass
-
-
-class Bounder(object):
-    """Defines a basic bounding function for numeric lists.
-
-    This callable class acts as a function that bounds a
-    numeric list between the lower and upper bounds specified.
-    These bounds can be single values or lists of values. For
-    instance, if the candidate is composed of five values, each
-    of which should be bounded between 0 and 1, you can say
-    ``Bounder([0, 0, 0, 0, 0], [1, 1, 1, 1, 1])`` or just
-    ``Bounder(0, 1)``. If either the ``lower_bound`` or
-    ``upper_bound`` argument is ``None``, the Bounder leaves
-    the candidate unchanged (which is the default behavior).
-
-    As an example, if the bounder above were used on the candidate
-    ``[0.2, -0.1, 0.76, 1.3, 0.4]``, the resulting bounded
-    candidate would be ``[0.2, 0, 0.76, 1, 0.4]``.
-
-    A bounding function is necessary to ensure that all
-    evolutionary operators respect the legal bounds for
-    candidates. If the user is using only custom operators
-    (which would be aware of the problem constraints), then
-    those can obviously be tailored to enforce the bounds
-    on the candidates themselves. But the built-in operators
-    make only minimal assumptions about the candidate solutions.
-    Therefore, they must rely on an external bounding function
-    that can be user-specified (so as to contain problem-specific
-    information).
-
-    In general, a user-specified bounding function must accept
-    two arguments: the candidate to be bounded and the keyword
-    argument dictionary. Typically, the signature of such a
-    function would be the following::
-
-        bounded_candidate = bounding_function(candidate, args)
-
-    This function should return the resulting candidate after
-    bounding has been performed.
-
-    Public Attributes:
-
-    - *lower_bound* -- the lower bound for a candidate
-    - *upper_bound* -- the upper bound for a candidate
-
-    """
-    def __init__(self, lower_bound=None, upper_bound=None):
-        self.lower_bound = lower_bound
-        self.upper_bound = upper_bound
-        if self.lower_bound is not None and self.upper_bound is not None:
-            if not isinstance(self.lower_bound, collections.Iterable):
-                self.lower_bound = itertools.repeat(self.lower_bound)
-            if not isinstance(self.upper_bound, collections.Iterable):
-                self.upper_bound = itertools.repeat(self.upper_bound)
-
-    def __call__(self, candidate, args):
-        # The default would be to leave the candidate alone
-        # unless both bounds are specified.
-        if self.lower_bound is None or self.upper_bound is None:
-            return candidate
-        else:
-            if not isinstance(self.lower_bound, collections.Iterable):
-                self.lower_bound = [self.lower_bound] * len(candidate)
-            if not isinstance(self.upper_bound, collections.Iterable):
-                self.upper_bound = [self.upper_bound] * len(candidate)
-            bounded_candidate = candidate
-            for i, (c, lo, hi) in enumerate(zip(candidate, self.lower_bound,
-                                                self.upper_bound)):
-                bounded_candidate[i] = max(min(c, hi), lo)
-            return bounded_candidate
-
-
-class DiscreteBounder(object):
-    """Defines a basic bounding function for numeric lists of discrete values.
-
-    This callable class acts as a function that bounds a
-    numeric list to a set of legitimate values. It does this by
-    resolving a given candidate value to the nearest legitimate
-    value that can be attained. In the event that a candidate value
-    is the same distance to multiple legitimate values, the legitimate
-    value appearing earliest in the list will be used.
-
-    For instance, if ``[1, 4, 8, 16]`` was used as the *values* parameter,
-    then the candidate ``[6, 10, 13, 3, 4, 0, 1, 12, 2]`` would be
-    bounded to ``[4, 8, 16, 4, 4, 1, 1, 8, 1]``.
-
-    Public Attributes:
-
-    - *values* -- the set of attainable values
-    - *lower_bound* -- the smallest attainable value
-    - *upper_bound* -- the largest attainable value
-
-    """
-    def __init__(self, values):
-        self.values = values
-        self.lower_bound = itertools.repeat(min(self.values))
-        self.upper_bound = itertools.repeat(max(self.values))
-
-    def __call__(self, candidate, args):
-        if not isinstance(self.lower_bound, collections.Iterable):
-            self.lower_bound = [min(self.values)] * len(candidate)
-        if not isinstance(self.upper_bound, collections.Iterable):
-            self.upper_bound = [max(self.values)] * len(candidate)
-        closest = lambda target: min(self.values, key=lambda x: abs(x-target))
-        bounded_candidate = candidate
-        for i, c in enumerate(bounded_candidate):
-            bounded_candidate[i] = closest(c)
-        return bounded_candidate
-
-
-class Individual(object):
-    """Represents an individual in an evolutionary computation.
-
-    An individual is defined by its candidate solution and the
-    fitness (or value) of that candidate solution. Individuals
-    can be compared with one another by using <, <=, >, and >=.
-    In all cases, such comparisons are made using the individuals'
-    fitness values. The ``maximize`` attribute is respected in all
-    cases, so it is better to think of, for example, < (less-than)
-    to really mean "worse than" and > (greater-than) to mean
-    "better than". For instance, if individuals a and b have fitness
-    values 2 and 4, respectively, and if ``maximize`` were ``True``,
-    then a < b would be true. If ``maximize`` were ``False``, then
-    a < b would be false (because a is "better than" b in terms of
-    the fitness evaluation, since we're minimizing).
-
-    .. note::
-
-       ``Individual`` objects are almost always created by the EC,
-       rather than the user. The ``evolve`` method of the EC also
-       has a ``maximize`` argument, whose value is passed directly
-       to all created individuals.
-
-    Public Attributes:
-
-    - *candidate* -- the candidate solution
-    - *fitness* -- the value of the candidate solution
-    - *birthdate* -- the system time at which the individual was created
-    - *maximize* -- Boolean value stating use of maximization
-
-    """
-    def __init__(self, candidate=None, maximize=True):
-        self._candidate = candidate
-        self.fitness = None
-        self.birthdate = time.time()
-        self.maximize = maximize
-        self.responses = None
-
-    @property
-    def candidate(self):
-        return self._candidate
-
-    @candidate.setter
-    def candidate(self, value):
-        self._candidate = value
-        self.fitness = None
-        self.responses = None
-
-    def __str__(self):
-        return '{0} : {1}, {2}'.format(self.candidate, self.fitness, self.responses)
-
-    def __repr__(self):
-        return '<Individual: candidate = {0}, fitness = {1}, birthdate = {2}>'.format(self.candidate, self.fitness, self.birthdate)
-
-    def __lt__(self, other):
-        if self.fitness is not None and other.fitness is not None:
-            if self.maximize:
-                return self.fitness < other.fitness
-            else:
-                return self.fitness > other.fitness
-        else:
-            raise Error('fitness cannot be None when comparing Individuals')
-
-    def __le__(self, other):
-        return self < other or not other < self
-
-    def __gt__(self, other):
-        if self.fitness is not None and other.fitness is not None:
-            return other < self
-        else:
-            raise Error('fitness cannot be None when comparing Individuals')
-
-    def __ge__(self, other):
-        return other < self or not self < other
-
-    def __eq__(self, other):
-        return ((self._candidate, self.fitness, self.maximize) ==
-                (other._candidate, other.fitness, other.maximize))
-
-    def __ne__(self, other):
-        return not (self == other)
-
-
-
-class EvolutionaryComputation(object):
-    """Represents a basic evolutionary computation.
-
-    This class encapsulates the components of a generic evolutionary
-    computation. These components are the selection mechanism, the
-    variation operators, the replacement mechanism, the migration
-    scheme, the archival mechanism, the terminators, and the observers.
-
-    The ``observer``, ``terminator``, and ``variator`` attributes may be
-    specified as lists of such operators. In the case of the ``observer``,
-    all elements of the list will be called in sequence during the
-    observation phase. In the case of the ``terminator``, all elements of
-    the list will be combined via logical ``or`` and, thus, the evolution will
-    terminate if any of the terminators return True. Finally, in the case
-    of the ``variator``, the elements of the list will be applied one
-    after another in pipeline fashion, where the output of one variator
-    is used as the input to the next.
-
-    Public Attributes:
-
-    - *selector* -- the selection operator (defaults to ``default_selection``)
-    - *variator* -- the (possibly list of) variation operator(s) (defaults to
-      ``default_variation``)
-    - *replacer* -- the replacement operator (defaults to
-      ``default_replacement``)
-    - *migrator* -- the migration operator (defaults to ``default_migration``)
-    - *archiver* -- the archival operator (defaults to ``default_archiver``)
-    - *observer* -- the (possibly list of) observer(s) (defaults to
-      ``default_observer``)
-    - *terminator* -- the (possibly list of) terminator(s) (defaults to
-      ``default_termination``)
-    - *logger* -- the logger to use (defaults to the logger 'inspyred.ec')
-
-    The following attributes do not have legitimate values until after
-    the ``evolve`` method executes:
-
-    - *termination_cause* -- the name of the function causing
-      ``evolve`` to terminate, in the event that multiple terminators are used
-    - *generator* -- the generator function passed to ``evolve``
-    - *evaluator* -- the evaluator function passed to ``evolve``
-    - *bounder* -- the bounding function passed to ``evolve``
-    - *maximize* -- Boolean stating use of maximization passed to ``evolve``
-    - *archive* -- the archive of individuals
-    - *population* -- the population of individuals
-    - *num_evaluations* -- the number of fitness evaluations used
-    - *num_generations* -- the number of generations processed
-
-    Note that the attributes above are, in general, not intended to
-    be modified by the user. (They are intended for the user to query
-    during or after the ``evolve`` method's execution.) However,
-    there may be instances where it is necessary to modify them
-    within other functions. This is possible to do, but it should be the
-    exception, rather than the rule.
-
-    If logging is desired, the following basic code segment can be
-    used in the ``main`` or calling scope to accomplish that::
-
-        import logging
-        logger = logging.getLogger('inspyred.ec')
-        logger.setLevel(logging.DEBUG)
-        file_handler = logging.FileHandler('inspyred.log', mode='w')
-        file_handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-    Protected Attributes:
-
-    - *_random* -- the random number generator object
-    - *_kwargs* -- the dictionary of keyword arguments initialized
-      from the *args* parameter in the *evolve* method
-
-    """
-    def __init__(self, random):
-        self.selector = selectors.default_selection
-        self.strategy = None
-        self.variator = variators.default_variation
-        self.replacer = replacers.default_replacement
-        self.migrator = migrators.default_migration
-        self.observer = observers.default_observer
-        self.archiver = archivers.default_archiver
-        self.terminator = terminators.default_termination
-        self.termination_cause = None
-        self.generator = None
-        self.evaluator = None
-        self.bounder = None
-        self.maximize = True
-        self.archive = None
-        self.population = None
-        self.num_evaluations = 0
-        self.num_generations = 0
-        self.logger = logging.getLogger('inspyred.ec')
-        try:
-            self.logger.addHandler(logging.NullHandler())
-        except AttributeError:
-            # If Python < 2.7, then NullHandler doesn't exist.
-            pass
-        self._random = random
-        self._kwargs = dict()
-
-    def _should_terminate(self, pop, ng, ne):
-        terminate = False
-        fname = ''
-        if isinstance(self.terminator, collections.Iterable):
-            for clause in self.terminator:
-                self.logger.debug('termination test using {0} at generation {1} and evaluation {2}'.format(clause.__name__, ng, ne))
-                terminate = terminate or clause(population=pop, num_generations=ng, num_evaluations=ne, args=self._kwargs)
-                if terminate:
-                    fname = clause.__name__
-                    break
-        else:
-            self.logger.debug('termination test using {0} at generation {1} and evaluation {2}'.format(self.terminator.__name__, ng, ne))
-            terminate = self.terminator(population=pop, num_generations=ng, num_evaluations=ne, args=self._kwargs)
-            fname = self.terminator.__name__
-        if terminate:
-            self.termination_cause = fname
-            self.logger.debug('termination from {0} at generation {1} and evaluation {2}'.format(self.termination_cause, ng, ne))
-        return terminate
-
-
-    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
-        """Perform the evolution.
-
-
-        - *_ec* -- the evolutionary computation (this object)
-
-        """
-        self._kwargs = args
-        self._kwargs['_ec'] = self
-
-        if seeds is None:
-            seeds = []
-        if bounder is None:
-            bounder = Bounder()
-
-        self.termination_cause = None
-        self.generator = generator
-        self.evaluator = evaluator
-        self.bounder = bounder
-        self.maximize = maximize
-        self.population = []
-        self.archive = []
-
-        # Create the initial population.
-        if not isinstance(seeds, collections.Sequence):
-            seeds = [seeds]
-        initial_cs = copy.copy(seeds)
-        num_generated = max(pop_size - len(seeds), 0)
-        i = 0
-        self.logger.debug('generating initial population')
-        while i < num_generated:
-            cs = generator(random=self._random, args=self._kwargs)
-            initial_cs.append(cs)
-            i += 1
-        self.logger.debug('evaluating initial population')
-        initial_fit, initial_res = evaluator(candidates=initial_cs, args=self._kwargs)
-        for cs, fit, res in zip(initial_cs, initial_fit, initial_res):
-            if fit is not None:
-                ind = Individual(cs, maximize=maximize)
-                ind.fitness = fit
-                ind.responses = res
-                self.population.append(ind)
-            else:
-                self.logger.warning('excluding candidate {0} because fitness received as None'.format(cs))
-        self.logger.debug('population size is now {0}'.format(len(self.population)))
-
-        self.num_evaluations = len(initial_fit)
-        self.num_generations = 0
-
-        self.logger.debug('archiving initial population')
-        self.archive = self.archiver(random=self._random, population=list(self.population), archive=list(self.archive), args=self._kwargs)
-        self.logger.debug('archive size is now {0}'.format(len(self.archive)))
-        self.logger.debug('population size is now {0}'.format(len(self.population)))
-
-        if isinstance(self.observer, collections.Iterable):
-            for obs in self.observer:
-                self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(obs.__name__, self.num_generations, self.num_evaluations))
-                obs(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
-        else:
-            self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(self.observer.__name__, self.num_generations, self.num_evaluations))
-            self.observer(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
-
-
-
-
-        best = max(self.population)
-        gbfit = best.fitness
-        gbX = best.candidate
-
-        gbIter = gbX
-
-        NP = len(self.population)
-        D = len(gbX)
-
-        parent_cs = [copy.deepcopy(i.candidate) for i in self.population]
-        parent_fit = [copy.deepcopy(i.fitness) for i in self.population]
-        parents = copy.deepcopy(self.population)
-
-        m_f = float(args['mutation_rate'])
-        m_cr = float(args['crossover_rate'])
-
-        while not self._should_terminate(list(self.population), self.num_generations, self.num_evaluations):
-            offspring_cs = []
-
-            for i in range(0,NP):
-
-                ### pick random population memebers
-                while True:
-                    r1 = random.randint(0,NP-1)
-                    if r1!=i:
-                        break
-                while True:
-                    r2 = random.randint(0,NP-1)
-                    if r2!=i and r2!=r1:
-                        break
-                while True:
-                    r3 = random.randint(0,NP-1)
-                    if r3!=i and r3!=r2 and r3!=r1:
-                        break
-                while True:
-                    r4 = random.randint(0,NP-1)
-                    if r4!=i and r4!=r3 and r4!=r2 and r4!=r1:
-                        break
-                while True:
-                    r5 = random.randint(0,NP-1)
-                    if r5!=i and r5!=r4 and r4!=r3 and r4!=r2 and r4!=r1:
-                        break
-
-                strategy = self.strategy
-
-                if strategy == 'DE/best/1/exp':
-                    n = random.randint(0,D-1)
-                    L = 0
-                    tmp = parent_cs[i]
-                    while L < D:
-                        tmp[n] = gbIter[n] + m_f*(parent_cs[r2][n]-parent_cs[r3][n])
-                        n = (n+1)%D
-                        L += 1
-                        m_dprn = random.random()
-                        if m_cr < m_dprn:
-                            break
-                elif strategy == 'DE/rand/1/exp':
-                    n = random.randint(0,D-1)
-                    L = 0
-                    tmp = parent_cs[i]
-                    while L < D:
-                        tmp[n] = parent_cs[r1][n] + m_f*(parent_cs[r2][n]-parent_cs[r3][n])
-                        n = (n+1)%D
-                        L += 1
-                        m_dprn = random.random()
-                        if m_cr < m_dprn:
-                            break
-                elif strategy == 'DE/rand-to-best/1/exp':
-                    n = random.randint(0,D-1)
-                    L = 0
-                    tmp = parent_cs[i]
-                    while L < D:
-                        tmp[n] = tmp[n] + m_f*(gbIter[n] - tmp[n]) + m_f*(parent_cs[r1][n]-parent_cs[r2][n])
-                        n = (n+1)%D
-                        L += 1
-                        m_dprn = random.random()
-                        if m_cr < m_dprn:
-                            break
-                elif strategy == 'DE/best/2/exp':
-                    n = random.randint(0,D-1)
-                    L = 0
-                    tmp = parent_cs[i]
-                    while L < D:
-                        tmp[n] = gbIter[n] + (parent_cs[r1][n]+parent_cs[r2][n]-parent_cs[r3][n]-parent_cs[r4][n])*m_f
-                        n = (n+1)%D
-                        L += 1
-                        m_dprn = random.random()
-                        if m_cr < m_dprn:
-                            break
-                elif strategy == 'DE/rand/2/exp':
-                    n = random.randint(0,D-1)
-                    L = 0
-                    tmp = parent_cs[i]
-                    while L < D:
-                        tmp[n] = parent_cs[r5][n] + (parent_cs[r1][n]+parent_cs[r2][n]-parent_cs[r3][n]-parent_cs[r4][n])*m_f
-                        n = (n+1)%D
-                        L += 1
-                        m_dprn = random.random()
-                        if m_cr < m_dprn:
-                            break
-                elif strategy == 'DE/best/1/bin':
-                    n = random.randint(0,D-1)
-                    tmp = parent_cs[i]
-                    for L in range(0,D):
-                        m_dprn = random.random()
-                        if m_dprn < m_cr or L+1 == D:
-                            tmp[n] = gbIter[n] + m_f*(parent_cs[r2][n]-parent_cs[r3][n])
-                elif strategy == 'DE/rand/1/bin':
-                    n = random.randint(0,D-1)
-                    tmp = parent_cs[i]
-                    for L in range(0,D):
-                        m_dprn = random.random()
-                        if m_dprn < m_cr or L+1 == D:
-                            tmp[n] = parent_cs[r1][n] + m_f*(parent_cs[r2][n]-parent_cs[r3][n])
-                elif strategy == 'DE/rand-to-best/1/bin':
-                    n = random.randint(0,D-1)
-                    tmp = parent_cs[i]
-                    for L in range(0,D):
-                        m_dprn = random.random()
-                        if m_dprn < m_cr or L+1 == D:
-                            tmp[n] = tmp[n] + m_f*(gbIter[n] - tmp[n]) + m_f*(parent_cs[r1][n]-parent_cs[r2][n])
-                elif strategy == 'DE/best/2/bin':
-                    n = random.randint(0,D-1)
-                    tmp = parent_cs[i]
-                    for L in range(0,D):
-                        m_dprn = random.random()
-                        if m_dprn < m_cr or L+1 == D:
-                            tmp[n] = gbIter[n] +(parent_cs[r1][n]+parent_cs[r2][n]-parent_cs[r3][n]-parent_cs[r4][n])*m_f
-                elif strategy == 'DE/rand/2/bin':
-                    n = random.randint(0,D-1)
-                    tmp = parent_cs[i]
-                    for L in range(0,D):
-                        m_dprn = random.random()
-                        if m_dprn < m_cr or L+1 == D:
-                            tmp[n] = parent_cs[r5][n] + (parent_cs[r1][n]+parent_cs[r2][n]-parent_cs[r3][n]-parent_cs[r4][n])*m_f
-
-                # check if mutated are in bounds
-                for i2 in range(D):
-                    if tmp[i2] > 1 or tmp[i2]<0:
-                        tmp[i2] = round(random.random(),3)
-
-                offspring_cs.append(tmp)
-
-            offspring_fit, offspring_res = evaluator(candidates=offspring_cs, args=self._kwargs)
-
-            offspring = []
-
-            for cs, fit, res in zip(offspring_cs, offspring_fit, offspring_res):
-                if fit is not None:
-                    off = Individual(cs, maximize=maximize)
-                    off.fitness = fit
-                    off.responses = res
-                    offspring.append(off)
-                else:
-                    self.logger.warning('excluding candidate {0} because fitness received as None'.format(cs))
-            self.num_evaluations += len(offspring_fit)
-
-            gbIter = gbX
-
-            # Replace individuals.
-            self.logger.debug('replacement using {0} at generation {1} and evaluation {2}'.format(self.replacer.__name__, self.num_generations, self.num_evaluations))
-            self.population = custom_replacer.dea_replacer(random=self._random, population=self.population, parents=parents, offspring=offspring, maximize=self.maximize, args=self._kwargs)
-            self.logger.debug('population size is now {0}'.format(len(self.population)))
-
-            # Archive individuals.
-            self.logger.debug('archival using {0} at generation {1} and evaluation {2}'.format(self.archiver.__name__, self.num_generations, self.num_evaluations))
-            self.archive = self.archiver(random=self._random, archive=self.archive, population=list(self.population), args=self._kwargs)
-            self.logger.debug('archive size is now {0}'.format(len(self.archive)))
-            self.logger.debug('population size is now {0}'.format(len(self.population)))
-
-            self.num_generations += 1
-            if isinstance(self.observer, collections.Iterable):
-                for obs in self.observer:
-                    self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(obs.__name__, self.num_generations, self.num_evaluations))
-                    obs(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
-            else:
-                self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(self.observer.__name__, self.num_generations, self.num_evaluations))
-                self.observer(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
-        return self.population
-
-class DEA(EvolutionaryComputation):
-    """Evolutionary computation representing a differential evolutionary algorithm.
-
-    This class represents a differential evolutionary algorithm which uses, by
-    default, tournament selection, heuristic crossover, Gaussian mutation,
-    and steady-state replacement. It is expected that each candidate solution
-    is a ``Sequence`` of real values.
-
-    Optional keyword arguments in ``evolve`` args parameter:
-
-    - *num_selected* -- the number of individuals to be selected (default 2)
-    - *tournament_size* -- the tournament size (default 2)
-    - *crossover_rate* -- the rate at which crossover is performed
-      (default 1.0)
-    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
-    - *gaussian_mean* -- the mean used in the Gaussian function (default 0)
-    - *gaussian_stdev* -- the standard deviation used in the Gaussian function
-      (default 1)
-
-    """
-    def __init__(self, random):
-        EvolutionaryComputation.__init__(self, random)
-        self.selector = selectors.tournament_selection
-        self.variator = [variators.heuristic_crossover, variators.gaussian_mutation]
-        self.replacer = replacers.steady_state_replacement
-        self.strategy = None
-
-    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
-        args.setdefault('num_selected', 2)
-        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
-
+'''
+    ===============================================
+       Changed version of inspyred.ec
+    ===============================================
+
+    -- Is called when using DEA strategies
+    -- DEA strategies implementation is based on PAGMO
+    -- Runs on the engine core shared through custom_ec
+    -- Works on preallocated target/trial arrays that are swapped every
+       generation
+    -- Self-adaptive JADE and SHADE strategies with an external archive
+       and linear population size reduction
+
+    modified by: Andreas Tsichritzis <tsadreas@gmail.com>
+'''
+
+import time
+import numpy as np
+from inspyred.ec import replacers
+from inspyred.ec import selectors
+from inspyred.ec import variators
+import custom_replacer
+from custom_ec import Error
+from custom_ec import EvolutionExit
+from custom_ec import Bounder
+from custom_ec import DiscreteBounder
+from custom_ec import Individual
+from custom_ec import EvolutionaryComputation
+from custom_ec import bound_candidates
+
+
+class _SuccessHistory(object):
+    """Means of F and CR learned from the successful trials.
+
+    JADE keeps one pair of means and moves it towards the means of the
+    successful F and CR values with the learning rate *learning_rate*.
+    SHADE keeps *size* pairs, overwrites them in turn with the means
+    weighted by the fitness improvement, and samples every individual
+    around a randomly chosen pair.
+
+    """
+    def __init__(self, m_f, m_cr, size=1, learning_rate=None):
+        self.m_f = np.full(size, m_f, dtype=float)
+        self.m_cr = np.full(size, m_cr, dtype=float)
+        self.learning_rate = learning_rate
+        self.position = 0
+
+    def sample(self, rng, n):
+        """Return the F and CR of *n* individuals as arrays."""
+        r = rng.integers(0, len(self.m_f), n)
+        m_cr = np.clip(rng.normal(self.m_cr[r], 0.1), 0.0, 1.0)
+        # Cauchy distributed F, drawn again where it is not positive
+        m_f = self.m_f[r] + 0.1 * rng.standard_cauchy(n)
+        bad = m_f <= 0
+        while bad.any():
+            m_f[bad] = self.m_f[r[bad]] + 0.1 * rng.standard_cauchy(int(bad.sum()))
+            bad = m_f <= 0
+        return np.minimum(m_f, 1.0), m_cr
+
+    def update(self, m_f, m_cr, improvement):
+        """Learn from the F and CR of the successful trials."""
+        if not len(m_f):
+            return
+        if self.learning_rate is not None or not improvement.sum() > 0:
+            weights = np.full(len(m_f), 1.0 / len(m_f))
+        else:
+            weights = improvement / improvement.sum()
+        # Lehmer mean for F, arithmetic mean for CR
+        mean_f = (weights * m_f * m_f).sum() / (weights * m_f).sum()
+        mean_cr = (weights * m_cr).sum()
+        if self.learning_rate is not None:
+            c = self.learning_rate
+            self.m_f[0] = (1 - c) * self.m_f[0] + c * mean_f
+            self.m_cr[0] = (1 - c) * self.m_cr[0] + c * mean_cr
+        else:
+            self.m_f[self.position] = mean_f
+            self.m_cr[self.position] = mean_cr
+            self.position = (self.position + 1) % len(self.m_f)
+
+
+class DEA(EvolutionaryComputation):
+    """Evolutionary computation representing a differential evolutionary algorithm.
+
+    This class represents a differential evolutionary algorithm which runs
+    one of the PyGMO strategies, or one of the self-adaptive strategies
+    JADE and SHADE, selected through the ``strategy`` attribute on top of
+    the shared initialization, archival and observation steps of
+    ``EvolutionaryComputation``. It is expected that each candidate
+    solution is a ``Sequence`` of real values.
+
+    The population is held in a target array and the mutants of a generation
+    are built in a trial array of the same shape. Both are allocated once;
+    after replacement the survivors are collected in the trial array and the
+    two arrays swap roles. The best individual is tracked incrementally from
+    the individuals that were replaced. The fraction of trials that replaced
+    their target is reported in the ``Success`` statistics column.
+
+    JADE and SHADE use the current-to-pbest/1/bin scheme with a F and CR
+    per individual, sampled around means that are learned from the
+    successful trials (starting from *mutation_rate* and *crossover_rate*).
+    Parents replaced by better trials go to an external archive, from
+    which the second difference vector may be drawn, and with
+    *min_pop_size* the population shrinks linearly with the evaluations
+    used, dropping the worst individuals. Their mean F and CR and the
+    population size are reported in the ``F``, ``CR`` and ``Pop Size``
+    statistics columns.
+
+    Mutants that leave the bounds are repaired by the bounder passed to
+    ``evolve`` (for ``Bounder``, according to its ``policy``).
+
+    The donor indices, crossover start points and crossover draws of a
+    generation are taken from the run's random streams (``streams``) in
+    one block each, so a run is reproducible from its seed.
+
+    Public Attributes:
+
+    - *strategy* -- the DE strategy, one of ``strategies`` or
+      ``adaptive_strategies``
+
+    Required keyword arguments in ``evolve`` args parameter:
+
+    - *crossover_rate* -- the crossover probability CR (the initial mean
+      of CR for JADE and SHADE)
+    - *mutation_rate* -- the differential weight F (the initial mean of F
+      for JADE and SHADE)
+
+    Optional keyword arguments in ``evolve`` args parameter (JADE and
+    SHADE only):
+
+    - *pbest_rate* -- the fraction of the best individuals from which the
+      pbest vector is chosen (default 0.1)
+    - *archive_rate* -- the size of the external archive relative to the
+      population size, 0 to disable it (default 1.0)
+    - *adaptation_rate* -- the learning rate of the JADE means (default 0.1)
+    - *memory_size* -- the number of SHADE means (default 6)
+    - *min_pop_size* -- the population size reached when *max_evaluations*
+      are used, at least 4; requires *max_evaluations* (default None,
+      constant population size)
+
+    """
+    strategies = ('DE/best/1/exp', 'DE/rand/1/exp', 'DE/rand-to-best/1/exp', 'DE/best/2/exp', 'DE/rand/2/exp',
+                  'DE/best/1/bin', 'DE/rand/1/bin', 'DE/rand-to-best/1/bin', 'DE/best/2/bin', 'DE/rand/2/bin')
+    adaptive_strategies = ('JADE', 'SHADE')
+
+    def __init__(self, random):
+        EvolutionaryComputation.__init__(self, random)
+        self.selector = selectors.tournament_selection
+        self.variator = [variators.heuristic_crossover, variators.gaussian_mutation]
+        self.replacer = replacers.steady_state_replacement
+        self.strategy = None
+
+    @property
+    def statistics_columns(self):
+        if self.strategy in self.adaptive_strategies:
+            return ('Success', 'F', 'CR', 'Pop Size')
+        return ('Success',)
+
+    def _mutate(self, target, best, donors, m_f, out, scratch):
+        """Write the mutant vectors of the generation into *out*."""
+        _, base, num_diffs, _ = self.strategy.split('/')
+        take = lambda k, buf: np.take(target, donors[:, k], axis=0, out=buf)
+        if base == 'rand-to-best':
+            # x_i + F*(best - x_i) + F*(x_r1 - x_r2)
+            take(0, out)
+            out -= take(1, scratch)
+            np.subtract(best, target, out=scratch)
+            out += scratch
+            out *= m_f
+            out += target
+        elif num_diffs == '1':
+            # base + F*(x_r2 - x_r3)
+            take(1, out)
+            out -= take(2, scratch)
+            out *= m_f
+            out += best if base == 'best' else take(0, scratch)
+        else:
+            # base + F*(x_r1 + x_r2 - x_r3 - x_r4)
+            take(0, out)
+            out += take(1, scratch)
+            out -= take(2, scratch)
+            out -= take(3, scratch)
+            out *= m_f
+            out += best if base == 'best' else take(4, scratch)
+
+    def _crossover_mask(self, starts, draws, m_cr, offset, keep):
+        """Write into *keep* which genes of the targets the trials keep."""
+        num_genes = keep.shape[1]
+        if not self.strategy.endswith('/exp'):
+            # each gene from the mutant with probability CR, the one at the
+            # start point always
+            np.greater_equal(draws, m_cr, out=keep)
+            keep[np.arange(len(keep)), starts] = False
+        else:
+            # a cyclic run of genes from the mutant beginning at the start
+            # point, extended while the draws do not exceed CR
+            np.less_equal(draws, m_cr, out=keep)
+            keep[:, -1] = False
+            np.logical_and.accumulate(keep, axis=1, out=keep)
+            run = keep.sum(axis=1) + 1
+            np.subtract(np.arange(num_genes), starts[:, None], out=offset)
+            np.mod(offset, num_genes, out=offset)
+            np.greater_equal(offset, run[:, None], out=keep)
+
+    def _pbest_donors(self, score, archive_size, pbest_rate):
+        """Return the pbest, r1 and r2 indices of the current-to-pbest mutation.
+
+        r2 indices from ``n`` on refer to the archive.
+
+        """
+        n = len(score)
+        rng = self.streams.generator
+        top = np.argsort(-score, kind='mergesort')[:max(2, int(round(pbest_rate * n)))]
+        pbest = top[rng.integers(0, len(top), n)]
+        # any index but the row's own
+        r1 = (np.arange(n) + rng.integers(1, n, n)) % n
+        r2 = rng.integers(0, n + archive_size, n)
+        rows = np.arange(n)
+        bad = (r2 == rows) | (r2 == r1)
+        while bad.any():
+            r2[bad] = rng.integers(0, n + archive_size, int(bad.sum()))
+            bad = (r2 == rows) | (r2 == r1)
+        return pbest, r1, r2
+
+    def _mutate_pbest(self, target, archive, donors, m_f, out, scratch):
+        """Write the current-to-pbest/1 mutants into *out*.
+
+        x_i + F_i*(x_pbest - x_i) + F_i*(x_r1 - x_r2), with x_r2 taken from
+        the population or the archive.
+
+        """
+        pbest, r1, r2 = donors
+        n = len(target)
+        np.take(target, pbest, axis=0, out=out)
+        out -= target
+        out += np.take(target, r1, axis=0, out=scratch)
+        np.take(target, np.minimum(r2, n - 1), axis=0, out=scratch)
+        in_archive = r2 >= n
+        if in_archive.any():
+            scratch[in_archive] = archive[r2[in_archive] - n]
+        out -= scratch
+        out *= m_f
+        out += target
+
+    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
+        """Perform the evolution using the selected DE strategy.
+
+        The arguments are the same as for ``EvolutionaryComputation.evolve``.
+
+        """
+        adaptive = self.strategy in self.adaptive_strategies
+        if self.strategy not in self.strategies and not adaptive:
+            raise ValueError('unknown DE strategy {0}'.format(self.strategy))
+        if adaptive and args.get('min_pop_size') is not None and 'max_evaluations' not in args:
+            raise ValueError('min_pop_size needs max_evaluations to schedule the population reduction')
+        args.setdefault('num_selected', 2)
+        self._initialize(generator, evaluator, pop_size, seeds, maximize, bounder, args)
+
+        m_f = float(self._kwargs['mutation_rate'])
+        m_cr = float(self._kwargs['crossover_rate'])
+
+        # buffers of the whole run
+        target = np.array([ind.candidate for ind in self.population], dtype=float)
+        NP, D = target.shape
+        trial = np.empty_like(target)
+        scratch = np.empty_like(target)
+        keep = np.empty(target.shape, dtype=bool)
+        offset = np.empty(target.shape, dtype=int)
+        kept = np.empty(NP, dtype=bool)
+        score = custom_replacer.fitness_scores(self.population, self.maximize)
+        best = int(np.argmax(score))
+
+        if adaptive:
+            if self.strategy == 'JADE':
+                history = _SuccessHistory(m_f, m_cr, learning_rate=self._kwargs.setdefault('adaptation_rate', 0.1))
+            else:
+                history = _SuccessHistory(m_f, m_cr, size=self._kwargs.setdefault('memory_size', 6))
+            pbest_rate = self._kwargs.setdefault('pbest_rate', 0.1)
+            archive_rate = self._kwargs.setdefault('archive_rate', 1.0)
+            min_pop_size = self._kwargs.setdefault('min_pop_size', None)
+            initial_size = NP
+            archive = np.empty((int(round(archive_rate * NP)), D))
+            archive_size = 0
+            statistics = self._kwargs['_statistics']
+
+        while not self._should_terminate(list(self.population), self.num_generations, self.num_evaluations):
+            start = time.time()
+
+            # the random numbers of the generation, drawn in one block each
+            starts = self.streams.integers(D, NP)
+            draws = self.streams.uniform((NP, D))
+
+            x, u, s = target[:NP], trial[:NP], scratch[:NP]
+            if adaptive:
+                m_f, m_cr = history.sample(self.streams.generator, NP)
+                donors = self._pbest_donors(score[:NP], archive_size, pbest_rate)
+                self._mutate_pbest(x, archive, donors, m_f[:, None], u, s)
+                self._crossover_mask(starts, draws, m_cr[:, None], offset[:NP], keep[:NP])
+            else:
+                donors = self.streams.distinct_indices(NP, 5)
+                self._mutate(x, x[best], donors, m_f, u, s)
+                self._crossover_mask(starts, draws, m_cr, offset[:NP], keep[:NP])
+            np.copyto(u, x, where=keep[:NP])
+
+            # bound all trials in one call, the boundary policy is the bounder's
+            offspring_cs = bound_candidates(self.bounder, u, self._kwargs, parents=x)
+            u[...] = offspring_cs
+
+            if self._events:
+                self._event('variation', start, offspring=NP, strategy=self.strategy)
+            offspring = self._evaluate(offspring_cs, exclude_none=False)
+
+            # Replace individuals.
+            if self._debug:
+                self.logger.debug('replacement using {0} at generation {1} and evaluation {2}'.format(custom_replacer.dea_replacer.__name__, self.num_generations, self.num_evaluations))
+            start = time.time()
+            survivors = custom_replacer.dea_replacer(random=self._random, population=self.population, parents=self.population, offspring=offspring, maximize=self.maximize, args=self._kwargs)
+            replaced = self._kwargs['_success']
+            self.population = survivors
+
+            if replaced.any():
+                index = np.flatnonzero(replaced)
+                new_score = custom_replacer.fitness_scores([offspring[i] for i in index], self.maximize)
+                if adaptive:
+                    # learn from, and archive the parents of, the strictly better trials
+                    improvement = new_score - score[index]
+                    better = improvement > 0
+                    history.update(m_f[index[better]], m_cr[index[better]], improvement[better])
+                    archive_size = self._add_to_archive(archive, archive_size, int(round(archive_rate * NP)), x[index[better]])
+                score[index] = new_score
+                if replaced[best]:
+                    best = int(np.argmax(score[:NP]))
+                else:
+                    j = index[np.argmax(new_score)]
+                    if score[j] > score[best]:
+                        best = int(j)
+
+            # collect the survivors in the trial buffer and swap the buffers
+            np.logical_not(replaced, out=kept[:NP])
+            np.copyto(u, x, where=kept[:NP, None])
+            target, trial = trial, target
+
+            if adaptive:
+                if min_pop_size is not None:
+                    NP, best, archive_size = self._reduce_population(target, score, archive, archive_size, NP, initial_size, min_pop_size, archive_rate)
+                statistics['F'] = float(history.m_f.mean())
+                statistics['CR'] = float(history.m_cr.mean())
+                statistics['Pop Size'] = NP
+
+            if self._events:
+                self._event('replacement', start, population=len(self.population), replaced=int(replaced.sum()))
+            if self._debug:
+                self.logger.debug('population size is now {0}'.format(len(self.population)))
+
+            # Archive individuals.
+            self._archive()
+
+            self.num_generations += 1
+            self._observe()
+        return self.population
+
+    def _add_to_archive(self, archive, archive_size, capacity, rows):
+        """Add *rows* to the external archive and return its new size.
+
+        Once the archive holds *capacity* entries, randomly chosen entries
+        are overwritten.
+
+        """
+        if capacity == 0 or len(rows) == 0:
+            return archive_size
+        free = min(capacity - archive_size, len(rows))
+        archive[archive_size:archive_size + free] = rows[:free]
+        archive_size += free
+        if free < len(rows):
+            victims = self.streams.generator.integers(0, capacity, len(rows) - free)
+            archive[victims] = rows[free:]
+        return archive_size
+
+    def _reduce_population(self, target, score, archive, archive_size, NP, initial_size, min_pop_size, archive_rate):
+        """Shrink the population linearly with the evaluations used.
+
+        The worst individuals are dropped and the archive is cut to the
+        new size. Returns the new population size, the index of the best
+        individual and the new archive size.
+
+        """
+        max_evaluations = self._kwargs['max_evaluations']
+        size = int(round(initial_size + (min_pop_size - initial_size) * float(self.num_evaluations) / max_evaluations))
+        size = max(size, min_pop_size)
+        if size < NP:
+            survivors = np.sort(np.argsort(-score[:NP], kind='mergesort')[:size])
+            target[:size] = target[survivors]
+            score[:size] = score[survivors]
+            self.population = [self.population[i] for i in survivors]
+            NP = size
+            capacity = int(round(archive_rate * NP))
+            if archive_size > capacity:
+                archive[:capacity] = archive[np.sort(self.streams.generator.permutation(archive_size)[:capacity])]
+                archive_size = capacity
+        return NP, int(np.argmax(score[:NP])), archive_size
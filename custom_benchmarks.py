@@ -7,6 +7,7 @@ import random
 import math
 from collections import defaultdict
 import csv
+import custom_ec
 
 path = os.getcwd()
 
@@ -36,6 +37,8 @@ class Benchmark(object):
     - *bounder* -- the bounding function for the problem (default None)
     - *maximize* -- whether the problem is one of maximization (default
       True)
+    - *optimum_value* -- the optimum output of the problem, if known
+      (default None)
 
     """
     def __init__(self, dimensions, objectives=1, maximize = True):
@@ -43,6 +46,7 @@ class Benchmark(object):
         self.objectives = objectives
         self.bounder = None
         self.maximize = maximize
+        self.optimum_value = None
 
     def __str__(self):
         if self.objectives > 1:
@@ -74,17 +78,22 @@ class StyblinskiTang(Benchmark):
 
         f(x) = 1/2 \sum_{i=1}^{d} (x_i^4 - 16x_i^2 + 5x_i)
 
+    The candidates are normalized to [0, 1] and *policy* selects how the
+    bounder repairs values outside that range (see ``custom_ec.Bounder``).
+
     Public Attributes:
 
     - *global_optimum* -- the problem input that produces the optimum output.
-      Here, this corresponds to [0, 0, ..., 0].
+      Here, this corresponds to x_i = -2.903534, i.e. 0.2096466 normalized.
+    - *optimum_value* -- the optimum output, -39.16617 * dimensions
 
     """
-    def __init__(self, dimensions=2,maximize=False):
+    def __init__(self, dimensions=2,maximize=False,policy='clip'):
         Benchmark.__init__(self, dimensions)
-        self.bounder = inspyred.ec.Bounder([0] * self.dimensions, [1] * self.dimensions)
+        self.bounder = custom_ec.Bounder([0] * self.dimensions, [1] * self.dimensions, policy)
         self.maximize = maximize
-        self.global_optimum = [2.903 for _ in range(self.dimensions)]
+        self.global_optimum = [(-2.903534 + 5) / 10.0 for _ in range(self.dimensions)]
+        self.optimum_value = -39.16616570377142 * self.dimensions
         self.candidates = []
 
     def generator(self, random, args):
@@ -1,755 +1,1260 @@
-"""
-    ===============================================
-    :mod:`ec` -- Evolutionary computation framework
-    ===============================================
-    
-    This module provides the framework for creating evolutionary computations.
-    
-    .. Copyright 2012 Inspired Intelligence Initiative
-
-    .. This program is free software: you can redistribute it and/or modify
-       it under the terms of the GNU General Public License as published by
-       the Free Software Foundation, either version 3 of the License, or
-       (at your option) any later version.
-
-    .. This program is distributed in the hope that it will be useful,
-       but WITHOUT ANY WARRANTY; without even the implied warranty of
-       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-       GNU General Public License for more details.
-
-    .. You should have received a copy of the GNU General Public License
-       along with this program.  If not, see <http://www.gnu.org/licenses/>.
-       
-    .. module:: ec
-    .. moduleauthor:: Aaron Garrett <aaron.lee.garrett@gmail.com>
-"""
-import collections
-import copy
-import functools
-from inspyred.ec import archivers
-from inspyred.ec import generators
-from inspyred.ec import migrators
-from inspyred.ec import observers
-from inspyred.ec import replacers
-from inspyred.ec import selectors
-from inspyred.ec import terminators
-from inspyred.ec import variators
-import itertools
-import logging
-import math
-import time
-
-
-class Error(Exception):
-    """An empty base exception."""
-    pass
-
-
-class EvolutionExit(Error):
-    """An exception that may be raised and caught to end the evolution.
-    
-    This is an empty exception class that can be raised by the user
-    at any point in the code and caught outside of the ``evolve``
-    method. 
-    
-    .. note::
-    
-       Be aware that ending the evolution in such a way will almost 
-       certainly produce an erroneous population (e.g., not all 
-       individuals will have been reevaluated, etc.). However, this 
-       approach can be viable if solutions have been archived such 
-       that the current population is not of critical importance.
-    
-    """
-    pass
-
-
-class Bounder(object):
-    """Defines a basic bounding function for numeric lists.
-    
-    This callable class acts as a function that bounds a 
-    numeric list between the lower and upper bounds specified.
-    These bounds can be single values or lists of values. For
-    instance, if the candidate is composed of five values, each
-    of which should be bounded between 0 and 1, you can say
-    ``Bounder([0, 0, 0, 0, 0], [1, 1, 1, 1, 1])`` or just
-    ``Bounder(0, 1)``. If either the ``lower_bound`` or 
-    ``upper_bound`` argument is ``None``, the Bounder leaves 
-    the candidate unchanged (which is the default behavior).
-    
-    As an example, if the bounder above were used on the candidate 
-    ``[0.2, -0.1, 0.76, 1.3, 0.4]``, the resulting bounded
-    candidate would be ``[0.2, 0, 0.76, 1, 0.4]``.
-    
-    A bounding function is necessary to ensure that all 
-    evolutionary operators respect the legal bounds for 
-    candidates. If the user is using only custom operators
-    (which would be aware of the problem constraints), then 
-    those can obviously be tailored to enforce the bounds
-    on the candidates themselves. But the built-in operators
-    make only minimal assumptions about the candidate solutions.
-    Therefore, they must rely on an external bounding function
-    that can be user-specified (so as to contain problem-specific
-    information). 
-    
-    In general, a user-specified bounding function must accept
-    two arguments: the candidate to be bounded and the keyword
-    argument dictionary. Typically, the signature of such a 
-    function would be the following::
-    
-        bounded_candidate = bounding_function(candidate, args)
-        
-    This function should return the resulting candidate after 
-    bounding has been performed.
-    
-    Public Attributes:
-    
-    - *lower_bound* -- the lower bound for a candidate
-    - *upper_bound* -- the upper bound for a candidate
-    
-    """
-    def __init__(self, lower_bound=None, upper_bound=None):
-        self.lower_bound = lower_bound
-        self.upper_bound = upper_bound
-        if self.lower_bound is not None and self.upper_bound is not None:
-            if not isinstance(self.lower_bound, collections.Iterable):
-                self.lower_bound = itertools.repeat(self.lower_bound)
-            if not isinstance(self.upper_bound, collections.Iterable):
-                self.upper_bound = itertools.repeat(self.upper_bound)
-
-    def __call__(self, candidate, args):
-        # The default would be to leave the candidate alone
-        # unless both bounds are specified.
-        if self.lower_bound is None or self.upper_bound is None:
-            return candidate
-        else:
-            if not isinstance(self.lower_bound, collections.Iterable):
-                self.lower_bound = [self.lower_bound] * len(candidate)
-            if not isinstance(self.upper_bound, collections.Iterable):
-                self.upper_bound = [self.upper_bound] * len(candidate)
-            bounded_candidate = candidate
-            for i, (c, lo, hi) in enumerate(zip(candidate, self.lower_bound, 
-                                                self.upper_bound)):
-                bounded_candidate[i] = max(min(c, hi), lo)
-            return bounded_candidate
-
-
-class DiscreteBounder(object):
-    """Defines a basic bounding function for numeric lists of discrete values.
-    
-    This callable class acts as a function that bounds a 
-    numeric list to a set of legitimate values. It does this by 
-    resolving a given candidate value to the nearest legitimate 
-    value that can be attained. In the event that a candidate value
-    is the same distance to multiple legitimate values, the legitimate
-    value appearing earliest in the list will be used.
-    
-    For instance, if ``[1, 4, 8, 16]`` was used as the *values* parameter,
-    then the candidate ``[6, 10, 13, 3, 4, 0, 1, 12, 2]`` would be 
-    bounded to ``[4, 8, 16, 4, 4, 1, 1, 8, 1]``.
-    
-    Public Attributes:
-    
-    - *values* -- the set of attainable values
-    - *lower_bound* -- the smallest attainable value
-    - *upper_bound* -- the largest attainable value
-    
-    """
-    def __init__(self, values):
-        self.values = values
-        self.lower_bound = itertools.repeat(min(self.values))
-        self.upper_bound = itertools.repeat(max(self.values))
-
-    def __call__(self, candidate, args):
-        if not isinstance(self.lower_bound, collections.Iterable):
-            self.lower_bound = [min(self.values)] * len(candidate)
-        if not isinstance(self.upper_bound, collections.Iterable):
-            self.upper_bound = [max(self.values)] * len(candidate)
-        closest = lambda target: min(self.values, key=lambda x: abs(x-target))
-        bounded_candidate = candidate
-        for i, c in enumerate(bounded_candidate):
-            bounded_candidate[i] = closest(c)
-        return bounded_candidate
-
-
-class Individual(object):
-    """Represents an individual in an evolutionary computation.
-    
-    An individual is defined by its candidate solution and the
-    fitness (or value) of that candidate solution. Individuals
-    can be compared with one another by using <, <=, >, and >=.
-    In all cases, such comparisons are made using the individuals'
-    fitness values. The ``maximize`` attribute is respected in all
-    cases, so it is better to think of, for example, < (less-than)
-    to really mean "worse than" and > (greater-than) to mean
-    "better than". For instance, if individuals a and b have fitness
-    values 2 and 4, respectively, and if ``maximize`` were ``True``,
-    then a < b would be true. If ``maximize`` were ``False``, then 
-    a < b would be false (because a is "better than" b in terms of
-    the fitness evaluation, since we're minimizing).
-    
-    .. note::
-    
-       ``Individual`` objects are almost always created by the EC, 
-       rather than the user. The ``evolve`` method of the EC also 
-       has a ``maximize`` argument, whose value is passed directly 
-       to all created individuals.
-    
-    Public Attributes:
-    
-    - *candidate* -- the candidate solution
-    - *fitness* -- the value of the candidate solution
-    - *birthdate* -- the system time at which the individual was created
-    - *maximize* -- Boolean value stating use of maximization
-    
-    """
-    def __init__(self, candidate=None, maximize=True):
-        self._candidate = candidate
-        self.fitness = None
-        self.birthdate = time.time()
-        self.maximize = maximize
-        self.responses = None
-    
-    @property
-    def candidate(self):
-        return self._candidate
-        
-    @candidate.setter
-    def candidate(self, value):
-        self._candidate = value
-        self.fitness = None
-        self.responses = None
-        
-    def __str__(self):
-        return '{0} : {1} {2}'.format(str(self.candidate), str(self.fitness), self.responses)
-        
-    def __repr__(self):
-        return '<Individual: candidate = {0}, fitness = {1}, birthdate = {2}>'.format(str(self.candidate), str(self.fitness), self.birthdate)
-        
-    def __lt__(self, other):
-        if self.fitness is not None and other.fitness is not None:
-            if self.maximize: 
-                return self.fitness < other.fitness
-            else:
-                return self.fitness > other.fitness
-        else:
-            raise Error('fitness cannot be None when comparing Individuals')
-
-    def __le__(self, other):
-        return self < other or not other < self
-            
-    def __gt__(self, other):
-        if self.fitness is not None and other.fitness is not None:
-            return other < self
-        else:
-            raise Error('fitness cannot be None when comparing Individuals')
-
-    def __ge__(self, other):
-        return other < self or not self < other
-        
-    def __eq__(self, other):
-        return ((self._candidate, self.fitness, self.maximize) == 
-                (other._candidate, other.fitness, other.maximize))
-                
-    def __ne__(self, other):
-        return not (self == other)
-        
-
-
-class EvolutionaryComputation(object):
-    """Represents a basic evolutionary computation.
-    
-    This class encapsulates the components of a generic evolutionary
-    computation. These components are the selection mechanism, the
-    variation operators, the replacement mechanism, the migration
-    scheme, the archival mechanism, the terminators, and the observers.
-    
-    The ``observer``, ``terminator``, and ``variator`` attributes may be
-    specified as lists of such operators. In the case of the ``observer``,
-    all elements of the list will be called in sequence during the 
-    observation phase. In the case of the ``terminator``, all elements of
-    the list will be combined via logical ``or`` and, thus, the evolution will 
-    terminate if any of the terminators return True. Finally, in the case
-    of the ``variator``, the elements of the list will be applied one
-    after another in pipeline fashion, where the output of one variator
-    is used as the input to the next.
-    
-    Public Attributes:
-    
-    - *selector* -- the selection operator (defaults to ``default_selection``)
-    - *variator* -- the (possibly list of) variation operator(s) (defaults to 
-      ``default_variation``)
-    - *replacer* -- the replacement operator (defaults to 
-      ``default_replacement``)
-    - *migrator* -- the migration operator (defaults to ``default_migration``)
-    - *archiver* -- the archival operator (defaults to ``default_archiver``)
-    - *observer* -- the (possibly list of) observer(s) (defaults to 
-      ``default_observer``)
-    - *terminator* -- the (possibly list of) terminator(s) (defaults to 
-      ``default_termination``)
-    - *logger* -- the logger to use (defaults to the logger 'inspyred.ec')
-    
-    The following attributes do not have legitimate values until after 
-    the ``evolve`` method executes:
-    
-    - *termination_cause* -- the name of the function causing 
-      ``evolve`` to terminate, in the event that multiple terminators are used
-    - *generator* -- the generator function passed to ``evolve``
-    - *evaluator* -- the evaluator function passed to ``evolve``
-    - *bounder* -- the bounding function passed to ``evolve``
-    - *maximize* -- Boolean stating use of maximization passed to ``evolve``
-    - *archive* -- the archive of individuals
-    - *population* -- the population of individuals
-    - *num_evaluations* -- the number of fitness evaluations used
-    - *num_generations* -- the number of generations processed
-    
-    Note that the attributes above are, in general, not intended to 
-    be modified by the user. (They are intended for the user to query
-    during or after the ``evolve`` method's execution.) However, 
-    there may be instances where it is necessary to modify them 
-    within other functions. This is possible to do, but it should be the 
-    exception, rather than the rule.
-    
-    If logging is desired, the following basic code segment can be 
-    used in the ``main`` or calling scope to accomplish that::
-    
-        import logging
-        logger = logging.getLogger('inspyred.ec')
-        logger.setLevel(logging.DEBUG)
-        file_handler = logging.FileHandler('inspyred.log', mode='w')
-        file_handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
-    Protected Attributes:
-    
-    - *_random* -- the random number generator object
-    - *_kwargs* -- the dictionary of keyword arguments initialized
-      from the *args* parameter in the *evolve* method
-    
-    """
-    def __init__(self, random):
-        self.selector = selectors.default_selection
-        self.variator = variators.default_variation
-        self.replacer = replacers.default_replacement
-        self.migrator = migrators.default_migration
-        self.observer = observers.default_observer
-        self.archiver = archivers.default_archiver
-        self.terminator = terminators.default_termination
-        self.termination_cause = None
-        self.generator = None
-        self.evaluator = None
-        self.bounder = None
-        self.maximize = True
-        self.archive = None
-        self.population = None
-        self.num_evaluations = 0
-        self.num_generations = 0
-        self.logger = logging.getLogger('inspyred.ec')
-        try:
-            self.logger.addHandler(logging.NullHandler())
-        except AttributeError:
-            # If Python < 2.7, then NullHandler doesn't exist.
-            pass
-        self._random = random
-        self._kwargs = dict()
-        
-    def _should_terminate(self, pop, ng, ne):
-        terminate = False
-        fname = ''
-        if isinstance(self.terminator, collections.Iterable):
-            for clause in self.terminator:
-                self.logger.debug('termination test using {0} at generation {1} and evaluation {2}'.format(clause.__name__, ng, ne))
-                terminate = terminate or clause(population=pop, num_generations=ng, num_evaluations=ne, args=self._kwargs)
-                if terminate:
-                    fname = clause.__name__
-                    break
-        else:
-            self.logger.debug('termination test using {0} at generation {1} and evaluation {2}'.format(self.terminator.__name__, ng, ne))
-            terminate = self.terminator(population=pop, num_generations=ng, num_evaluations=ne, args=self._kwargs)
-            fname = self.terminator.__name__
-        if terminate:
-            self.termination_cause = fname
-            self.logger.debug('termination from {0} at generation {1} and evaluation {2}'.format(self.termination_cause, ng, ne))
-        return terminate
-        
-    
-    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
-        """Perform the evolution.
-        
-        This function creates a population and then runs it through a series
-        of evolutionary epochs until the terminator is satisfied. The general
-        outline of an epoch is selection, variation, evaluation, replacement,
-        migration, archival, and observation. The function returns a list of
-        elements of type ``Individual`` representing the individuals contained
-        in the final population.
-        
-        Arguments:
-        
-        - *generator* -- the function to be used to generate candidate solutions 
-        - *evaluator* -- the function to be used to evaluate candidate solutions
-        - *pop_size* -- the number of Individuals in the population (default 100)
-        - *seeds* -- an iterable collection of candidate solutions to include
-          in the initial population (default None)
-        - *maximize* -- Boolean value stating use of maximization (default True)
-        - *bounder* -- a function used to bound candidate solutions (default None)
-        - *args* -- a dictionary of keyword arguments
-
-        The *bounder* parameter, if left as ``None``, will be initialized to a
-        default ``Bounder`` object that performs no bounding on candidates.
-        Note that the *_kwargs* class variable will be initialized to the *args* 
-        parameter here. It will also be modified to include the following 'built-in' 
-        keyword argument:
-        
-        - *_ec* -- the evolutionary computation (this object)
-        
-        """
-        self._kwargs = args
-        self._kwargs['_ec'] = self
-        
-        if seeds is None:
-            seeds = []
-        if bounder is None:
-            bounder = Bounder()
-        
-        self.termination_cause = None
-        self.generator = generator
-        self.evaluator = evaluator
-        self.bounder = bounder
-        self.maximize = maximize
-        self.population = []
-        self.archive = []
-        
-        # Create the initial population.
-        if not isinstance(seeds, collections.Sequence):
-            seeds = [seeds]
-        initial_cs = copy.copy(seeds)
-        num_generated = max(pop_size - len(seeds), 0)
-        i = 0
-        self.logger.debug('generating initial population')
-        while i < num_generated:
-            cs = generator(random=self._random, args=self._kwargs)
-            initial_cs.append(cs)
-            i += 1
-        self.logger.debug('evaluating initial population')
-        initial_fit, initial_res = evaluator(candidates=initial_cs, args=self._kwargs)
-
-        for cs, fit, res in zip(initial_cs, initial_fit, initial_res):
-            if fit is not None:
-                ind = Individual(cs, maximize=maximize)
-                ind.fitness = fit
-                ind.responses = res
-                self.population.append(ind)
-            else:
-                self.logger.warning('excluding candidate {0} because fitness received as None'.format(cs))
-        self.logger.debug('population size is now {0}'.format(len(self.population)))
-        
-        self.num_evaluations = len(initial_fit)
-        self.num_generations = 0
-        
-        self.logger.debug('archiving initial population')
-        self.archive = self.archiver(random=self._random, population=list(self.population), archive=list(self.archive), args=self._kwargs)
-        self.logger.debug('archive size is now {0}'.format(len(self.archive)))
-        self.logger.debug('population size is now {0}'.format(len(self.population)))
-                
-        if isinstance(self.observer, collections.Iterable):
-            for obs in self.observer:
-                self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(obs.__name__, self.num_generations, self.num_evaluations))
-                obs(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
-        else:
-            self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(self.observer.__name__, self.num_generations, self.num_evaluations))
-            self.observer(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
-        
-        while not self._should_terminate(list(self.population), self.num_generations, self.num_evaluations):
-            # Select individuals.
-            self.logger.debug('selection using {0} at generation {1} and evaluation {2}'.format(self.selector.__name__, self.num_generations, self.num_evaluations))
-            parents = self.selector(random=self._random, population=list(self.population), args=self._kwargs)
-            self.logger.debug('selected {0} candidates'.format(len(parents)))
-            parent_cs = [copy.deepcopy(i.candidate) for i in parents]
-            offspring_cs = parent_cs
-            
-            if isinstance(self.variator, collections.Iterable):
-                for op in self.variator:
-                    self.logger.debug('variation using {0} at generation {1} and evaluation {2}'.format(op.__name__, self.num_generations, self.num_evaluations))
-                    offspring_cs = op(random=self._random, candidates=offspring_cs, args=self._kwargs)
-            else:
-                self.logger.debug('variation using {0} at generation {1} and evaluation {2}'.format(self.variator.__name__, self.num_generations, self.num_evaluations))
-                offspring_cs = self.variator(random=self._random, candidates=offspring_cs, args=self._kwargs)
-            self.logger.debug('created {0} offspring'.format(len(offspring_cs)))
-            
-            # Evaluate offspring.
-            self.logger.debug('evaluation using {0} at generation {1} and evaluation {2}'.format(evaluator.__name__, self.num_generations, self.num_evaluations))
-            offspring_fit, offspring_res = evaluator(candidates=offspring_cs, args=self._kwargs)
-            offspring = []
-            for cs, fit, res in zip(offspring_cs, offspring_fit, offspring_res):
-                if fit is not None:
-                    off = Individual(cs, maximize=maximize)
-                    off.fitness = fit
-                    off.responses = res
-                    offspring.append(off)
-                else:
-                    self.logger.warning('excluding candidate {0} because fitness received as None'.format(cs))
-            self.num_evaluations += len(offspring_fit)        
-
-            # Replace individuals.
-            self.logger.debug('replacement using {0} at generation {1} and evaluation {2}'.format(self.replacer.__name__, self.num_generations, self.num_evaluations))
-            self.population = self.replacer(random=self._random, population=self.population, parents=parents, offspring=offspring, args=self._kwargs)
-            self.logger.debug('population size is now {0}'.format(len(self.population)))
-            
-            # Migrate individuals.
-            self.logger.debug('migration using {0} at generation {1} and evaluation {2}'.format(self.migrator.__name__, self.num_generations, self.num_evaluations))
-            self.population = self.migrator(random=self._random, population=self.population, args=self._kwargs)
-            self.logger.debug('population size is now {0}'.format(len(self.population)))
-            
-            # Archive individuals.
-            self.logger.debug('archival using {0} at generation {1} and evaluation {2}'.format(self.archiver.__name__, self.num_generations, self.num_evaluations))
-            self.archive = self.archiver(random=self._random, archive=self.archive, population=list(self.population), args=self._kwargs)
-            self.logger.debug('archive size is now {0}'.format(len(self.archive)))
-            self.logger.debug('population size is now {0}'.format(len(self.population)))
-            
-            self.num_generations += 1
-            if isinstance(self.observer, collections.Iterable):
-                for obs in self.observer:
-                    self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(obs.__name__, self.num_generations, self.num_evaluations))
-                    obs(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
-            else:
-                self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(self.observer.__name__, self.num_generations, self.num_evaluations))
-                self.observer(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
-        return self.population
-        
-
-class GA(EvolutionaryComputation):
-    """Evolutionary computation representing a canonical genetic algorithm.
-    
-    This class represents a genetic algorithm which uses, by 
-    default, rank selection, `n`-point crossover, bit-flip mutation, 
-    and generational replacement. In the case of bit-flip mutation, 
-    it is expected that each candidate solution is a ``Sequence`` 
-    of binary values. 
-    
-    Optional keyword arguments in ``evolve`` args parameter:
-    
-    - *num_selected* -- the number of individuals to be selected 
-      (default len(population))
-    - *crossover_rate* -- the rate at which crossover is performed 
-      (default 1.0)
-    - *num_crossover_points* -- the `n` crossover points used (default 1)
-    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
-    - *num_elites* -- number of elites to consider (default 0)
-    
-    """
-    def __init__(self, random):
-        EvolutionaryComputation.__init__(self, random)
-        self.selector = selectors.rank_selection 
-        self.variator = [variators.n_point_crossover, variators.bit_flip_mutation]
-        self.replacer = replacers.generational_replacement
-        
-    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
-        args.setdefault('num_selected', pop_size)
-        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
-
-
-class ES(EvolutionaryComputation):
-    """Evolutionary computation representing a canonical evolution strategy.
-    
-    This class represents an evolution strategy which uses, by 
-    default, the default selection (i.e., all individuals are selected), 
-    an internal adaptive mutation using strategy parameters, and 'plus' 
-    replacement. It is expected that each candidate solution is a ``Sequence``
-    of real values. 
-    
-    The candidate solutions to an ES are augmented by strategy parameters of
-    the same length (using ``inspyred.ec.generators.strategize``). These 
-    strategy parameters are evolved along with the candidates and are used as
-    the mutation rates for each element of the candidates. The evaluator is
-    modified internally to use only the actual candidate elements (rather than
-    also the strategy parameters), so normal evaluator functions may be used
-    seamlessly.
-
-    Optional keyword arguments in ``evolve`` args parameter:
-    
-    - *tau* -- a proportionality constant (default None)
-    - *tau_prime* -- a proportionality constant (default None)
-    - *epsilon* -- the minimum allowed strategy parameter (default 0.00001)
-    
-    If *tau* is ``None``, it will be set to ``1 / sqrt(2 * sqrt(n))``, where
-    ``n`` is the length of a candidate. If *tau_prime* is ``None``, it will be
-    set to ``1 / sqrt(2 * n)``. The strategy parameters are updated as follows:
-    
-    .. math::
-    
-        \\sigma_i^\\prime = \\sigma_i + e^{\\tau \\cdot N(0, 1) + \\tau^\prime \\cdot N(0, 1)}
-        
-        \\sigma_i^\\prime = max(\\sigma_i^\\prime, \\epsilon)
-    
-    """
-    def __init__(self, random):
-        EvolutionaryComputation.__init__(self, random)
-        self.selector = selectors.default_selection
-        self.variator = self._internal_variation
-        self.replacer = replacers.plus_replacement
-        
-    def _internal_variation(self, random, candidates, args):
-        tau = args.setdefault('tau', None)
-        tau_prime = args.setdefault('tau_prime', None)
-        epsilon = args.setdefault('epsilon', 0.00001)
-        mutants = []
-        n = len(candidates[0]) // 2
-        if tau is None:
-            tau = 1 / math.sqrt(2 * math.sqrt(n))
-        if tau_prime is None:
-            tau_prime = 1 / math.sqrt(2 * n) 
-        for candidate in candidates:
-            cand = candidate[:n]
-            strat = candidate[n:]
-            for i, s in enumerate(strat):
-                strat[i] = s + math.exp(tau_prime * random.gauss(0, 1) + tau * random.gauss(0, 1))
-                strat[i] = max(strat[i], epsilon)
-            for i, (c, s) in enumerate(zip(cand, strat)):
-                cand[i] = c + random.gauss(0, s)
-            cand = self.bounder(cand, args)
-            cand.extend(strat)
-            mutants.append(cand)
-        return mutants
-        
-    def _internal_evaluator(self, func):
-        @functools.wraps(func)
-        def evaluator(candidates, args):
-            cands = []
-            for candidate in candidates:
-                n = len(candidate) // 2
-                cands.append(candidate[:n])
-            return func(cands, args)
-        return evaluator
-    
-    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
-        generator = generators.strategize(generator)
-        evaluator = self._internal_evaluator(evaluator)
-        # Strategize any seeds that are passed.
-        strategy_seeds = None
-        if seeds is not None:
-            strategy_seeds = []
-            for candidate in seeds:
-                n = len(candidate)
-                c = copy.copy(candidate)
-                c.extend([self._random.random() for _ in range(n)])
-                strategy_seeds.append(c)
-        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, strategy_seeds, maximize, bounder, **args)
-    
-
-class EDA(EvolutionaryComputation):
-    """Evolutionary computation representing a canonical estimation of distribution algorithm.
-    
-    This class represents an estimation of distribution algorithm which
-    uses, by default, truncation selection, an internal estimation of 
-    distribution variation, and generational replacement. It is expected 
-    that each candidate solution is a ``Sequence`` of real values. 
-    
-    The variation used here creates a statistical model based on the set 
-    of candidates. The offspring are then generated from this model. This 
-    function also makes use of the bounder function as specified in the EC's 
-    ``evolve`` method.
-
-    Optional keyword arguments in ``evolve`` args parameter:
-    
-    - *num_selected* -- the number of individuals to be selected 
-      (default len(population)/2)
-    - *num_offspring* -- the number of offspring to create (default len(population))
-    - *num_elites* -- number of elites to consider (default 0)
-    
-    """
-    def __init__(self, random):
-        EvolutionaryComputation.__init__(self, random)
-        self.selector = selectors.truncation_selection
-        self.variator = self._internal_variation
-        self.replacer = replacers.generational_replacement
-        
-    def _internal_variation(self, random, candidates, args):
-        num_offspring = args.setdefault('num_offspring', 1)
-        bounder = args['_ec'].bounder        
-        num_genes = max([len(x) for x in candidates])
-        genes = [[x[i] for x in candidates] for i in range(num_genes)] 
-        mean = [float(sum(x)) / float(len(x)) for x in genes]
-        stdev = [sum([(x - m)**2 for x in g]) / float(len(g) - 1) for g, m in zip(genes, mean)]
-        offspring = []
-        for _ in range(num_offspring):
-            child = copy.copy(candidates[0])
-            for i, (m, s) in enumerate(zip(mean, stdev)):
-                child[i] = m + random.gauss(0, s)
-            child = bounder(child, args)
-            offspring.append(child)
-        return offspring
-        
-    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
-        args.setdefault('num_selected', pop_size // 2)
-        args.setdefault('num_offspring', pop_size)
-        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
-
-
-class DEA(EvolutionaryComputation):
-    """Evolutionary computation representing a differential evolutionary algorithm.
-    
-    This class represents a differential evolutionary algorithm which uses, by 
-    default, tournament selection, heuristic crossover, Gaussian mutation,
-    and steady-state replacement. It is expected that each candidate solution 
-    is a ``Sequence`` of real values. 
-    
-    Optional keyword arguments in ``evolve`` args parameter:
-    
-    - *num_selected* -- the number of individuals to be selected (default 2)
-    - *tournament_size* -- the tournament size (default 2)
-    - *crossover_rate* -- the rate at which crossover is performed 
-      (default 1.0)
-    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
-    - *gaussian_mean* -- the mean used in the Gaussian function (default 0)
-    - *gaussian_stdev* -- the standard deviation used in the Gaussian function
-      (default 1)
-
-    """
-    def __init__(self, random):
-        EvolutionaryComputation.__init__(self, random)
-        self.selector = selectors.tournament_selection
-        self.variator = [variators.heuristic_crossover, variators.gaussian_mutation]
-        self.replacer = replacers.steady_state_replacement
-        
-    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
-        args.setdefault('num_selected', 2)
-        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
-
-
-class SA(EvolutionaryComputation):
-    """Evolutionary computation representing simulated annealing.
-    
-    This class represents a simulated annealing algorithm. It accomplishes this
-    by using default selection (i.e., all individuals are parents), Gaussian
-    mutation, and simulated annealing replacement. It is expected that each
-    candidate solution is a ``Sequence`` of real values. Consult the
-    documentation for the ``simulated_annealing_replacement`` for more
-    details on the keyword arguments listed below. 
-    
-    .. note::
-    
-       The ``pop_size`` parameter to ``evolve`` will always be set to 1, 
-       even if a different value is passed.
-    
-    Optional keyword arguments in ``evolve`` args parameter:
-    
-    - *temperature* -- the initial temperature
-    - *cooling_rate* -- a real-valued coefficient in the range (0, 1) 
-      by which the temperature should be reduced     
-    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
-    - *gaussian_mean* -- the mean used in the Gaussian function (default 0)
-    - *gaussian_stdev* -- the standard deviation used in the Gaussian function
-      (default 1)
-      
-    """
-    def __init__(self, random):
-        EvolutionaryComputation.__init__(self, random)
-        self.selector = selectors.default_selection
-        self.variator = variators.gaussian_mutation
-        self.replacer = replacers.simulated_annealing_replacement
-    
-    def evolve(self, generator, evaluator, pop_size=1, seeds=None, maximize=True, bounder=None, **args):
-        pop_size = 1
-        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
+"""
+    ===============================================
+    :mod:`ec` -- Evolutionary computation framework
+    ===============================================
+    
+    This module provides the framework for creating evolutionary computations.
+    
+    .. Copyright 2012 Inspired Intelligence Initiative
+
+    .. This program is free software: you can redistribute it and/or modify
+       it under the terms of the GNU General Public License as published by
+       the Free Software Foundation, either version 3 of the License, or
+       (at your option) any later version.
+
+    .. This program is distributed in the hope that it will be useful,
+       but WITHOUT ANY WARRANTY; without even the implied warranty of
+       MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+       GNU General Public License for more details.
+
+    .. You should have received a copy of the GNU General Public License
+       along with this program.  If not, see <http://www.gnu.org/licenses/>.
+       
+    .. module:: ec
+    .. moduleauthor:: Aaron Garrett <aaron.lee.garrett@gmail.com>
+
+    -- Adds responses tracking
+    -- Single generation-loop engine shared by GA_ec, DEA_ec and custom_swarm
+    -- Structured per-phase events on the 'inspyred.ec.events' logger
+    -- Array-capable Bounder with selectable boundary policies
+    -- CMA-ES engine with IPOP restarts
+    -- Multi-chain simulated annealing and parallel tempering
+"""
+import copy
+import functools
+from inspyred.ec import archivers
+from inspyred.ec import generators
+from inspyred.ec import migrators
+from inspyred.ec import observers
+from inspyred.ec import replacers
+from inspyred.ec import selectors
+from inspyred.ec import terminators
+from inspyred.ec import variators
+import itertools
+import logging
+import math
+import time
+import numpy as np
+from custom_random import make_generator
+from custom_random import np_random
+from custom_random import run_streams
+from custom_replacer import fitness_scores
+from custom_replacer import sa_replacement
+from custom_replacer import tempering_replacement
+from custom_terminators import control_termination
+from custom_terminators import open_control
+from collections import OrderedDict
+from collections import deque
+try:
+    from collections.abc import Iterable, Sequence
+except ImportError:
+    from collections import Iterable, Sequence
+
+
+def _pipeline(operators):
+    """Return a (possibly list of) operator(s) as a tuple of callables."""
+    if isinstance(operators, Iterable):
+        return tuple(operators)
+    return (operators,)
+
+
+class Error(Exception):
+    """An empty base exception."""
+    pass
+
+
+class EvolutionExit(Error):
+    """An exception that may be raised and caught to end the evolution.
+    
+    This is an empty exception class that can be raised by the user
+    at any point in the code and caught outside of the ``evolve``
+    method. 
+    
+    .. note::
+    
+       Be aware that ending the evolution in such a way will almost 
+       certainly produce an erroneous population (e.g., not all 
+       individuals will have been reevaluated, etc.). However, this 
+       approach can be viable if solutions have been archived such 
+       that the current population is not of critical importance.
+    
+    """
+    pass
+
+
+class Bounder(object):
+    """Defines a basic bounding function for numeric lists.
+    
+    This callable class acts as a function that bounds a 
+    numeric list between the lower and upper bounds specified.
+    These bounds can be single values or lists of values. For
+    instance, if the candidate is composed of five values, each
+    of which should be bounded between 0 and 1, you can say
+    ``Bounder([0, 0, 0, 0, 0], [1, 1, 1, 1, 1])`` or just
+    ``Bounder(0, 1)``. If either the ``lower_bound`` or 
+    ``upper_bound`` argument is ``None``, the Bounder leaves 
+    the candidate unchanged (which is the default behavior).
+    
+    As an example, if the bounder above were used on the candidate 
+    ``[0.2, -0.1, 0.76, 1.3, 0.4]``, the resulting bounded
+    candidate would be ``[0.2, 0, 0.76, 1, 0.4]``.
+    
+    A bounding function is necessary to ensure that all 
+    evolutionary operators respect the legal bounds for 
+    candidates. If the user is using only custom operators
+    (which would be aware of the problem constraints), then 
+    those can obviously be tailored to enforce the bounds
+    on the candidates themselves. But the built-in operators
+    make only minimal assumptions about the candidate solutions.
+    Therefore, they must rely on an external bounding function
+    that can be user-specified (so as to contain problem-specific
+    information). 
+    
+    In general, a user-specified bounding function must accept
+    two arguments: the candidate to be bounded and the keyword
+    argument dictionary. Typically, the signature of such a 
+    function would be the following::
+    
+        bounded_candidate = bounding_function(candidate, args)
+        
+    This function should return the resulting candidate after 
+    bounding has been performed.
+    
+    Values outside the bounds are handled according to the *policy*:
+    
+    - ``'clip'`` -- set to the violated bound (the default)
+    - ``'reflect'`` -- mirrored back into the range at the violated bound
+    - ``'wrap'`` -- wrapped around to the other side of the range
+    - ``'random'`` -- replaced by a value drawn uniformly within the bounds
+    - ``'midpoint'`` -- set halfway between the parent's value and the
+      violated bound (clipping if no parents are given)
+    
+    Besides the single-candidate call, ``bound`` bounds a whole matrix of
+    candidates (one per row) with a few NumPy operations, which is how
+    the DE, GA and PSO engines use it.
+    
+    Public Attributes:
+    
+    - *lower_bound* -- the lower bound for a candidate
+    - *upper_bound* -- the upper bound for a candidate
+    - *policy* -- the boundary policy (default 'clip')
+    
+    """
+    policies = ('clip', 'reflect', 'wrap', 'random', 'midpoint')
+
+    def __init__(self, lower_bound=None, upper_bound=None, policy='clip'):
+        if policy not in self.policies:
+            raise ValueError('unknown boundary policy {0}'.format(policy))
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.policy = policy
+        self._arrays = None
+        if self.lower_bound is not None and self.upper_bound is not None:
+            if not isinstance(self.lower_bound, Iterable):
+                self.lower_bound = itertools.repeat(self.lower_bound)
+            if not isinstance(self.upper_bound, Iterable):
+                self.upper_bound = itertools.repeat(self.upper_bound)
+
+    def bounds(self, num_genes):
+        """Return the lower and upper bounds as arrays of length *num_genes*.
+
+        Missing bounds are returned as minus and plus infinity.
+
+        """
+        if self._arrays is None or len(self._arrays[0]) != num_genes:
+            if self.lower_bound is None or self.upper_bound is None:
+                lower = np.full(num_genes, -np.inf)
+                upper = np.full(num_genes, np.inf)
+            else:
+                lower = np.array([lo for lo, _ in zip(self.lower_bound, range(num_genes))], dtype=float)
+                upper = np.array([hi for hi, _ in zip(self.upper_bound, range(num_genes))], dtype=float)
+            self._arrays = (lower, upper)
+        return self._arrays
+
+    def bound(self, candidates, args, parents=None):
+        """Return a bounded copy of a matrix of candidates, one per row.
+
+        .. Arguments:
+           candidates -- the candidates as a 2-D array or list of lists
+           args -- a dictionary of keyword arguments
+           parents -- the parent of each row, used by the 'midpoint'
+           policy (default None)
+
+        """
+        x = np.array(candidates, dtype=float)
+        if self.lower_bound is None or self.upper_bound is None or x.size == 0:
+            return x
+        lower, upper = self.bounds(x.shape[-1])
+        below = x < lower
+        above = x > upper
+        outside = below | above
+        if not outside.any():
+            return x
+        width = upper - lower
+        if self.policy == 'reflect':
+            y = np.mod(x - lower, 2 * width)
+            x = np.where(outside, lower + np.where(y > width, 2 * width - y, y), x)
+        elif self.policy == 'wrap':
+            x = np.where(outside, lower + np.mod(x - lower, width), x)
+        elif self.policy == 'random':
+            x = np.where(outside, lower + self._rng(args).random(x.shape) * width, x)
+        elif self.policy == 'midpoint' and parents is not None:
+            p = np.clip(np.asarray(parents, dtype=float), lower, upper)
+            x = np.where(below, (lower + p) / 2.0, np.where(above, (upper + p) / 2.0, x))
+        # 'clip', and the guard against rounding for the other policies
+        return np.clip(x, lower, upper)
+
+    def _rng(self, args):
+        try:
+            return np_random(args['_ec']._random, args)
+        except (KeyError, TypeError):
+            return make_generator(None)
+
+    def __call__(self, candidate, args):
+        # The default would be to leave the candidate alone
+        # unless both bounds are specified.
+        if self.lower_bound is None or self.upper_bound is None:
+            return candidate
+        elif isinstance(candidate, np.ndarray):
+            return self.bound(candidate, args)
+        else:
+            bounded_candidate = candidate
+            bounded_candidate[:] = self.bound([candidate], args)[0].tolist()
+            return bounded_candidate
+
+
+def bound_candidates(bounder, candidates, args, parents=None):
+    """Bound a list of candidates and return them as a list of lists.
+
+    Bounders that provide ``bound`` (such as ``Bounder``) bound all
+    candidates in one call; any other bounding function is applied to each
+    candidate in turn.
+
+    .. Arguments:
+       bounder -- the bounding function
+       candidates -- the candidates as a 2-D array or list of lists
+       args -- a dictionary of keyword arguments
+       parents -- the parent of each candidate (default None)
+
+    """
+    if hasattr(bounder, 'bound'):
+        return bounder.bound(candidates, args, parents).tolist()
+    return [bounder(list(c), args) for c in np.asarray(candidates, dtype=float).tolist()]
+
+
+class DiscreteBounder(object):
+    """Defines a basic bounding function for numeric lists of discrete values.
+    
+    This callable class acts as a function that bounds a 
+    numeric list to a set of legitimate values. It does this by 
+    resolving a given candidate value to the nearest legitimate 
+    value that can be attained. In the event that a candidate value
+    is the same distance to two legitimate values, the smaller one
+    is used.
+    
+    For instance, if ``[1, 4, 8, 16]`` was used as the *values* parameter,
+    then the candidate ``[6, 10, 13, 3, 4, 0, 1, 12, 2]`` would be 
+    bounded to ``[4, 8, 16, 4, 4, 1, 1, 8, 1]``.
+    
+    For mixed-integer problems *values* may instead hold one set of
+    values per dimension. A dimension whose set is ``None`` is continuous;
+    its genes are clipped to *lower_bound* and *upper_bound* (single
+    values or lists) if these are given and left unchanged otherwise.
+    For instance, ``DiscreteBounder([[1, 2, 3], None, [0.5, 1.0]], 0, 10)``
+    snaps the first and last genes and clips the second to [0, 10].
+    
+    The sets are sorted once, and ``bound`` snaps a whole matrix of
+    candidates with a binary search (``numpy.searchsorted``) per
+    dimension, so the cost grows with the logarithm of the number of
+    values rather than linearly.
+    
+    Public Attributes:
+    
+    - *values* -- the set (or per-dimension sets) of attainable values
+    - *lower_bound* -- the smallest attainable value
+    - *upper_bound* -- the largest attainable value
+    
+    """
+    def __init__(self, values, lower_bound=None, upper_bound=None):
+        self.values = values
+        per_dimension = any(v is None or isinstance(v, Iterable) for v in values)
+        if per_dimension:
+            num_genes = len(values)
+            continuous_lower = np.broadcast_to(np.asarray(-np.inf if lower_bound is None else lower_bound, dtype=float), (num_genes,))
+            continuous_upper = np.broadcast_to(np.asarray(np.inf if upper_bound is None else upper_bound, dtype=float), (num_genes,))
+            self._sorted = [None if v is None else np.unique(np.asarray(v)) for v in values]
+            self.lower_bound = [float(continuous_lower[i]) if v is None else float(v[0]) for i, v in enumerate(self._sorted)]
+            self.upper_bound = [float(continuous_upper[i]) if v is None else float(v[-1]) for i, v in enumerate(self._sorted)]
+            # mixed value types are kept apart in an object matrix
+            self._dtype = float if all(v is None or v.dtype == float for v in self._sorted) else object
+        else:
+            self._sorted = np.unique(np.asarray(values))
+            self.lower_bound = itertools.repeat(float(self._sorted[0]))
+            self.upper_bound = itertools.repeat(float(self._sorted[-1]))
+            self._dtype = self._sorted.dtype
+        self._per_dimension = per_dimension
+
+    @staticmethod
+    def _snap(x, levels):
+        # the search runs on floats but the values are returned as given
+        if len(levels) == 1:
+            return np.full(x.shape, levels[0])
+        right = np.clip(np.searchsorted(levels, x), 1, len(levels) - 1)
+        below = levels[right - 1]
+        above = levels[right]
+        return np.where(above - x < x - below, above, below)
+
+    def bounds(self, num_genes):
+        """Return the lower and upper bounds as arrays of length *num_genes*."""
+        lower = np.array([lo for lo, _ in zip(self.lower_bound, range(num_genes))], dtype=float)
+        upper = np.array([hi for hi, _ in zip(self.upper_bound, range(num_genes))], dtype=float)
+        return lower, upper
+
+    def bound(self, candidates, args, parents=None):
+        """Return a copy of a matrix of candidates (one per row) snapped to the values.
+
+        The snapped genes hold the admissible values themselves, with their
+        type, e.g. integers for an integer grid.
+
+        """
+        x = np.array(candidates, dtype=float)
+        if x.size == 0:
+            return x
+        if not self._per_dimension:
+            return self._snap(x, self._sorted)
+        out = np.empty(x.shape, dtype=self._dtype)
+        for j, levels in enumerate(self._sorted):
+            if levels is None:
+                out[..., j] = np.clip(x[..., j], self.lower_bound[j], self.upper_bound[j])
+            else:
+                out[..., j] = self._snap(x[..., j], levels)
+        return out
+
+    def __call__(self, candidate, args):
+        if isinstance(candidate, np.ndarray):
+            return self.bound(candidate, args)
+        bounded_candidate = candidate
+        bounded_candidate[:] = self.bound([candidate], args)[0].tolist()
+        return bounded_candidate
+
+
+class Individual(object):
+    """Represents an individual in an evolutionary computation.
+    
+    An individual is defined by its candidate solution and the
+    fitness (or value) of that candidate solution. Individuals
+    can be compared with one another by using <, <=, >, and >=.
+    In all cases, such comparisons are made using the individuals'
+    fitness values. The ``maximize`` attribute is respected in all
+    cases, so it is better to think of, for example, < (less-than)
+    to really mean "worse than" and > (greater-than) to mean
+    "better than". For instance, if individuals a and b have fitness
+    values 2 and 4, respectively, and if ``maximize`` were ``True``,
+    then a < b would be true. If ``maximize`` were ``False``, then 
+    a < b would be false (because a is "better than" b in terms of
+    the fitness evaluation, since we're minimizing).
+    
+    .. note::
+    
+       ``Individual`` objects are almost always created by the EC, 
+       rather than the user. The ``evolve`` method of the EC also 
+       has a ``maximize`` argument, whose value is passed directly 
+       to all created individuals.
+    
+    Public Attributes:
+    
+    - *candidate* -- the candidate solution
+    - *fitness* -- the value of the candidate solution
+    - *birthdate* -- the system time at which the individual was created
+    - *maximize* -- Boolean value stating use of maximization
+    
+    """
+    def __init__(self, candidate=None, maximize=True):
+        self._candidate = candidate
+        self.fitness = None
+        self.birthdate = time.time()
+        self.maximize = maximize
+        self.responses = None
+    
+    @property
+    def candidate(self):
+        return self._candidate
+        
+    @candidate.setter
+    def candidate(self, value):
+        self._candidate = value
+        self.fitness = None
+        self.responses = None
+        
+    def __str__(self):
+        return '{0} : {1} {2}'.format(str(self.candidate), str(self.fitness), self.responses)
+        
+    def __repr__(self):
+        return '<Individual: candidate = {0}, fitness = {1}, birthdate = {2}>'.format(str(self.candidate), str(self.fitness), self.birthdate)
+        
+    def __lt__(self, other):
+        if self.fitness is not None and other.fitness is not None:
+            if self.maximize: 
+                return self.fitness < other.fitness
+            else:
+                return self.fitness > other.fitness
+        else:
+            raise Error('fitness cannot be None when comparing Individuals')
+
+    def __le__(self, other):
+        return self < other or not other < self
+            
+    def __gt__(self, other):
+        if self.fitness is not None and other.fitness is not None:
+            return other < self
+        else:
+            raise Error('fitness cannot be None when comparing Individuals')
+
+    def __ge__(self, other):
+        return other < self or not self < other
+        
+    def __eq__(self, other):
+        return ((self._candidate, self.fitness, self.maximize) == 
+                (other._candidate, other.fitness, other.maximize))
+                
+    def __ne__(self, other):
+        return not (self == other)
+        
+
+
+class EvolutionaryComputation(object):
+    """Represents a basic evolutionary computation.
+    
+    This class encapsulates the components of a generic evolutionary
+    computation. These components are the selection mechanism, the
+    variation operators, the replacement mechanism, the migration
+    scheme, the archival mechanism, the terminators, and the observers.
+    
+    The ``observer``, ``terminator``, and ``variator`` attributes may be
+    specified as lists of such operators. In the case of the ``observer``,
+    all elements of the list will be called in sequence during the 
+    observation phase. In the case of the ``terminator``, all elements of
+    the list will be combined via logical ``or`` and, thus, the evolution will 
+    terminate if any of the terminators return True. Finally, in the case
+    of the ``variator``, the elements of the list will be applied one
+    after another in pipeline fashion, where the output of one variator
+    is used as the input to the next.
+    
+    Public Attributes:
+    
+    - *selector* -- the selection operator (defaults to ``default_selection``)
+    - *variator* -- the (possibly list of) variation operator(s) (defaults to 
+      ``default_variation``)
+    - *replacer* -- the replacement operator (defaults to 
+      ``default_replacement``)
+    - *migrator* -- the migration operator (defaults to ``default_migration``)
+    - *archiver* -- the archival operator (defaults to ``default_archiver``)
+    - *observer* -- the (possibly list of) observer(s) (defaults to 
+      ``default_observer``)
+    - *terminator* -- the (possibly list of) terminator(s) (defaults to 
+      ``default_termination``)
+    - *logger* -- the logger to use (defaults to the logger 'inspyred.ec')
+    - *event_logger* -- the logger receiving one structured event per phase
+      of every generation (defaults to the logger 'inspyred.ec.events')
+    
+    The following attributes do not have legitimate values until after 
+    the ``evolve`` method executes:
+    
+    - *termination_cause* -- the name of the function causing 
+      ``evolve`` to terminate, in the event that multiple terminators are used
+    - *generator* -- the generator function passed to ``evolve``
+    - *evaluator* -- the evaluator function passed to ``evolve``
+    - *bounder* -- the bounding function passed to ``evolve``
+    - *maximize* -- Boolean stating use of maximization passed to ``evolve``
+    - *archive* -- the archive of individuals
+    - *population* -- the population of individuals
+    - *num_evaluations* -- the number of fitness evaluations used
+    - *num_generations* -- the number of generations processed
+    - *streams* -- the ``custom_random.RandomStreams`` of the run, from
+      which e.g. islands can ``spawn`` their own streams
+    
+    Note that the attributes above are, in general, not intended to 
+    be modified by the user. (They are intended for the user to query
+    during or after the ``evolve`` method's execution.) However, 
+    there may be instances where it is necessary to modify them 
+    within other functions. This is possible to do, but it should be the 
+    exception, rather than the rule.
+    
+    If logging is desired, the following basic code segment can be 
+    used in the ``main`` or calling scope to accomplish that::
+    
+        import logging
+        logger = logging.getLogger('inspyred.ec')
+        logger.setLevel(logging.DEBUG)
+        file_handler = logging.FileHandler('inspyred.log', mode='w')
+        file_handler.setLevel(logging.DEBUG)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
+    
+    When the event logger is enabled for ``INFO``, every phase of every
+    generation (selection, variation, evaluation, replacement, migration,
+    archival, observation, termination) is logged with an ``event``
+    attribute holding a dictionary of the generation, the evaluations so
+    far, the phase, its duration in seconds and the counts involved.
+    ``custom_logging.start_event_log`` writes these records as JSON lines
+    from a background thread.
+    
+    Engines whose operators report per-generation values through
+    ``args['_statistics']`` name them in the ``statistics_columns`` class
+    attribute, so that the columns exist from the first generation on.
+    
+    Candidates evaluated to a fitness of ``None`` are dropped from the
+    population and from the offspring, unless the ``exclude_none`` class
+    attribute is False, in which case they are kept as individuals with
+    a fitness of ``None`` so that offspring stay aligned with their parents.
+    
+    Protected Attributes:
+    
+    - *_random* -- the random number generator object
+    - *_kwargs* -- the dictionary of keyword arguments initialized
+      from the *args* parameter in the *evolve* method
+    
+    """
+    statistics_columns = ()
+    exclude_none = True
+
+    def __init__(self, random):
+        self.selector = selectors.default_selection
+        self.variator = variators.default_variation
+        self.replacer = replacers.default_replacement
+        self.migrator = migrators.default_migration
+        self.observer = observers.default_observer
+        self.archiver = archivers.default_archiver
+        self.terminator = terminators.default_termination
+        self.termination_cause = None
+        self.generator = None
+        self.evaluator = None
+        self.bounder = None
+        self.maximize = True
+        self.archive = None
+        self.population = None
+        self.num_evaluations = 0
+        self.num_generations = 0
+        self.logger = logging.getLogger('inspyred.ec')
+        self.event_logger = logging.getLogger('inspyred.ec.events')
+        try:
+            self.logger.addHandler(logging.NullHandler())
+        except AttributeError:
+            # If Python < 2.7, then NullHandler doesn't exist.
+            pass
+        self._random = random
+        self._kwargs = dict()
+        
+    def _compile(self):
+        # Resolve the operator pipeline once per run, so that the generation
+        # loop neither re-checks the operator types nor formats log messages
+        # that the logger would discard.
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+        self._events = self.event_logger.isEnabledFor(logging.INFO)
+        self._observers = _pipeline(self.observer)
+        self._variators = _pipeline(self.variator)
+        self._terminators = _pipeline(self.terminator)
+
+    def _event(self, phase, start, **counts):
+        """Log the structured event of a phase that began at time *start*."""
+        counts['generation'] = self.num_generations
+        counts['evaluations'] = self.num_evaluations
+        counts['phase'] = phase
+        counts['duration'] = time.time() - start
+        self.event_logger.info(phase, extra={'event': counts})
+
+    def _should_terminate(self, pop, ng, ne):
+        start = time.time()
+        for clause in self._terminators:
+            if self._debug:
+                self.logger.debug('termination test using {0} at generation {1} and evaluation {2}'.format(clause.__name__, ng, ne))
+            if clause(population=pop, num_generations=ng, num_evaluations=ne, args=self._kwargs):
+                self.termination_cause = clause.__name__
+                if self._debug:
+                    self.logger.debug('termination from {0} at generation {1} and evaluation {2}'.format(self.termination_cause, ng, ne))
+                if self._events:
+                    self._event('termination', start, terminate=True, cause=self.termination_cause)
+                return True
+        if self._events:
+            self._event('termination', start, terminate=False)
+        return False
+
+    def _evaluate(self, candidates, exclude_none=True):
+        """Evaluate the candidates and return them as a list of individuals.
+
+        Candidates whose fitness is returned as ``None`` are excluded,
+        unless *exclude_none* is False, in which case the list stays aligned
+        with *candidates*. All candidates count towards the number of
+        evaluations.
+
+        """
+        if self._debug:
+            self.logger.debug('evaluation using {0} at generation {1} and evaluation {2}'.format(self.evaluator.__name__, self.num_generations, self.num_evaluations))
+        start = time.time()
+        fitness, responses = self.evaluator(candidates=candidates, args=self._kwargs)
+        individuals = []
+        for cs, fit, res in zip(candidates, fitness, responses):
+            if fit is not None or not exclude_none:
+                ind = Individual(cs, maximize=self.maximize)
+                ind.fitness = fit
+                ind.responses = res
+                individuals.append(ind)
+            else:
+                self.logger.warning('excluding candidate {0} because fitness received as None'.format(cs))
+        self.num_evaluations += len(fitness)
+        if self._events:
+            self._event('evaluation', start, candidates=len(candidates), individuals=len(individuals))
+        return individuals
+
+    def _observe(self):
+        start = time.time()
+        for obs in self._observers:
+            if self._debug:
+                self.logger.debug('observation using {0} at generation {1} and evaluation {2}'.format(obs.__name__, self.num_generations, self.num_evaluations))
+            obs(population=list(self.population), num_generations=self.num_generations, num_evaluations=self.num_evaluations, args=self._kwargs)
+        if self._events:
+            self._event('observation', start, observers=len(self._observers))
+
+    def _archive(self):
+        if self._debug:
+            self.logger.debug('archival using {0} at generation {1} and evaluation {2}'.format(self.archiver.__name__, self.num_generations, self.num_evaluations))
+        start = time.time()
+        self.archive = self.archiver(random=self._random, archive=list(self.archive), population=list(self.population), args=self._kwargs)
+        if self._events:
+            self._event('archival', start, archive=len(self.archive), population=len(self.population))
+        if self._debug:
+            self.logger.debug('archive size is now {0}'.format(len(self.archive)))
+            self.logger.debug('population size is now {0}'.format(len(self.population)))
+
+    def _initialize(self, generator, evaluator, pop_size, seeds, maximize, bounder, args):
+        """Set up a run and create, evaluate, archive and observe the initial population.
+
+        This is the part of ``evolve`` that precedes the generation loop.
+        Engines that replace the loop with their own call it first. When
+        ``custom_terminators.control_termination`` is one of the
+        terminators, its control channel is started here.
+
+        """
+        self._kwargs = args
+        self._kwargs['_ec'] = self
+        self._kwargs.setdefault('start_time', time.time())
+        self.streams = run_streams(self._random, self._kwargs)
+        statistics = self._kwargs.setdefault('_statistics', OrderedDict())
+        for column in self.statistics_columns:
+            statistics.setdefault(column, float('nan'))
+
+        if seeds is None:
+            seeds = []
+        if bounder is None:
+            bounder = Bounder()
+
+        self.termination_cause = None
+        self.generator = generator
+        self.evaluator = evaluator
+        self.bounder = bounder
+        self.maximize = maximize
+        self.population = []
+        self.archive = []
+        self.num_evaluations = 0
+        self.num_generations = 0
+        self._compile()
+        # commands may arrive while the initial population is evaluated
+        if control_termination in self._terminators:
+            open_control(self._kwargs)
+
+        # Create the initial population.
+        if not isinstance(seeds, Sequence):
+            seeds = [seeds]
+        initial_cs = copy.copy(seeds)
+        num_generated = max(pop_size - len(seeds), 0)
+        if self._debug:
+            self.logger.debug('generating initial population')
+        for _ in range(num_generated):
+            initial_cs.append(generator(random=self._random, args=self._kwargs))
+        if self._debug:
+            self.logger.debug('evaluating initial population')
+        self.population = self._evaluate(initial_cs, self.exclude_none)
+        if self._debug:
+            self.logger.debug('population size is now {0}'.format(len(self.population)))
+            self.logger.debug('archiving initial population')
+        self._archive()
+        self._observe()
+
+    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
+        """Perform the evolution.
+        
+        This function creates a population and then runs it through a series
+        of evolutionary epochs until the terminator is satisfied. The general
+        outline of an epoch is selection, variation, evaluation, replacement,
+        migration, archival, and observation. The function returns a list of
+        elements of type ``Individual`` representing the individuals contained
+        in the final population.
+        
+        Arguments:
+        
+        - *generator* -- the function to be used to generate candidate solutions 
+        - *evaluator* -- the function to be used to evaluate candidate solutions
+        - *pop_size* -- the number of Individuals in the population (default 100)
+        - *seeds* -- an iterable collection of candidate solutions to include
+          in the initial population (default None)
+        - *maximize* -- Boolean value stating use of maximization (default True)
+        - *bounder* -- a function used to bound candidate solutions (default None)
+        - *args* -- a dictionary of keyword arguments
+
+        The *bounder* parameter, if left as ``None``, will be initialized to a
+        default ``Bounder`` object that performs no bounding on candidates.
+        Note that the *_kwargs* class variable will be initialized to the *args* 
+        parameter here. It will also be modified to include the following 'built-in' 
+        keyword argument:
+        
+        - *_ec* -- the evolutionary computation (this object)
+        - *start_time* -- the time the evolution started, unless given
+        - *_streams* -- the ``custom_random.RandomStreams`` of the run
+        - *_statistics* -- an ordered dictionary of per-generation values
+          reported by the operators, e.g. a success rate, which
+          ``file_observer`` appends to the statistics file; its columns are
+          ``statistics_columns`` plus any entry added before the initial
+          population is observed
+        
+        The NumPy random streams used by the operators, the bounder and the
+        evaluation workers are derived from the optional *seed* keyword
+        argument, or from the engine's random number generator when it is
+        not given, so either of them makes a run reproducible.
+        
+        The observer, variator and terminator lists are resolved once, when
+        the evolution starts, so changing them during a run has no effect.
+        
+        """
+        self._initialize(generator, evaluator, pop_size, seeds, maximize, bounder, args)
+        debug = self._debug
+        events = self._events
+        
+        while not self._should_terminate(list(self.population), self.num_generations, self.num_evaluations):
+            # Select individuals.
+            if debug:
+                self.logger.debug('selection using {0} at generation {1} and evaluation {2}'.format(self.selector.__name__, self.num_generations, self.num_evaluations))
+            start = time.time()
+            parents = self.selector(random=self._random, population=list(self.population), args=self._kwargs)
+            if events:
+                self._event('selection', start, selected=len(parents))
+            if debug:
+                self.logger.debug('selected {0} candidates'.format(len(parents)))
+            start = time.time()
+            offspring_cs = [copy.deepcopy(i.candidate) for i in parents]
+            
+            for op in self._variators:
+                if debug:
+                    self.logger.debug('variation using {0} at generation {1} and evaluation {2}'.format(op.__name__, self.num_generations, self.num_evaluations))
+                offspring_cs = op(random=self._random, candidates=offspring_cs, args=self._kwargs)
+            if events:
+                self._event('variation', start, offspring=len(offspring_cs))
+            if debug:
+                self.logger.debug('created {0} offspring'.format(len(offspring_cs)))
+            
+            # Evaluate offspring.
+            offspring = self._evaluate(offspring_cs, self.exclude_none)
+
+            # Replace individuals.
+            if debug:
+                self.logger.debug('replacement using {0} at generation {1} and evaluation {2}'.format(self.replacer.__name__, self.num_generations, self.num_evaluations))
+            start = time.time()
+            self.population = self.replacer(random=self._random, population=self.population, parents=parents, offspring=offspring, args=self._kwargs)
+            if events:
+                self._event('replacement', start, population=len(self.population))
+            if debug:
+                self.logger.debug('population size is now {0}'.format(len(self.population)))
+            
+            # Migrate individuals.
+            if debug:
+                self.logger.debug('migration using {0} at generation {1} and evaluation {2}'.format(self.migrator.__name__, self.num_generations, self.num_evaluations))
+            start = time.time()
+            self.population = self.migrator(random=self._random, population=self.population, args=self._kwargs)
+            if events:
+                self._event('migration', start, population=len(self.population))
+            if debug:
+                self.logger.debug('population size is now {0}'.format(len(self.population)))
+            
+            # Archive individuals.
+            self._archive()
+            
+            self.num_generations += 1
+            self._observe()
+        return self.population
+        
+
+class GA(EvolutionaryComputation):
+    """Evolutionary computation representing a canonical genetic algorithm.
+    
+    This class represents a genetic algorithm which uses, by 
+    default, rank selection, `n`-point crossover, bit-flip mutation, 
+    and generational replacement. In the case of bit-flip mutation, 
+    it is expected that each candidate solution is a ``Sequence`` 
+    of binary values. 
+    
+    Optional keyword arguments in ``evolve`` args parameter:
+    
+    - *num_selected* -- the number of individuals to be selected 
+      (default len(population))
+    - *crossover_rate* -- the rate at which crossover is performed 
+      (default 1.0)
+    - *num_crossover_points* -- the `n` crossover points used (default 1)
+    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
+    - *num_elites* -- number of elites to consider (default 0)
+    
+    """
+    def __init__(self, random):
+        EvolutionaryComputation.__init__(self, random)
+        self.selector = selectors.rank_selection 
+        self.variator = [variators.n_point_crossover, variators.bit_flip_mutation]
+        self.replacer = replacers.generational_replacement
+        
+    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
+        args.setdefault('num_selected', pop_size)
+        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
+
+
+class ES(EvolutionaryComputation):
+    """Evolutionary computation representing a canonical evolution strategy.
+    
+    This class represents an evolution strategy which uses, by 
+    default, the default selection (i.e., all individuals are selected), 
+    an internal adaptive mutation using strategy parameters, and 'plus' 
+    replacement. It is expected that each candidate solution is a ``Sequence``
+    of real values. 
+    
+    The candidate solutions to an ES are augmented by strategy parameters of
+    the same length (using ``inspyred.ec.generators.strategize``). These 
+    strategy parameters are evolved along with the candidates and are used as
+    the mutation rates for each element of the candidates. The evaluator is
+    modified internally to use only the actual candidate elements (rather than
+    also the strategy parameters), so normal evaluator functions may be used
+    seamlessly.
+
+    Optional keyword arguments in ``evolve`` args parameter:
+    
+    - *tau* -- a proportionality constant (default None)
+    - *tau_prime* -- a proportionality constant (default None)
+    - *epsilon* -- the minimum allowed strategy parameter (default 0.00001)
+    
+    If *tau* is ``None``, it will be set to ``1 / sqrt(2 * sqrt(n))``, where
+    ``n`` is the length of a candidate. If *tau_prime* is ``None``, it will be
+    set to ``1 / sqrt(2 * n)``. The strategy parameters are updated with the
+    log-normal rule, where :math:`N(0, 1)` is drawn once per candidate and
+    :math:`N_i(0, 1)` once per element:
+    
+    .. math::
+    
+        \\sigma_i^\\prime = \\sigma_i \\cdot e^{\\tau^\\prime \\cdot N(0, 1) + \\tau \\cdot N_i(0, 1)}
+        
+        \\sigma_i^\\prime = max(\\sigma_i^\\prime, \\epsilon)
+    
+    The offspring block is mutated with a few array operations.
+    
+    """
+    def __init__(self, random):
+        EvolutionaryComputation.__init__(self, random)
+        self.selector = selectors.default_selection
+        self.variator = self._internal_variation
+        self.replacer = replacers.plus_replacement
+        
+    def _internal_variation(self, random, candidates, args):
+        tau = args.setdefault('tau', None)
+        tau_prime = args.setdefault('tau_prime', None)
+        epsilon = args.setdefault('epsilon', 0.00001)
+        rng = np_random(random, args)
+        x = np.asarray(candidates, dtype=float)
+        n = x.shape[1] // 2
+        if tau is None:
+            tau = 1 / math.sqrt(2 * math.sqrt(n))
+        if tau_prime is None:
+            tau_prime = 1 / math.sqrt(2 * n) 
+        strat = x[:, n:] * np.exp(tau_prime * rng.standard_normal((len(x), 1)) + tau * rng.standard_normal((len(x), n)))
+        np.maximum(strat, epsilon, out=strat)
+        cand = x[:, :n] + strat * rng.standard_normal((len(x), n))
+        cand = bound_candidates(self.bounder, cand, args, parents=x[:, :n])
+        return [c + s for c, s in zip(cand, strat.tolist())]
+        
+    def _internal_evaluator(self, func):
+        @functools.wraps(func)
+        def evaluator(candidates, args):
+            cands = []
+            for candidate in candidates:
+                n = len(candidate) // 2
+                cands.append(candidate[:n])
+            return func(cands, args)
+        return evaluator
+    
+    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
+        generator = generators.strategize(generator)
+        evaluator = self._internal_evaluator(evaluator)
+        # Strategize any seeds that are passed.
+        strategy_seeds = None
+        if seeds is not None:
+            strategy_seeds = []
+            for candidate in seeds:
+                n = len(candidate)
+                c = copy.copy(candidate)
+                c.extend([self._random.random() for _ in range(n)])
+                strategy_seeds.append(c)
+        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, strategy_seeds, maximize, bounder, **args)
+    
+
+class EDA(EvolutionaryComputation):
+    """Evolutionary computation representing a canonical estimation of distribution algorithm.
+    
+    This class represents an estimation of distribution algorithm which
+    uses, by default, truncation selection, an internal estimation of 
+    distribution variation, and generational replacement. It is expected 
+    that each candidate solution is a ``Sequence`` of real values. 
+    
+    The variation used here creates a statistical model based on the set 
+    of candidates (the mean and standard deviation of every gene). The 
+    offspring are then generated from this model, all at once. This 
+    function also makes use of the bounder function as specified in the EC's 
+    ``evolve`` method.
+
+    Optional keyword arguments in ``evolve`` args parameter:
+    
+    - *num_selected* -- the number of individuals to be selected 
+      (default len(population)/2)
+    - *num_offspring* -- the number of offspring to create (default len(population))
+    - *num_elites* -- number of elites to consider (default 0)
+    
+    """
+    def __init__(self, random):
+        EvolutionaryComputation.__init__(self, random)
+        self.selector = selectors.truncation_selection
+        self.variator = self._internal_variation
+        self.replacer = replacers.generational_replacement
+        
+    def _internal_variation(self, random, candidates, args):
+        num_offspring = args.setdefault('num_offspring', 1)
+        rng = np_random(random, args)
+        x = np.asarray(candidates, dtype=float)
+        mean = x.mean(axis=0)
+        stdev = x.std(axis=0, ddof=1)
+        offspring = mean + stdev * rng.standard_normal((num_offspring, x.shape[1]))
+        return bound_candidates(args['_ec'].bounder, offspring, args)
+        
+    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
+        args.setdefault('num_selected', pop_size // 2)
+        args.setdefault('num_offspring', pop_size)
+        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
+
+
+class _CMAState(object):
+    """The distribution of a CMA-ES run and its update rules.
+
+    Follows the (mu/mu_w, lambda)-CMA-ES of Hansen's tutorial, with the
+    rank-one and rank-mu covariance updates computed on the whole matrix
+    of selected steps.
+
+    """
+    def __init__(self, mean, sigma, lam):
+        n = len(mean)
+        self.n = n
+        self.lam = lam
+        self.mu = lam // 2
+        w = math.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = w / w.sum()
+        self.mueff = 1.0 / (self.weights ** 2).sum()
+        self.cc = (4 + self.mueff / n) / (n + 4 + 2 * self.mueff / n)
+        self.cs = (self.mueff + 2) / (n + self.mueff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mueff)
+        self.cmu = min(1 - self.c1, 2 * (self.mueff - 2 + 1 / self.mueff) / ((n + 2) ** 2 + self.mueff))
+        self.damps = 1 + 2 * max(0, math.sqrt((self.mueff - 1) / (n + 1)) - 1) + self.cs
+        self.chi_n = math.sqrt(n) * (1 - 1.0 / (4 * n) + 1.0 / (21 * n ** 2))
+        self.mean = np.array(mean, dtype=float)
+        self.sigma = float(sigma)
+        self.pc = np.zeros(n)
+        self.ps = np.zeros(n)
+        self.C = np.eye(n)
+        self.B = np.eye(n)
+        self.D = np.ones(n)
+        self.invsqrtC = np.eye(n)
+        self.generation = 0
+        self.evaluations = 0
+        self.eigen_evaluations = 0
+
+    def sample(self, rng):
+        """Return lambda candidates drawn from N(mean, sigma^2 C) as an array."""
+        z = rng.standard_normal((self.lam, self.n))
+        return self.mean + self.sigma * np.dot(z * self.D, self.B.T)
+
+    def update(self, x, score):
+        """Move the distribution towards the best mu of the candidates *x*."""
+        selected = np.argsort(-score, kind='mergesort')[:self.mu]
+        y = (x[selected] - self.mean) / self.sigma
+        y_w = np.dot(self.weights, y)
+        self.mean = self.mean + self.sigma * y_w
+        self.generation += 1
+        self.evaluations += self.lam
+
+        # evolution paths
+        self.ps = (1 - self.cs) * self.ps + math.sqrt(self.cs * (2 - self.cs) * self.mueff) * np.dot(self.invsqrtC, y_w)
+        norm_ps = np.linalg.norm(self.ps)
+        h_sigma = norm_ps / math.sqrt(1 - (1 - self.cs) ** (2 * self.generation)) / self.chi_n < 1.4 + 2.0 / (self.n + 1)
+        self.pc = (1 - self.cc) * self.pc + h_sigma * math.sqrt(self.cc * (2 - self.cc) * self.mueff) * y_w
+
+        # rank-one and rank-mu update of the covariance matrix
+        rank_mu = np.dot((self.weights[:, None] * y).T, y)
+        self.C = ((1 - self.c1 - self.cmu) * self.C
+                  + self.c1 * (np.outer(self.pc, self.pc) + (1 - h_sigma) * self.cc * (2 - self.cc) * self.C)
+                  + self.cmu * rank_mu)
+        self.sigma *= math.exp((self.cs / self.damps) * (norm_ps / self.chi_n - 1))
+
+        # the eigendecomposition is only refreshed every O(n) generations
+        if self.evaluations - self.eigen_evaluations > self.lam / (self.c1 + self.cmu) / self.n / 10:
+            self.eigen_evaluations = self.evaluations
+            self.C = np.triu(self.C) + np.triu(self.C, 1).T
+            eigenvalues, self.B = np.linalg.eigh(self.C)
+            self.D = np.sqrt(np.maximum(eigenvalues, 1e-300))
+            self.invsqrtC = np.dot(self.B / self.D, self.B.T)
+
+    def converged(self, sigma0, tolx, history, tolfun):
+        """Return True if the run should be restarted."""
+        if self.sigma * max(self.D.max(), np.sqrt(np.diag(self.C)).max()) < tolx * sigma0:
+            return True
+        if self.D.max() > 1e7 * self.D.min():
+            return True
+        return len(history) == history.maxlen and max(history) - min(history) < tolfun
+
+
+class CMAES(EvolutionaryComputation):
+    """Evolutionary computation representing a covariance matrix adaptation evolution strategy.
+
+    This class represents a (mu/mu_w, lambda)-CMA-ES with restarts of
+    increasing population size (IPOP-CMA-ES). Every generation samples
+    *pop_size* candidates from a multivariate normal distribution, which
+    are bounded and evaluated as one batch (so ``parallel_evaluation_mp``
+    evaluates them in parallel), and moves the mean, the step size and the
+    covariance matrix of the distribution towards the better half of them.
+    It is expected that each candidate solution is a ``Sequence`` of real
+    values.
+
+    The initial population is created by the generator as usual and its
+    best individual becomes the initial mean. The population seen by the
+    observers is the current generation of candidates. When the step
+    size collapses, the covariance matrix becomes ill-conditioned or the
+    fitness stalls, the run restarts from a random point inside the bounds
+    with the population size multiplied by *ipop_factor*.
+
+    The step size and the population size are reported in the ``Sigma``
+    and ``Pop Size`` statistics columns.
+
+    Public Attributes:
+
+    - *best* -- the best individual found so far, over all restarts
+    - *restarts* -- the number of restarts performed
+
+    Optional keyword arguments in ``evolve`` args parameter:
+
+    - *sigma* -- the initial step size (default 0.3 times the mean width of
+      the bounds, or 1 for unbounded candidates)
+    - *max_restarts* -- the maximum number of restarts (default 9)
+    - *ipop_factor* -- the factor by which the population size grows at a
+      restart (default 2)
+    - *tolx* -- restart when the step size falls below *tolx* times the
+      initial step size (default 1e-12)
+    - *tolfun* -- restart when the best fitness of the last generations
+      varies by less than *tolfun* (default 1e-12)
+
+    """
+    statistics_columns = ('Sigma', 'Pop Size')
+
+    def __init__(self, random):
+        EvolutionaryComputation.__init__(self, random)
+        self.best = None
+        self.restarts = 0
+
+    def _bounds(self, num_genes):
+        if hasattr(self.bounder, 'bounds'):
+            return self.bounder.bounds(num_genes)
+        return np.full(num_genes, -np.inf), np.full(num_genes, np.inf)
+
+    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
+        self._initialize(generator, evaluator, pop_size, seeds, maximize, bounder, args)
+        self.restarts = 0
+        score = fitness_scores(self.population, self.maximize)
+        self.best = self.population[int(np.argmax(score))]
+
+        num_genes = len(self.best.candidate)
+        lower, upper = self._bounds(num_genes)
+        width = upper - lower
+        bounded = np.isfinite(width).all()
+        sigma0 = self._kwargs.setdefault('sigma', 0.3 * float(width.mean()) if bounded else 1.0)
+        max_restarts = self._kwargs.setdefault('max_restarts', 9)
+        ipop_factor = self._kwargs.setdefault('ipop_factor', 2)
+        tolx = self._kwargs.setdefault('tolx', 1e-12)
+        tolfun = self._kwargs.setdefault('tolfun', 1e-12)
+        statistics = self._kwargs['_statistics']
+        rng = self.streams.generator
+
+        lam = max(pop_size, 4)
+        state = _CMAState(self.best.candidate, sigma0, lam)
+        history = deque(maxlen=10 + int(math.ceil(30.0 * num_genes / lam)))
+
+        while not self._should_terminate(list(self.population), self.num_generations, self.num_evaluations):
+            start = time.time()
+            offspring_cs = bound_candidates(self.bounder, state.sample(rng), self._kwargs)
+            if self._events:
+                self._event('variation', start, offspring=len(offspring_cs))
+            offspring = self._evaluate(offspring_cs, exclude_none=False)
+
+            start = time.time()
+            score = fitness_scores(offspring, self.maximize)
+            i = int(np.argmax(score))
+            if score[i] > -np.inf and (self.best.fitness is None or offspring[i] > self.best):
+                self.best = offspring[i]
+            state.update(np.array(offspring_cs), score)
+            history.append(score[i])
+            self.population = [o for o in offspring if o.fitness is not None]
+
+            if state.converged(sigma0, tolx, history, tolfun) and self.restarts < max_restarts:
+                self.restarts += 1
+                lam *= ipop_factor
+                mean = lower + rng.random(num_genes) * width if bounded else self.best.candidate
+                state = _CMAState(mean, sigma0, lam)
+                history = deque(maxlen=10 + int(math.ceil(30.0 * num_genes / lam)))
+                if self._debug:
+                    self.logger.debug('restarting CMA-ES with population size {0} at generation {1}'.format(lam, self.num_generations))
+            statistics['Sigma'] = state.sigma
+            statistics['Pop Size'] = state.lam
+            if self._events:
+                self._event('replacement', start, population=len(self.population), restarts=self.restarts)
+
+            self._archive()
+            self.num_generations += 1
+            self._observe()
+        return self.population
+
+
+class DEA(EvolutionaryComputation):
+    """Evolutionary computation representing a differential evolutionary algorithm.
+    
+    This class represents a differential evolutionary algorithm which uses, by 
+    default, tournament selection, heuristic crossover, Gaussian mutation,
+    and steady-state replacement. It is expected that each candidate solution 
+    is a ``Sequence`` of real values. 
+    
+    Optional keyword arguments in ``evolve`` args parameter:
+    
+    - *num_selected* -- the number of individuals to be selected (default 2)
+    - *tournament_size* -- the tournament size (default 2)
+    - *crossover_rate* -- the rate at which crossover is performed 
+      (default 1.0)
+    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
+    - *gaussian_mean* -- the mean used in the Gaussian function (default 0)
+    - *gaussian_stdev* -- the standard deviation used in the Gaussian function
+      (default 1)
+
+    """
+    def __init__(self, random):
+        EvolutionaryComputation.__init__(self, random)
+        self.selector = selectors.tournament_selection
+        self.variator = [variators.heuristic_crossover, variators.gaussian_mutation]
+        self.replacer = replacers.steady_state_replacement
+        
+    def evolve(self, generator, evaluator, pop_size=100, seeds=None, maximize=True, bounder=None, **args):
+        args.setdefault('num_selected', 2)
+        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
+
+
+class SA(EvolutionaryComputation):
+    """Evolutionary computation representing simulated annealing.
+    
+    This class represents a simulated annealing algorithm. It accomplishes this
+    by using default selection (i.e., all individuals are parents), Gaussian
+    mutation, and simulated annealing replacement. It is expected that each
+    candidate solution is a ``Sequence`` of real values. Consult the
+    documentation for the ``simulated_annealing_replacement`` for more
+    details on the keyword arguments listed below. 
+    
+    Every individual of the population is an independent annealing chain.
+    All chains move in the same step, so their proposals are evaluated as
+    one batch (which ``parallel_evaluation_mp`` spreads over the workers),
+    and the acceptance test runs on the fitness arrays of all chains
+    (see ``custom_replacer.sa_replacement``). The fraction of accepted moves
+    is reported in the ``Accept`` statistics column. A proposal evaluated
+    to a fitness of ``None`` is rejected, so the chain keeps its state.
+    
+    .. note::
+    
+       The ``pop_size`` parameter to ``evolve`` is replaced by the number
+       of chains, *num_chains*, which defaults to 1.
+    
+    Optional keyword arguments in ``evolve`` args parameter:
+    
+    - *num_chains* -- the number of chains (default 1)
+    - *temperature* -- the initial temperature
+    - *cooling_rate* -- a real-valued coefficient in the range (0, 1) 
+      by which the temperature should be reduced     
+    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
+    - *gaussian_mean* -- the mean used in the Gaussian function (default 0)
+    - *gaussian_stdev* -- the standard deviation used in the Gaussian function
+      (default 1)
+      
+    """
+    statistics_columns = ('Accept',)
+    exclude_none = False
+
+    def __init__(self, random):
+        EvolutionaryComputation.__init__(self, random)
+        self.selector = selectors.default_selection
+        self.variator = variators.gaussian_mutation
+        self.replacer = sa_replacement
+    
+    def evolve(self, generator, evaluator, pop_size=1, seeds=None, maximize=True, bounder=None, **args):
+        pop_size = args.setdefault('num_chains', 1)
+        return EvolutionaryComputation.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
+
+
+class PT(SA):
+    """Evolutionary computation representing parallel tempering.
+    
+    This class runs *num_chains* simulated annealing chains at fixed
+    temperatures spaced geometrically from *min_temperature* (chain 0) to
+    *max_temperature*. After every step, neighbouring temperature levels
+    may exchange their states (see ``custom_replacer.tempering_replacement``),
+    so good states found by the hot, exploring chains move down to the
+    cold chains, which refine them. The best chain is usually chain 0.
+    The fractions of accepted moves and swaps are reported in the
+    ``Accept`` and ``Swap`` statistics columns.
+    
+    Optional keyword arguments in ``evolve`` args parameter:
+    
+    - *num_chains* -- the number of chains (default 8)
+    - *temperatures* -- the temperature of each chain, coldest first
+      (default None, a geometric ladder)
+    - *min_temperature* -- the temperature of the coldest chain (default 0.01)
+    - *max_temperature* -- the temperature of the hottest chain (default 1)
+    - *mutation_rate*, *gaussian_mean*, *gaussian_stdev* -- as for ``SA``
+    
+    """
+    statistics_columns = ('Accept', 'Swap')
+
+    def __init__(self, random):
+        SA.__init__(self, random)
+        self.replacer = tempering_replacement
+    
+    def evolve(self, generator, evaluator, pop_size=1, seeds=None, maximize=True, bounder=None, **args):
+        temperatures = args.setdefault('temperatures', None)
+        if temperatures is None:
+            num_chains = args.setdefault('num_chains', 8)
+            min_temperature = args.setdefault('min_temperature', 0.01)
+            max_temperature = args.setdefault('max_temperature', 1.0)
+            temperatures = np.geomspace(min_temperature, max_temperature, num_chains) if num_chains > 1 else np.array([min_temperature])
+        args['_temperatures'] = np.asarray(temperatures, dtype=float)
+        args['num_chains'] = len(args['_temperatures'])
+        return SA.evolve(self, generator, evaluator, pop_size, seeds, maximize, bounder, **args)
@@ -3,15 +3,386 @@
        Changed version of inspyred.ec.evaluators
     ===============================================
     -- Multiple responses tracking feature added in parallel evaluator
+    -- Shared memory-mapped read-only datasets for evaluation workers
+    -- Batch evaluator for external programs
+    -- Global core budget for multi-threaded evaluations
+    -- Elastic worker pool kept alive between generations
+    -- Host-wide limit on concurrent evaluations (license slots)
+    -- Duplicate candidates of a generation evaluated once
 
     modified by: Andreas Tsichritzis <tsadreas@gmail.com>
 '''
 
+import atexit
 import functools
+import multiprocessing
+import os
+import csv
+import shlex
+import subprocess
+import tempfile
+import time
+import numpy as np
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
 try:
     import cPickle as pickle
 except ImportError:
     import pickle
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+from custom_random import run_streams
+
+
+# datasets already attached in this process, keyed by (name, filename)
+_attached_data = {}
+
+# persistent pool of the elastic mode and the settings it was started with
+_elastic_pool = {'pool': None, 'config': None, 'shrink_calls': 0}
+
+# environment variables honoured by the common OpenMP/BLAS runtimes
+THREAD_LIMIT_VARIABLES = ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                          'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS']
+
+
+def register_shared_data(name, data, args, directory=None):
+    """Register a read-only dataset that evaluation workers attach to by name.
+
+    The dataset is stored once on disk as a ``.npy`` file and every process
+    maps it with ``numpy.load(..., mmap_mode='r')``, so the pages are shared
+    through the operating system page cache instead of being copied into
+    the private memory of each worker.
+
+    *data* may be a NumPy array (or anything ``numpy.asarray`` accepts),
+    which is saved to *directory*, or the name of an existing ``.npy`` file,
+    which is used in place. The registry is kept in ``args['shared_data']``
+    as a plain dictionary, so it reaches the workers of
+    ``parallel_evaluation_mp`` together with the other pickleable arguments.
+    Inside the evaluator the dataset is retrieved with
+    ``shared_data(name, args)``.
+
+    .. Arguments:
+       name -- the name under which the dataset is registered
+       data -- a NumPy array or the name of a ``.npy`` file
+       args -- a dictionary of keyword arguments
+       directory -- where arrays are saved (default ``args['shared_data_dir']``
+       or the system temporary directory)
+
+    """
+    registry = args.setdefault('shared_data', {})
+    if isinstance(data, str):
+        filename = os.path.abspath(data)
+        owned = False
+    else:
+        if directory is None:
+            directory = args.get('shared_data_dir', tempfile.gettempdir())
+        filename = os.path.abspath(os.path.join(directory, 'shared-{0}-{1}.npy'.format(os.getpid(), name)))
+        np.save(filename, np.ascontiguousarray(data))
+        owned = True
+    registry[name] = {'filename': filename, 'owned': owned}
+    return shared_data(name, args)
+
+
+def shared_data(name, args):
+    """Return the read-only memory map of a dataset registered by name.
+
+    The map is opened once per process and cached, so repeated calls from
+    the evaluator cost a dictionary lookup.
+
+    .. Arguments:
+       name -- the name given to ``register_shared_data``
+       args -- a dictionary of keyword arguments
+
+    """
+    try:
+        filename = args['shared_data'][name]['filename']
+    except KeyError:
+        raise KeyError('shared dataset \'{0}\' has not been registered'.format(name))
+    key = (name, filename)
+    try:
+        return _attached_data[key]
+    except KeyError:
+        data = np.load(filename, mmap_mode='r')
+        _attached_data[key] = data
+        return data
+
+
+def release_shared_data(args):
+    """Detach all registered datasets and delete the files created for them.
+
+    Files that were registered by name (rather than saved from an array)
+    are left on disk.
+
+    .. Arguments:
+       args -- a dictionary of keyword arguments
+
+    """
+    registry = args.pop('shared_data', {})
+    for name, entry in registry.items():
+        _attached_data.pop((name, entry['filename']), None)
+        if entry['owned'] and os.path.exists(entry['filename']):
+            os.remove(entry['filename'])
+
+
+class FileSemaphore(object):
+    """Counting semaphore shared by every process on the host.
+
+    The semaphore consists of *slots* lock files in a common directory.
+    A slot is taken by holding an exclusive lock on its file, so the
+    limit applies to all optimizations running on the machine, and the
+    operating system releases the lock by itself if the holder dies.
+    Acquiring waits, polling every *poll_interval* seconds, until a slot
+    becomes free, so runs queue for a license instead of failing.
+
+    The semaphore can be used as a context manager::
+
+        with FileSemaphore(4, 'solver'):
+            run_solver()
+
+    Public Attributes:
+
+    - *slots* -- the number of evaluations allowed at the same time
+    - *name* -- the name shared by all processes using the same limit
+    - *directory* -- where the lock files are kept
+    - *poll_interval* -- seconds between attempts to take a slot
+
+    """
+    def __init__(self, slots, name='optim_iterator', directory=None, poll_interval=0.5):
+        self.slots = slots
+        self.name = name
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(), 'optim_iterator_locks')
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self._held = []
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                if not os.path.isdir(self.directory):
+                    raise
+
+    def _try_lock(self, slot):
+        handle = open(os.path.join(self.directory, '{0}.{1}.lock'.format(self.name, slot)), 'a+')
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except (IOError, OSError):
+            handle.close()
+            return None
+        return handle
+
+    def acquire(self, blocking=True):
+        """Take a free slot and return its handle.
+
+        If *blocking* is False and every slot is taken, ``None`` is returned
+        instead of waiting.
+
+        """
+        while True:
+            for slot in range(self.slots):
+                handle = self._try_lock(slot)
+                if handle is not None:
+                    return handle
+            if not blocking:
+                return None
+            time.sleep(self.poll_interval)
+
+    def release(self, handle):
+        """Give back the slot of a handle returned by ``acquire``."""
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        handle.close()
+
+    def __enter__(self):
+        self._held.append(self.acquire())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release(self._held.pop())
+        return False
+
+
+def license_semaphore(args):
+    """Return the ``FileSemaphore`` described by *args*, or ``None``.
+
+    Optional keyword arguments in args:
+
+    - *license_slots* -- the number of concurrent evaluations allowed on
+      the host (default None, no limit)
+    - *license_name* -- the name of the limit, shared by all runs that
+      use the same license (default 'optim_iterator')
+    - *license_dir* -- the directory of the lock files (default
+      ``optim_iterator_locks`` in the system temporary directory)
+    - *license_poll_interval* -- seconds between attempts to take a slot
+      (default 0.5)
+
+    """
+    slots = args.get('license_slots')
+    if slots is None:
+        return None
+    return FileSemaphore(slots, args.get('license_name', 'optim_iterator'),
+                         args.get('license_dir'), args.get('license_poll_interval', 0.5))
+
+
+def _licensed_evaluation(evaluator, candidates, args):
+    with license_semaphore(args):
+        return evaluator(candidates, args)
+
+
+def _available_cpus():
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return list(range(multiprocessing.cpu_count()))
+
+
+def core_budget(nprocs, args):
+    """Fit the number of concurrent evaluations to the global core budget.
+
+    Returns the number of workers and, if *mp_pin_cpus* is set, the list of
+    CPU sets the workers are pinned to (``None`` otherwise). Each worker
+    gets *mp_threads_per_eval* cores of the *mp_core_budget* cores, so the
+    machine is never oversubscribed by multi-threaded evaluations. Without
+    *mp_core_budget* and *mp_threads_per_eval* the requested number of
+    workers is kept, even if it exceeds the number of cores.
+
+    .. Arguments:
+       nprocs -- the requested number of concurrent evaluations
+       args -- a dictionary of keyword arguments
+
+    """
+    cpus = _available_cpus()
+    threads = max(args.get('mp_threads_per_eval', 1), 1)
+    if 'mp_core_budget' in args or 'mp_threads_per_eval' in args:
+        budget = min(args.get('mp_core_budget', len(cpus)), len(cpus))
+        nprocs = max(min(nprocs, budget // threads), 1)
+    cpusets = None
+    if args.get('mp_pin_cpus', False):
+        cpusets = [cpus[i*threads:(i+1)*threads] or cpus for i in range(nprocs)]
+    return nprocs, cpusets
+
+
+def thread_environment(args, environ=None):
+    """Return a copy of *environ* limited to *mp_threads_per_eval* threads.
+
+    .. Arguments:
+       args -- a dictionary of keyword arguments
+       environ -- the environment to copy (default ``os.environ``)
+
+    """
+    env = dict(os.environ if environ is None else environ)
+    if 'mp_threads_per_eval' in args:
+        for var in THREAD_LIMIT_VARIABLES:
+            env[var] = str(args['mp_threads_per_eval'])
+    return env
+
+
+def _init_worker(threads, slots):
+    if threads is not None:
+        for var in THREAD_LIMIT_VARIABLES:
+            os.environ[var] = str(threads)
+        # the BLAS/OpenMP pools inherited from the parent were sized before
+        # the variables changed; resize them where threadpoolctl allows it
+        if threadpool_limits is not None:
+            threadpool_limits(limits=threads)
+    if slots is not None and hasattr(os, 'sched_setaffinity'):
+        # each worker takes one CPU set; a worker started to replace a
+        # dead one finds none left and runs unpinned
+        try:
+            os.sched_setaffinity(0, slots.get(timeout=1))
+        except queue.Empty:
+            pass
+
+
+def _make_pool(nprocs, threads, cpusets):
+    """Start a pool whose workers limit their threads and take one CPU set each."""
+    slots = None
+    if cpusets is not None:
+        slots = multiprocessing.Queue()
+        for cpuset in cpusets:
+            slots.put(cpuset)
+    return multiprocessing.Pool(processes=nprocs, initializer=_init_worker, initargs=(threads, slots))
+
+
+def elastic_pool_size(args):
+    """Return the number of workers the elastic pool should have now.
+
+    The size starts from *mp_nprocs*, which an operator may override while
+    the run is going by writing a number into *mp_nprocs_file*. If
+    *mp_max_load* is given, it is reduced to the capacity left by the other
+    jobs on the machine, estimated as the one-minute load average minus the
+    workers of this pool.
+
+    The size does not follow the number of candidates of a call; a smaller
+    batch simply leaves some workers idle. A larger size is returned at
+    once, but a smaller one only after it has been asked for in
+    *mp_shrink_delay* consecutive calls, so that a fluctuating load does
+    not restart the pool every generation.
+
+    .. Arguments:
+       args -- a dictionary of keyword arguments
+
+    """
+    size = args.get('mp_nprocs', multiprocessing.cpu_count())
+    control_file = args.get('mp_nprocs_file')
+    if control_file is not None and os.path.exists(control_file):
+        try:
+            with open(control_file) as f:
+                size = int(f.read().strip())
+        except ValueError:
+            pass
+    current = _elastic_pool['config'][0] if _elastic_pool['pool'] is not None else None
+    max_load = args.get('mp_max_load')
+    if max_load is not None and hasattr(os, 'getloadavg'):
+        other_load = max(os.getloadavg()[0] - (current or 0), 0)
+        size = min(size, int(max_load - other_load))
+    size = max(size, 1)
+    if current is not None and size < current:
+        _elastic_pool['shrink_calls'] += 1
+        if _elastic_pool['shrink_calls'] < args.get('mp_shrink_delay', 3):
+            return current
+    _elastic_pool['shrink_calls'] = 0
+    return size
+
+
+def close_pool():
+    """Shut down the persistent pool of the elastic mode, if any."""
+    pool = _elastic_pool['pool']
+    if pool is not None:
+        pool.close()
+        pool.join()
+    _elastic_pool['pool'] = None
+    _elastic_pool['config'] = None
+    _elastic_pool['shrink_calls'] = 0
+
+atexit.register(close_pool)
+
+
+def _get_elastic_pool(nprocs, threads, cpusets, logger):
+    config = (nprocs, threads, cpusets)
+    if _elastic_pool['config'] != config:
+        if _elastic_pool['pool'] is not None:
+            logger.debug('resizing evaluation pool from {0} to {1} workers'.format(_elastic_pool['config'][0], nprocs))
+        close_pool()
+        _elastic_pool['pool'] = _make_pool(nprocs, threads, cpusets)
+        _elastic_pool['config'] = config
+    return _elastic_pool['pool']
 
 
 def parallel_evaluation_mp(candidates, args):
@@ -42,10 +413,45 @@ def parallel_evaluation_mp(candidates, args):
 
     - *mp_nprocs* -- number of processors that will be used (default machine
       cpu count)
+    - *shared_data* -- registry of read-only datasets created by
+      ``register_shared_data`` (workers attach with ``shared_data``)
+    - *mp_core_budget* -- total number of cores the evaluations may use
+      (default all available cores if *mp_threads_per_eval* is given,
+      otherwise *mp_nprocs* is not limited)
+    - *mp_threads_per_eval* -- number of threads each evaluation uses; it is
+      exported to the workers through the OpenMP/BLAS thread-limit
+      environment variables and the number of workers is reduced so that
+      ``workers * threads <= mp_core_budget`` (default 1, variables unset)
+    - *mp_pin_cpus* -- pin each worker to its own set of
+      *mp_threads_per_eval* cores where the platform supports it
+      (default False)
+    - *mp_elastic* -- keep the worker pool alive between generations and
+      resize it before every call according to ``elastic_pool_size``
+      (default False, a new pool of *mp_nprocs* workers per call)
+    - *mp_nprocs_file* -- file from which an operator can set the pool
+      size during the run (elastic mode only)
+    - *mp_max_load* -- load average the machine should not exceed
+      (elastic mode only)
+    - *mp_shrink_delay* -- number of consecutive calls asking for fewer
+      workers before the pool shrinks (elastic mode only, default 3)
+    - *license_slots*, *license_name*, *license_dir* -- cap the number of
+      evaluations running at the same time across every optimization on
+      the host (see ``license_semaphore``); workers wait for a free slot
+
+    Each job receives its own seed in ``args['mp_seed']``, derived from the
+    run's random streams; evaluators that need random numbers should draw
+    them from ``custom_random.worker_random(args)``.
+
+    .. note::
+
+       The thread-limit variables are set when a worker starts, after
+       the parent has loaded NumPy, so they only cap the processes an
+       evaluation launches and the libraries it loads afterwards. The
+       BLAS and OpenMP thread pools already loaded in the worker are
+       limited at run time only if ``threadpoolctl`` is installed;
+       otherwise set the variables before NumPy is first imported.
 
     """
-    import time
-    import multiprocessing
     logger = args['_ec'].logger
 
     try:
@@ -53,10 +459,16 @@ def parallel_evaluation_mp(candidates, args):
     except KeyError:
         logger.error('parallel_evaluation_mp requires \'mp_evaluator\' be defined in the keyword arguments list')
         raise
-    try:
-        nprocs = args['mp_nprocs']
-    except KeyError:
-        nprocs = multiprocessing.cpu_count()
+    elastic = args.get('mp_elastic', False)
+    if elastic:
+        nprocs = elastic_pool_size(args)
+    else:
+        try:
+            nprocs = args['mp_nprocs']
+        except KeyError:
+            nprocs = multiprocessing.cpu_count()
+    nprocs, cpusets = core_budget(nprocs, args)
+    threads = args.get('mp_threads_per_eval')
 
     pickled_args = {}
     for key in args:
@@ -67,20 +479,227 @@ def parallel_evaluation_mp(candidates, args):
             logger.debug('unable to pickle args parameter {0} in parallel_evaluation_mp'.format(key))
             pass
 
+    # one seed per candidate, drawn in candidate order, so the results do
+    # not depend on the worker that runs a job
+    seeds = run_streams(args['_ec']._random, args).worker_seeds(len(candidates))
+    if args.get('license_slots') is not None:
+        jobs = [(_licensed_evaluation, (evaluator, [c], dict(pickled_args, mp_seed=s))) for c, s in zip(candidates, seeds)]
+    else:
+        jobs = [(evaluator, ([c], dict(pickled_args, mp_seed=s))) for c, s in zip(candidates, seeds)]
+
     start = time.time()
     try:
-        pool = multiprocessing.Pool(processes=nprocs)
-        results = [pool.apply_async(evaluator, ([c], pickled_args)) for c in candidates]
-        pool.close()
-        pool.join()
-        f = [r.get()['Obj'] for r in results]
-        for r in results:
-            del r.get()['Obj']
-        return (f, [r.get() for r in results])
+        if elastic:
+            pool = _get_elastic_pool(nprocs, threads, cpusets, logger)
+            results = [pool.apply_async(func, job_args) for func, job_args in jobs]
+            values = [r.get() for r in results]
+        else:
+            pool = _make_pool(nprocs, threads, cpusets)
+            results = [pool.apply_async(func, job_args) for func, job_args in jobs]
+            pool.close()
+            pool.join()
+            values = [r.get() for r in results]
     except (OSError, RuntimeError) as e:
         logger.error('failed parallel_evaluation_mp: {0}'.format(str(e)))
         raise
-    else:
-        end = time.time()
-        logger.debug('completed parallel_evaluation_mp in {0} seconds'.format(end - start))
+    f = [v.pop('Obj') for v in values]
+    end = time.time()
+    logger.debug('completed parallel_evaluation_mp in {0} seconds'.format(end - start))
+    return (f, values)
+
+
+def batch_evaluation_external(candidates, args):
+    """Evaluate the candidates in batches with an external program.
+
+    Instead of launching the external program once per candidate, the
+    candidates are split into batches, each batch is written to one input
+    file and the program is run once per batch, so its startup cost is
+    spread over the whole batch. Up to *mp_nprocs* batches run at the same
+    time.
+
+    The input file is a CSV file with a header line holding the parameter
+    names (*par*) followed by one line per candidate. The program must
+    write a CSV file with a header line containing ``Obj`` and the response
+    names (*res*), followed by one line per candidate in the same order.
+    An empty or non-numeric ``Obj`` value is returned as a fitness of
+    ``None``, so the engines exclude that candidate. The files are named
+    ``batch_<generation>_<evaluations so far>_<batch>_input.csv`` (and
+    ``_output.csv``), so kept files of different calls never collide.
+
+    .. Arguments:
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Required keyword arguments in args:
+
+    - *ext_command* -- the command to run, as a list of arguments or a
+      single string; ``{input}`` and ``{output}`` in the arguments are
+      replaced by the names of the batch input and output files
+
+    Optional keyword arguments in args:
+
+    - *ext_batch_size* -- the number of candidates per invocation
+      (default all candidates in one batch)
+    - *ext_workdir* -- the directory of the batch files (default current
+      directory)
+    - *ext_keep_files* -- keep the batch files after reading them
+      (default False)
+    - *mp_nprocs* -- the number of batches run at the same time (default 1)
+    - *mp_core_budget*, *mp_threads_per_eval* -- as in
+      ``parallel_evaluation_mp``; the programs are started with the
+      thread-limit environment variables set
+    - *license_slots*, *license_name*, *license_dir* -- each running batch
+      holds one slot of the host-wide limit (see ``license_semaphore``)
+    - *par* -- the parameter names used in the input file header
+    - *res* -- the responses read back from the output file (default all
+      columns except ``Obj``)
+
+    """
+    logger = args['_ec'].logger
+
+    try:
+        command = args['ext_command']
+    except KeyError:
+        logger.error('batch_evaluation_external requires \'ext_command\' be defined in the keyword arguments list')
+        raise
+    if isinstance(command, str):
+        command = shlex.split(command)
+    batch_size = args.get('ext_batch_size') or max(len(candidates), 1)
+    workdir = args.get('ext_workdir', os.getcwd())
+    keep_files = args.get('ext_keep_files', False)
+    nprocs, _ = core_budget(args.get('mp_nprocs', 1), args)
+    env = thread_environment(args)
+    num_gens = args['_ec'].num_generations
+    # the evaluations so far tell apart calls within a generation, such as
+    # the initial population and the first offspring
+    num_evals = args['_ec'].num_evaluations
+    header = args.get('par') or ['x{0}'.format(i) for i in range(len(candidates[0]))]
+
+    batches = [candidates[i:i+batch_size] for i in range(0, len(candidates), batch_size)]
+    files = []
+    for b, batch in enumerate(batches):
+        infile = os.path.join(workdir, 'batch_{0}_{1}_{2}_input.csv'.format(num_gens, num_evals, b))
+        outfile = os.path.join(workdir, 'batch_{0}_{1}_{2}_output.csv'.format(num_gens, num_evals, b))
+        with open(infile, 'w') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for c in batch:
+                writer.writerow([repr(float(x)) for x in c])
+        files.append((infile, outfile))
+
+    semaphore = license_semaphore(args)
+    start = time.time()
+    pending = list(range(len(batches)))
+    running = []
+    while pending or running:
+        while pending and len(running) < nprocs:
+            slot = None
+            if semaphore is not None:
+                # only wait for a license when none of our own batches can free one
+                slot = semaphore.acquire(blocking=not running)
+                if slot is None:
+                    break
+            b = pending.pop(0)
+            infile, outfile = files[b]
+            cmd = [a.format(input=infile, output=outfile) for a in command]
+            logger.debug('running batch {0} of {1} candidates: {2}'.format(b, len(batches[b]), ' '.join(cmd)))
+            running.append((b, subprocess.Popen(cmd, cwd=workdir, env=env), slot))
+        b, proc, slot = running.pop(0)
+        proc.wait()
+        if slot is not None:
+            semaphore.release(slot)
+        if proc.returncode != 0:
+            logger.error('failed batch_evaluation_external: batch {0} exited with code {1}'.format(b, proc.returncode))
+            for _, p, s in running:
+                p.wait()
+                if s is not None:
+                    semaphore.release(s)
+            raise RuntimeError('external evaluation of batch {0} exited with code {1}'.format(b, proc.returncode))
+
+    f = []
+    responses = []
+    names = args.get('res')
+    for b, batch in enumerate(batches):
+        infile, outfile = files[b]
+        with open(outfile) as out:
+            rows = list(csv.DictReader(out, skipinitialspace=True))
+        if len(rows) != len(batch):
+            logger.error('failed batch_evaluation_external: batch {0} returned {1} rows for {2} candidates'.format(b, len(rows), len(batch)))
+            raise RuntimeError('external evaluation of batch {0} returned {1} rows for {2} candidates'.format(b, len(rows), len(batch)))
+        for row in rows:
+            try:
+                f.append(float(row.pop('Obj')))
+            except (KeyError, TypeError, ValueError):
+                f.append(None)
+            keys = names if names is not None else row.keys()
+            res = {}
+            for k in keys:
+                try:
+                    res[k] = float(row[k])
+                except (KeyError, TypeError, ValueError):
+                    res[k] = None
+            responses.append(res)
+        if not keep_files:
+            os.remove(infile)
+            os.remove(outfile)
+    end = time.time()
+    logger.debug('completed batch_evaluation_external in {0} seconds'.format(end - start))
+    return (f, responses)
+
+
+def dedup_evaluation(candidates, args):
+    """Evaluate each distinct candidate once and share the result.
+
+    Bounding, DE resets and converged swarms often produce identical
+    candidates within one generation. This evaluator collapses them
+    before calling the actual evaluator and fans the fitness and responses
+    back out to every duplicate, so each distinct point costs one
+    evaluation. With a *dedup_tolerance*, candidates whose values round to
+    the same multiple of the tolerance count as duplicates (the first of
+    them is evaluated).
+
+    The fraction of candidates that were duplicates is reported in the
+    ``Dedup`` column of ``args['_statistics']``, and the total number of
+    evaluations saved in ``args['dedup_saved']``.
+
+    .. Arguments:
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Required keyword arguments in args:
+
+    - *dedup_evaluator* -- actual evaluation function to be used, e.g.
+      ``parallel_evaluation_mp`` (This function should have the same
+      signature as any other inspyred evaluation function.)
+
+    Optional keyword arguments in args:
+
+    - *dedup_tolerance* -- the tolerance below which candidates are equal
+      (default 0, only exact duplicates)
+
+    """
+    logger = args['_ec'].logger
+    try:
+        evaluator = args['dedup_evaluator']
+    except KeyError:
+        logger.error('dedup_evaluation requires \'dedup_evaluator\' be defined in the keyword arguments list')
+        raise
+    statistics = args.get('_statistics')
+    if not len(candidates):
+        return evaluator(candidates=candidates, args=args)
+
+    x = np.asarray(candidates, dtype=float)
+    tolerance = args.get('dedup_tolerance', 0)
+    keys = np.round(x / tolerance) if tolerance else x
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+    distinct = [candidates[i] for i in first]
+    fitness, responses = evaluator(candidates=distinct, args=args)
 
+    saved = len(candidates) - len(distinct)
+    args['dedup_saved'] = args.get('dedup_saved', 0) + saved
+    if statistics is not None:
+        statistics['Dedup'] = float(saved) / len(candidates)
+    if saved:
+        logger.debug('dedup_evaluation evaluated {0} distinct of {1} candidates'.format(len(distinct), len(candidates)))
+    return [fitness[j] for j in inverse], [dict(responses[j]) for j in inverse]
@@ -0,0 +1,187 @@
+'''
+    ===============================================
+    Asynchronous structured event log
+    ===============================================
+
+    -- Log records are handed to a bounded ring buffer through a
+       QueueHandler and written as JSON lines by a background thread
+
+    author: Andreas Tsichritzis <tsadreas@gmail.com>
+'''
+
+import collections
+import json
+import logging
+import threading
+import time
+try:
+    from logging.handlers import QueueHandler
+except ImportError:
+    # Python < 3.2 has no QueueHandler.
+    class QueueHandler(logging.Handler):
+        def __init__(self, queue):
+            logging.Handler.__init__(self)
+            self.queue = queue
+
+        def prepare(self, record):
+            return record
+
+        def emit(self, record):
+            try:
+                self.queue.put_nowait(self.prepare(record))
+            except Exception:
+                self.handleError(record)
+
+
+class RingBuffer(object):
+    """Bounded queue that discards the oldest records when it is full.
+
+    Putting a record never blocks, so a slow disk can never stall the
+    evolution; instead the oldest pending records are dropped and counted
+    in *dropped*.
+
+    Public Attributes:
+
+    - *capacity* -- the maximum number of pending records
+    - *dropped* -- the number of records discarded so far
+
+    """
+    def __init__(self, capacity=100000):
+        self.capacity = capacity
+        self.dropped = 0
+        self._items = collections.deque()
+        self._condition = threading.Condition()
+
+    def put_nowait(self, item):
+        with self._condition:
+            if len(self._items) >= self.capacity:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+            self._condition.notify()
+
+    def get_all(self, timeout=None):
+        """Wait up to *timeout* seconds for records and return all pending ones."""
+        with self._condition:
+            if not self._items:
+                self._condition.wait(timeout)
+            items = list(self._items)
+            self._items.clear()
+            return items
+
+    def take_dropped(self):
+        """Return the number of records dropped since the last call and reset it."""
+        with self._condition:
+            dropped = self.dropped
+            self.dropped = 0
+            return dropped
+
+    def wake(self):
+        """Wake up a reader waiting in ``get_all``."""
+        with self._condition:
+            self._condition.notify()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    # The record is formatted by the writer thread, not on the hot path.
+    def prepare(self, record):
+        return record
+
+
+def event_record(record):
+    """Return the dictionary written to the event log for a log record.
+
+    The record's ``event`` attribute (set through ``extra={'event': ...}``,
+    as the engines do for every phase) is merged into the line; plain log
+    messages are written with their level, logger name and message.
+
+    """
+    line = {'time': record.created,
+            'level': record.levelname,
+            'logger': record.name}
+    event = getattr(record, 'event', None)
+    if event is not None:
+        line.update(event)
+    else:
+        line['message'] = record.getMessage()
+    return line
+
+
+class EventLog(object):
+    """Writes the records of a logger as JSON lines from a background thread.
+
+    The log is normally created with ``start_event_log``. Records are
+    queued by a ``QueueHandler`` into a ``RingBuffer`` and a daemon thread
+    writes them out in batches, flushing the file after every batch.
+
+    Public Attributes:
+
+    - *filename* -- the name of the JSON lines file
+    - *logger* -- the logger the handler is attached to
+    - *buffer* -- the ring buffer between the handler and the writer
+    - *handler* -- the ``QueueHandler`` attached to the logger
+
+    """
+    def __init__(self, filename, logger, capacity=100000, flush_interval=0.5):
+        self.filename = filename
+        self.logger = logger
+        self.buffer = RingBuffer(capacity)
+        self.handler = _DeferredQueueHandler(self.buffer)
+        self._flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._file = open(filename, 'w')
+        self._thread = threading.Thread(target=self._run, name='event-log-writer')
+        self._thread.daemon = True
+
+    def start(self):
+        self.logger.addHandler(self.handler)
+        self._thread.start()
+        return self
+
+    def _write(self, records):
+        dropped = self.buffer.take_dropped()
+        if dropped:
+            self._file.write(json.dumps({'time': time.time(), 'level': 'WARNING', 'dropped': dropped}) + '\n')
+        for record in records:
+            self._file.write(json.dumps(event_record(record), default=str) + '\n')
+        self._file.flush()
+
+    def _run(self):
+        while not self._stop.is_set():
+            records = self.buffer.get_all(self._flush_interval)
+            if records:
+                self._write(records)
+        self._write(self.buffer.get_all(0))
+
+    def stop(self):
+        """Detach the handler, write the pending records and close the file."""
+        self.logger.removeHandler(self.handler)
+        self._stop.set()
+        self.buffer.wake()
+        self._thread.join()
+        self._file.close()
+
+
+def start_event_log(filename, logger='inspyred.ec', level=logging.INFO, capacity=100000):
+    """Start writing the records of *logger* to *filename* as JSON lines.
+
+    Both the plain messages of the logger and the structured phase events
+    of the engines (logger ``'inspyred.ec.events'``) end up in the file.
+    Call ``stop`` on the returned ``EventLog`` at the end of the run.
+
+    At the default level, ``INFO``, the engines skip their debug messages
+    and the phase events carry the same information; ``DEBUG`` adds the
+    messages, at the cost of formatting them on every phase.
+
+    .. Arguments:
+       filename -- the name of the JSON lines file
+       logger -- the logger or the name of the logger (default 'inspyred.ec')
+       level -- the level of the logger (default INFO)
+       capacity -- the number of pending records kept before the oldest
+       are dropped (default 100000)
+
+    """
+    if not isinstance(logger, logging.Logger):
+        logger = logging.getLogger(logger)
+    logger.setLevel(level)
+    return EventLog(filename, logger, capacity).start()
@@ -3,9 +3,14 @@
        Changed version of inspyred.ec.observers
     ===============================================
     -- Responses added in file_observer
+    -- Operator statistics appended to the statistics file
 
     -- Fitness plot observer added
 
+    -- Statistics shared through custom_statistics
+
+    -- Binary columnar trajectory observer
+
     original author: Aaron Garrett <aaron.lee.garrett@gmail.com>
 
     modified by: Andreas Tsichritzis <tsadreas@gmail.com>
@@ -17,6 +22,10 @@ import inspyred
 import csv
 import pylab
 import time
+import numpy as np
+import custom_statistics
+import custom_trajectory
+from custom_replacer import fitness_scores
 
 
 def file_observer(population, num_generations, num_evaluations, args):
@@ -36,14 +45,20 @@ def file_observer(population, num_generations, num_evaluations, args):
 
        generation number, population size, worst, best, median, average, standard deviation
 
+    followed by one column for each entry of ``args['_statistics']`` present
+    at generation 0 (e.g. the success rate reported by ``dea_replacer``).
+
     The format of each line of the individuals file is as follows::
 
        generation number, individual number, fitness, string representation of candidate
 
+    The individuals of a generation are written best first.
+
     .. note::
 
-       This function makes use of the ``fitness_statistics``
-       function, so it is subject to the same requirements.
+       The statistics come from ``custom_statistics.population_statistics``,
+       which computes them once per generation for all observers and
+       terminators.
 
     .. Arguments:
        population -- the population of Individuals
@@ -71,39 +86,51 @@ def file_observer(population, num_generations, num_evaluations, args):
 
     candidates = args['par']
     candidates = ['{0:>10}'.format(i)[:10] for i in candidates]
-    stats = inspyred.ec.analysis.fitness_statistics(population)
+    stats = custom_statistics.population_statistics(population, num_generations, num_evaluations, args).generation['fitness']
     worst_fit = '{0:>10}'.format(stats['worst'])[:10]
     best_fit = '{0:>10}'.format(stats['best'])[:10]
     avg_fit = '{0:>10}'.format(stats['mean'])[:10]
     med_fit = '{0:>10}'.format(stats['median'])[:10]
     std_fit = '{0:>10}'.format(stats['std'])[:10]
 
+    # operator statistics, with the columns fixed at generation 0
+    statistics = args.get('_statistics') or {}
+    if num_generations == 0:
+        args['_statistics_columns'] = list(statistics)
+    columns = args.get('_statistics_columns', [])
+    extra = ''.join(', ' + '{0:>10}'.format(statistics.get(c, float('nan')))[:10] for c in columns)
 
     if num_generations == 0:
-        statistics_file.write('{0:>10}, {1:>10}, {2:>10}, {3:>10}, {4:>10}, {5:>10}, {6:>10}\n'.format('Gen',
+        extra_header = ''.join(', ' + '{0:>10}'.format(c)[:10] for c in columns)
+        statistics_file.write('{0:>10}, {1:>10}, {2:>10}, {3:>10}, {4:>10}, {5:>10}, {6:>10}{7}\n'.format('Gen',
                                                                                                  'Eval #',
                                                                                                  'Worst Fit',
                                                                                                  'Best Fit',
                                                                                                  'Median Fit',
                                                                                                  'Avg Fit',
-                                                                                                 'Std Fit'))
-        statistics_file.write('{0:>10}, {1:>10}, {2:>10}, {3:>10}, {4:>10}, {5:>10}, {6:>10}\n'.format(num_generations,
+                                                                                                 'Std Fit',
+                                                                                                 extra_header))
+        statistics_file.write('{0:>10}, {1:>10}, {2:>10}, {3:>10}, {4:>10}, {5:>10}, {6:>10}{7}\n'.format(num_generations,
                                                                                                  num_evaluations,
                                                                                                  worst_fit,
                                                                                                  best_fit,
                                                                                                  med_fit,
                                                                                                  avg_fit,
-                                                                                                 std_fit))
+                                                                                                 std_fit,
+                                                                                                 extra))
     else:
-        statistics_file.write('{0:>10}, {1:>10}, {2:>10}, {3:>10}, {4:>10}, {5:>10}, {6:>10}\n'.format(num_generations,
+        statistics_file.write('{0:>10}, {1:>10}, {2:>10}, {3:>10}, {4:>10}, {5:>10}, {6:>10}{7}\n'.format(num_generations,
                                                                                                  num_evaluations,
                                                                                                  worst_fit,
                                                                                                  best_fit,
                                                                                                  med_fit,
                                                                                                  avg_fit,
-                                                                                                 std_fit))
+                                                                                                 std_fit,
+                                                                                                 extra))
     responses = args['res']
-    for i, p in enumerate(population):
+    # individuals are written best first, as after inspyred's fitness_statistics
+    order = np.argsort(-fitness_scores(population, args['_ec'].maximize), kind='mergesort')
+    for i, p in enumerate(population[j] for j in order):
         a = ['{0:>10}'.format(l)[:10] for l in p.candidate]
         b = p.responses
         k = []
@@ -122,6 +149,42 @@ def file_observer(population, num_generations, num_evaluations, args):
     individuals_file.flush()
 
 
+def binary_observer(population, num_generations, num_evaluations, args):
+    """Append every individual to a binary columnar trajectory file.
+
+    This is the individuals file of ``file_observer`` without the
+    formatting: each individual becomes one float64 record with the
+    fields ``Gen``, ``Ind``, the parameters in *par*, ``Fitness`` and the
+    responses in *res*, appended to a ``.npy`` file one generation at a
+    time (see ``custom_trajectory.TrajectoryWriter``). Values are stored
+    at full precision and missing ones as NaN. The file can be read at
+    any point with ``custom_trajectory.read_trajectory``, which
+    memory-maps it.
+
+    .. Arguments:
+       population -- the population of Individuals
+       num_generations -- the number of elapsed generations
+       num_evaluations -- the number of candidate solution evaluations
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *trajectory_file* -- the name of the trajectory file (default
+      'inspyred-trajectory-file-<timestamp>.npy')
+    - *par* -- the names of the parameters (default x0, x1, ...)
+    - *res* -- the names of the responses (default none)
+
+    """
+    try:
+        writer = args['_trajectory']
+    except KeyError:
+        filename = args.setdefault('trajectory_file', 'inspyred-trajectory-file-{0}.npy'.format(time.strftime('%m%d%Y-%H%M%S')))
+        parameters = args.get('par') or ['x{0}'.format(i) for i in range(len(population[0].candidate))]
+        writer = custom_trajectory.TrajectoryWriter(filename, parameters, args.get('res', ()))
+        args['_trajectory'] = writer
+    writer.append(num_generations, population)
+
+
 def fitness_plot_observer(population, num_generations, num_evaluations, args):
     """ Interactive fitness plot while calculating
 
@@ -130,7 +193,8 @@ def fitness_plot_observer(population, num_generations, num_evaluations, args):
     import pylab
     import numpy
 
-    stats = inspyred.ec.analysis.fitness_statistics(population)
+    statistics = custom_statistics.population_statistics(population, num_generations, num_evaluations, args)
+    stats = statistics.generation['fitness']
     best_fitness = stats['best']
     worst_fitness = stats['worst']
     median_fitness = stats['median']
@@ -164,8 +228,9 @@ def fitness_plot_observer(population, num_generations, num_evaluations, args):
             line.set_ydata(numpy.array(data[i+1]))
         args['plot_data'] = data
         args['plot_lines'] = lines
-    ymin = min([min(d) for d in data[1:]])
-    ymax = max([max(d) for d in data[1:]])
+    # every plotted value lies between the extremes of the run
+    ymin = statistics.run['fitness']['min']
+    ymax = statistics.run['fitness']['max']
     yrange = ymax - ymin
     pylab.xlim((0, num_evaluations))
     pylab.ylim((ymin - 0.1*yrange, ymax + 0.1*yrange))
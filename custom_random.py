@@ -0,0 +1,174 @@
+'''
+    ===============================================
+    Reproducible random number streams
+    ===============================================
+
+    -- One seed for a whole run, from which the engine, the variators,
+       the bounders, the evaluation workers and the islands of a run
+       derive independent NumPy streams
+    -- Random numbers are drawn in blocks, one call per generation,
+       instead of one call per gene
+
+    author: Andreas Tsichritzis <tsadreas@gmail.com>
+'''
+
+import numpy as np
+
+try:
+    SeedSequence = np.random.SeedSequence
+except AttributeError:
+    SeedSequence = None
+
+
+class _LegacyGenerator(np.random.RandomState):
+    """A ``RandomState`` that answers to the ``Generator`` method names.
+
+    Used when the installed NumPy predates ``numpy.random.Generator``.
+
+    """
+    def random(self, size=None):
+        return self.random_sample(size)
+
+    def integers(self, low, high=None, size=None):
+        return self.randint(low, high, size)
+
+
+def make_generator(seed):
+    """Return a NumPy generator seeded with *seed*.
+
+    *seed* is an integer or, on NumPy 1.17 and later, a ``SeedSequence``.
+
+    """
+    if SeedSequence is not None:
+        return np.random.default_rng(seed)
+    return _LegacyGenerator(seed % 2**32)
+
+
+class RandomStreams(object):
+    """Independent random streams derived from one seed.
+
+    The main stream, ``generator``, is used by the engine and its
+    operators. ``spawn`` derives child streams, e.g. one per island, and
+    ``worker_seeds`` derives one integer seed per evaluation job, so the
+    random numbers an evaluator draws do not depend on which worker
+    process runs it or in which order the jobs complete.
+
+    Public Attributes:
+
+    - *seed* -- the seed of the streams
+    - *generator* -- the main NumPy generator
+
+    """
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = np.random.randint(0, 2**31 - 1)
+        self.seed = seed
+        if SeedSequence is not None:
+            self._sequence = seed if isinstance(seed, SeedSequence) else SeedSequence(seed)
+            self.generator = make_generator(self._sequence.spawn(1)[0])
+        else:
+            self._sequence = np.random.RandomState(seed % 2**32)
+            self.generator = make_generator(int(self._sequence.randint(0, 2**31 - 1)))
+
+    def _child_seeds(self, n):
+        if SeedSequence is not None:
+            return self._sequence.spawn(n)
+        return [int(s) for s in self._sequence.randint(0, 2**31 - 1, n)]
+
+    def spawn(self, n):
+        """Return *n* child ``RandomStreams``, e.g. one per island."""
+        return [RandomStreams(s) for s in self._child_seeds(n)]
+
+    def worker_seeds(self, n):
+        """Return *n* picklable integer seeds, one per evaluation job."""
+        if SeedSequence is not None:
+            return [int(s.generate_state(1, np.uint64)[0]) for s in self._sequence.spawn(n)]
+        return self._child_seeds(n)
+
+    def uniform(self, shape):
+        """Return a block of uniform numbers in [0, 1) of the given *shape*."""
+        return self.generator.random(shape)
+
+    def integers(self, high, shape):
+        """Return a block of integers in [0, *high*) of the given *shape*."""
+        return self.generator.integers(0, high, shape)
+
+    def distinct_indices(self, n, k):
+        """Return an *n* by *k* array of population indices.
+
+        Row *i* holds *k* distinct indices from ``range(n)``, none of them
+        equal to *i*, as needed for the donor vectors of DE. Requires
+        ``k < n``.
+
+        Each row draws *k* indices and only the rows in which two of them
+        collide are drawn again, so the cost is O(n * k) as long as *k* is
+        at most half the population; beyond that, random keys are sorted
+        per row.
+
+        """
+        if k >= n:
+            raise ValueError('{0} distinct indices need more than {0} individuals, got {1}'.format(k, n))
+        rows = np.arange(n)[:, None]
+        if 2 * k > n - 1:
+            keys = self.generator.random((n, n))
+            keys[rows[:, 0], rows[:, 0]] = np.inf
+            # the k smallest keys of each row, in key order so that the
+            # position of an index in its row is random as well
+            chosen = np.argpartition(keys, k - 1, axis=1)[:, :k]
+            return chosen[rows, np.argsort(keys[rows, chosen], axis=1)]
+        # draw from the n - 1 indices other than the row's own
+        chosen = self.generator.integers(0, n - 1, (n, k))
+        chosen += chosen >= rows
+        redraw = rows[:, 0]
+        while k > 1:
+            ordered = np.sort(chosen[redraw], axis=1)
+            redraw = redraw[(ordered[:, 1:] == ordered[:, :-1]).any(axis=1)]
+            if not len(redraw):
+                break
+            fresh = self.generator.integers(0, n - 1, (len(redraw), k))
+            chosen[redraw] = fresh + (fresh >= redraw[:, None])
+        return chosen
+
+
+def run_streams(random, args):
+    """Return the ``RandomStreams`` of the run.
+
+    The streams are created on first use from the ``seed`` keyword
+    argument, or from *random* when it is not given, and cached in
+    ``args['_streams']``.
+
+    """
+    try:
+        return args['_streams']
+    except KeyError:
+        seed = args.get('seed')
+        if seed is None:
+            seed = random.randint(0, 2**63 - 1)
+        streams = RandomStreams(seed)
+        args['_streams'] = streams
+        return streams
+
+
+def np_random(random, args):
+    """Return the NumPy random generator of the run.
+
+    This is the main stream of ``run_streams``, so a run seeded through
+    the ``seed`` keyword argument or the engine's random number generator
+    stays reproducible.
+
+    """
+    return run_streams(random, args).generator
+
+
+def worker_random(args):
+    """Return the NumPy generator of an evaluation job.
+
+    Evaluators running under ``parallel_evaluation_mp`` receive their own
+    seed in ``args['mp_seed']``; elsewhere the run's main stream is used.
+
+    """
+    if 'mp_seed' in args:
+        return make_generator(args['mp_seed'])
+    if '_streams' in args:
+        return args['_streams'].generator
+    return make_generator(None)
@@ -3,31 +3,189 @@
             Based on inspyred.ec.replacers
     ===============================================
     -- replacer to be used with DEA when using one of the strategies
+    -- one-to-one survivor selection on fitness arrays
+    -- multi-chain simulated annealing and parallel tempering replacers
 
     original author: Aaron Garrett <aaron.lee.garrett@gmail.com>
 
     modified by: Andreas Tsichritzis <tsadreas@gmail.com>
 '''
 
+import numpy as np
+from custom_random import np_random
+
+
+def fitness_scores(individuals, maximize):
+    """Return the fitness of the individuals as an array in which larger is better.
+
+    ``None`` and NaN fitness values score ``-inf``, so they lose every
+    comparison.
+
+    .. Arguments:
+       individuals -- the list of individuals
+       maximize -- boolean if objective is maximization or not
+
+    """
+    score = np.array([ind.fitness for ind in individuals], dtype=float)
+    if not maximize:
+        score = -score
+    score[np.isnan(score)] = -np.inf
+    return score
+
+
+def greedy_mask(parent_scores, offspring_scores):
+    """Return a boolean array that is True where the offspring replaces its parent.
+
+    An offspring replaces its parent when it is at least as good, which
+    lets DE drift across plateaus; offspring without a fitness never do.
+
+    .. Arguments:
+       parent_scores -- the parent scores as returned by ``fitness_scores``
+       offspring_scores -- the offspring scores as returned by ``fitness_scores``
+
+    """
+    return (offspring_scores >= parent_scores) & (offspring_scores > -np.inf)
+
+
 def dea_replacer(random, population, parents, offspring, maximize, args):
-    """Replaces population with the best of the population and offspring.
-    
+    """Replaces each parent by its offspring if the offspring is not worse.
+
+    The parents and the offspring are compared one-to-one, by position,
+    on their fitness arrays. The boolean replacement mask is stored in
+    ``args['_success']`` and the fraction of offspring that replaced their
+    parent in the ``Success`` column of ``args['_statistics']``, where
+    adaptive parameter control and ``file_observer`` pick them up.
+
+    .. Arguments:
+       random -- the random number generator object
+       population -- the population of individuals
+       parents -- the list of parent individuals
+       offspring -- the list of offspring individuals
+       maximize -- boolean if objective is maximization or not
+       args -- a dictionary of keyword arguments
+
+    """
+    success = greedy_mask(fitness_scores(parents, maximize), fitness_scores(offspring, maximize))
+    args['_success'] = success
+    statistics = args.get('_statistics')
+    if statistics is not None:
+        statistics['Success'] = float(success.mean()) if len(success) else float('nan')
+    return [o if s else p for p, o, s in zip(parents, offspring, success)]
+
+
+def metropolis_mask(parent_scores, offspring_scores, temperature, rng):
+    """Return a boolean array that is True where the offspring is accepted.
+
+    Better offspring are always accepted and worse ones with probability
+    ``exp(delta / temperature)``. *temperature* may be a scalar or one
+    value per pair; at a temperature of 0 only improvements are accepted.
+
+    .. Arguments:
+       parent_scores -- the parent scores as returned by ``fitness_scores``
+       offspring_scores -- the offspring scores as returned by ``fitness_scores``
+       temperature -- the temperature(s)
+       rng -- the NumPy random generator
+
+    """
+    delta = offspring_scores - parent_scores
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        chance = np.exp(delta / temperature)
+    accept = (delta >= 0) | (rng.random(len(delta)) < chance)
+    return accept & (offspring_scores > -np.inf)
+
+
+def _temperature(args):
+    """Return the temperature of the generation, following inspyred's schedule."""
+    try:
+        temp = args['temperature']
+        cooling_rate = args['cooling_rate']
+        temp = temp * cooling_rate
+        args['temperature'] = temp
+    except KeyError:
+        try:
+            num_evals = args['_ec'].num_evaluations
+            max_evals = args['max_evaluations']
+            temp = float(max_evals - num_evals) / float(max_evals)
+        except KeyError:
+            num_gens = args['_ec'].num_generations
+            max_gens = args['max_generations']
+            temp = 1 - float(max_gens - num_gens) / float(max_gens)
+    return temp
+
+
+def sa_replacement(random, population, parents, offspring, args):
+    """Replaces each chain's state using the simulated annealing schedule.
+
+    This is ``inspyred.ec.replacers.simulated_annealing_replacement`` with
+    the acceptance test of all chains done on fitness arrays, so that any
+    number of chains advance in one step. The temperature follows the same
+    keyword arguments. Offspring without a fitness are rejected, so their
+    chain keeps its state. The fraction of accepted moves is reported in
+    the ``Accept`` column of ``args['_statistics']``.
+
+    .. Arguments:
+       random -- the random number generator object
+       population -- the population of individuals
+       parents -- the list of parent individuals
+       offspring -- the list of offspring individuals
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *temperature* -- the initial temperature
+    - *cooling_rate* -- a real-valued coefficient in the range (0, 1)
+      by which the temperature should be reduced
+
+    """
+    maximize = args['_ec'].maximize
+    parents = parents[:len(offspring)]
+    accept = metropolis_mask(fitness_scores(parents, maximize), fitness_scores(offspring, maximize),
+                             _temperature(args), np_random(random, args))
+    statistics = args.get('_statistics')
+    if statistics is not None:
+        statistics['Accept'] = float(accept.mean()) if len(accept) else float('nan')
+    return [o if a else p for p, o, a in zip(parents, offspring, accept)]
+
+
+def tempering_replacement(random, population, parents, offspring, args):
+    """Replaces the chains of a parallel tempering run.
+
+    Chain ``k`` runs at the fixed temperature ``args['_temperatures'][k]``
+    (coldest first) and accepts its offspring with the Metropolis rule;
+    offspring without a fitness are rejected.
+    Then neighbouring levels exchange their states with probability
+    ``min(1, exp((s[k+1] - s[k]) * (1/T[k] - 1/T[k+1])))``, where ``s`` is
+    the fitness with larger being better, alternating between the even
+    and the odd pairs of levels from one generation to the next. The
+    fractions of accepted moves and swaps are reported in the ``Accept``
+    and ``Swap`` columns of ``args['_statistics']``.
+
     .. Arguments:
        random -- the random number generator object
        population -- the population of individuals
        parents -- the list of parent individuals
        offspring -- the list of offspring individuals
-       maximize -- bootlean if objective is macimization or not
        args -- a dictionary of keyword arguments
-    
+
     """
-    psize = len(population)
-    for i in range(psize):
-        if maximize:
-            if abs(parents[i].fitness) > abs(offspring[i].fitness):
-                offspring[i] = parents[i]
-        else:
-            if abs(parents[i].fitness) < abs(offspring[i].fitness):
-                offspring[i] = parents[i] 
-    population = offspring
-    return population
+    ec = args['_ec']
+    rng = np_random(random, args)
+    temps = np.asarray(args['_temperatures'], dtype=float)[:len(offspring)]
+    parent_scores = fitness_scores(parents[:len(offspring)], ec.maximize)
+    offspring_scores = fitness_scores(offspring, ec.maximize)
+    accept = metropolis_mask(parent_scores, offspring_scores, temps, rng)
+    chains = [o if a else p for p, o, a in zip(parents, offspring, accept)]
+    score = np.where(accept, offspring_scores, parent_scores)
+
+    k = np.arange(ec.num_generations % 2, len(chains) - 1, 2)
+    with np.errstate(invalid='ignore', over='ignore'):
+        delta = (score[k + 1] - score[k]) * (1.0 / temps[k] - 1.0 / temps[k + 1])
+        swap = (delta >= 0) | (rng.random(len(k)) < np.exp(np.minimum(delta, 0)))
+    for i in k[swap]:
+        chains[i], chains[i + 1] = chains[i + 1], chains[i]
+
+    statistics = args.get('_statistics')
+    if statistics is not None:
+        statistics['Accept'] = float(accept.mean()) if len(accept) else float('nan')
+        statistics['Swap'] = float(swap.mean()) if len(swap) else float('nan')
+    return chains
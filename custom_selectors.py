@@ -0,0 +1,164 @@
+'''
+    ===============================================
+    Array-based selectors based on inspyred.ec.selectors
+    ===============================================
+
+    -- Rank, tournament, truncation and stochastic universal sampling
+       selection computed on the fitness vector with NumPy
+
+    author: Andreas Tsichritzis <tsadreas@gmail.com>
+'''
+
+import numpy as np
+from custom_random import np_random
+from custom_replacer import fitness_scores
+
+
+def rank_indices(score, num_selected, rng):
+    """Return the indices chosen by linear rank selection.
+
+    The worst individual has rank 1 and the best rank N; each index is
+    drawn with probability proportional to its rank.
+
+    .. Arguments:
+       score -- the fitness vector as returned by ``fitness_scores``
+       num_selected -- the number of indices to draw
+       rng -- the NumPy random generator
+
+    """
+    ranks = np.empty(len(score))
+    ranks[np.argsort(score, kind='mergesort')] = np.arange(1, len(score) + 1)
+    cumulative = np.cumsum(ranks)
+    return np.searchsorted(cumulative, rng.random(num_selected) * cumulative[-1], side='right')
+
+
+def tournament_indices(score, num_selected, tournament_size, rng):
+    """Return the winners of *num_selected* tournaments drawn with replacement.
+
+    .. Arguments:
+       score -- the fitness vector as returned by ``fitness_scores``
+       num_selected -- the number of tournaments
+       tournament_size -- the number of contestants per tournament
+       rng -- the NumPy random generator
+
+    """
+    contestants = rng.integers(0, len(score), (num_selected, tournament_size))
+    return contestants[np.arange(num_selected), np.argmax(score[contestants], axis=1)]
+
+
+def truncation_indices(score, num_selected):
+    """Return the indices of the *num_selected* best individuals, best first.
+
+    .. Arguments:
+       score -- the fitness vector as returned by ``fitness_scores``
+       num_selected -- the number of indices to return
+
+    """
+    num_selected = min(num_selected, len(score))
+    if num_selected < len(score):
+        best = np.argpartition(-score, num_selected - 1)[:num_selected]
+    else:
+        best = np.arange(len(score))
+    return best[np.argsort(-score[best], kind='mergesort')]
+
+
+def sus_indices(score, num_selected, rng):
+    """Return the indices chosen by stochastic universal sampling.
+
+    Selection is proportional to the fitness shifted so that the worst
+    individual has weight zero (uniform if all fitness values are equal).
+    Individuals without a fitness have weight zero as well. The indices
+    are returned in random order.
+
+    .. Arguments:
+       score -- the fitness vector as returned by ``fitness_scores``
+       num_selected -- the number of indices to draw
+       rng -- the NumPy random generator
+
+    """
+    valid = score > -np.inf
+    weights = np.zeros(len(score))
+    if valid.any():
+        weights[valid] = score[valid] - score[valid].min()
+    if not weights.any():
+        weights = valid.astype(float) if valid.any() else np.ones(len(score))
+    cumulative = np.cumsum(weights)
+    step = cumulative[-1] / num_selected
+    pointers = (rng.random() + np.arange(num_selected)) * step
+    indices = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(score) - 1)
+    return rng.permutation(indices)
+
+
+def rank_selection(random, population, args):
+    """Return individuals chosen by linear rank selection.
+
+    .. Arguments:
+       random -- the random number generator object
+       population -- the population of individuals
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *num_selected* -- the number of individuals to be selected (default 1)
+
+    """
+    num_selected = args.setdefault('num_selected', 1)
+    score = fitness_scores(population, args['_ec'].maximize)
+    return [population[i] for i in rank_indices(score, num_selected, np_random(random, args))]
+
+
+def tournament_selection(random, population, args):
+    """Return individuals chosen by tournament selection.
+
+    .. Arguments:
+       random -- the random number generator object
+       population -- the population of individuals
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *num_selected* -- the number of individuals to be selected (default 1)
+    - *tournament_size* -- the tournament size (default 2)
+
+    """
+    num_selected = args.setdefault('num_selected', 1)
+    tournament_size = args.setdefault('tournament_size', 2)
+    score = fitness_scores(population, args['_ec'].maximize)
+    return [population[i] for i in tournament_indices(score, num_selected, tournament_size, np_random(random, args))]
+
+
+def truncation_selection(random, population, args):
+    """Return the best individuals of the population, best first.
+
+    .. Arguments:
+       random -- the random number generator object
+       population -- the population of individuals
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *num_selected* -- the number of individuals to be selected
+      (default len(population))
+
+    """
+    num_selected = args.setdefault('num_selected', len(population))
+    score = fitness_scores(population, args['_ec'].maximize)
+    return [population[i] for i in truncation_indices(score, num_selected)]
+
+
+def sus_selection(random, population, args):
+    """Return individuals chosen by stochastic universal sampling.
+
+    .. Arguments:
+       random -- the random number generator object
+       population -- the population of individuals
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *num_selected* -- the number of individuals to be selected (default 1)
+
+    """
+    num_selected = args.setdefault('num_selected', 1)
+    score = fitness_scores(population, args['_ec'].maximize)
+    return [population[i] for i in sus_indices(score, num_selected, np_random(random, args))]
@@ -0,0 +1,209 @@
+'''
+    ===============================================
+    Incremental fitness and response statistics
+    ===============================================
+
+    -- Per-generation worst/best/mean/std/quantiles of the fitness and of
+       every tracked response, computed on one array per generation
+    -- Run-wide moments merged batch by batch and run-wide quantiles from
+       a bounded-size sketch
+    -- Computed once per generation and shared by all observers and
+       terminators through population_statistics
+
+    author: Andreas Tsichritzis <tsadreas@gmail.com>
+'''
+
+from collections import OrderedDict
+import warnings
+import numpy as np
+
+
+def _as_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+class Moments(object):
+    """Count, mean, variance, minimum and maximum of a stream of values.
+
+    Values are added in batches; each batch is reduced with NumPy and
+    merged into the running totals with the pairwise update of Chan et al.,
+    so the result matches a single pass over all values.
+
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = float('nan')
+        self.m2 = 0.0
+        self.min = float('nan')
+        self.max = float('nan')
+
+    def add(self, values):
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if not n:
+            return
+        mean = float(values.mean())
+        m2 = float(((values - mean) ** 2).sum())
+        if not self.count:
+            self.count, self.mean, self.m2 = n, mean, m2
+            self.min, self.max = float(values.min()), float(values.max())
+            return
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    @property
+    def std(self):
+        return (self.m2 / self.count) ** 0.5 if self.count else float('nan')
+
+
+class QuantileSketch(object):
+    """Approximate quantiles of a stream of values in bounded memory.
+
+    The sketch keeps at most *size* weighted points. Every batch is merged
+    into them with one sort, and when there are more than *size* points
+    they are replaced by *size* points of equal weight at evenly spaced
+    ranks, so the rank error stays around ``1 / size``.
+
+    """
+    def __init__(self, size=1000):
+        self.size = size
+        self.values = np.empty(0)
+        self.weights = np.empty(0)
+        self.total = 0.0
+
+    def add(self, values):
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        v = np.concatenate((self.values, values))
+        w = np.concatenate((self.weights, np.ones(len(values))))
+        order = np.argsort(v, kind='mergesort')
+        v, w = v[order], w[order]
+        self.total += len(values)
+        if len(v) > self.size:
+            ranks = (np.arange(self.size) + 0.5) * (self.total / self.size)
+            index = np.minimum(np.searchsorted(np.cumsum(w), ranks), len(v) - 1)
+            v = v[index]
+            w = np.full(self.size, self.total / self.size)
+        self.values, self.weights = v, w
+
+    def quantile(self, q):
+        """Return the *q* quantile (0 <= q <= 1) of the values seen so far."""
+        if not self.total:
+            return float('nan')
+        cumulative = np.cumsum(self.weights) - self.weights / 2.0
+        return float(np.interp(q * self.total, cumulative, self.values))
+
+
+class RunningStatistics(object):
+    """Per-generation and run-wide statistics of the fitness and the responses.
+
+    ``update`` turns the fitness and the responses of a population into
+    one array and computes the statistics of all of them at once. The
+    results are dictionaries keyed by ``'fitness'`` and by response name:
+
+    - ``generation[name]`` -- ``count``, ``min``, ``max``, ``mean``,
+      ``std``, ``median`` and one ``q<percent>`` entry per quantile of the
+      current population; for the fitness also ``best`` and ``worst``
+    - ``run[name]`` -- the same over every individual observed so far,
+      from ``Moments`` and ``QuantileSketch``; for the fitness ``best``
+      and ``worst`` are the best and worst values seen
+
+    The standard deviation is the population standard deviation, as in
+    ``inspyred.ec.analysis.fitness_statistics``.
+
+    Public Attributes:
+
+    - *names* -- ``'fitness'`` followed by the response names
+    - *quantiles* -- the quantiles tracked besides the median
+    - *generation* -- the statistics of the last population
+    - *run* -- the statistics of the run so far
+
+    """
+    def __init__(self, responses=(), quantiles=(0.25, 0.75), sketch_size=1000):
+        self.names = ['fitness'] + list(responses)
+        self.quantiles = tuple(quantiles)
+        self.generation = OrderedDict()
+        self.run = OrderedDict()
+        self.key = None
+        self._moments = [Moments() for _ in self.names]
+        self._sketches = [QuantileSketch(sketch_size) for _ in self.names]
+
+    def _label(self, q):
+        return 'q{0:g}'.format(100 * q)
+
+    def update(self, population, maximize=True):
+        """Add the statistics of *population*."""
+        responses = self.names[1:]
+        values = np.array([[_as_float(p.fitness)] + [_as_float((p.responses or {}).get(r)) for r in responses]
+                           for p in population], dtype=float).reshape(len(population), len(self.names))
+        quantiles = (0.5,) + self.quantiles
+        # columns without any value give nan, without the warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            count = (~np.isnan(values)).sum(axis=0)
+            low = np.nanmin(values, axis=0)
+            high = np.nanmax(values, axis=0)
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0)
+            q = np.nanpercentile(values, [100 * x for x in quantiles], axis=0)
+
+        for j, name in enumerate(self.names):
+            stats = OrderedDict([('count', int(count[j])), ('min', float(low[j])), ('max', float(high[j])),
+                                 ('mean', float(mean[j])), ('std', float(std[j])), ('median', float(q[0, j]))])
+            for k, x in enumerate(self.quantiles):
+                stats[self._label(x)] = float(q[k + 1, j])
+            self._moments[j].add(values[:, j])
+            self._sketches[j].add(values[:, j])
+            moments, sketch = self._moments[j], self._sketches[j]
+            run = OrderedDict([('count', moments.count), ('min', moments.min), ('max', moments.max),
+                               ('mean', moments.mean), ('std', moments.std), ('median', sketch.quantile(0.5))])
+            for x in self.quantiles:
+                run[self._label(x)] = sketch.quantile(x)
+            if j == 0:
+                for s in (stats, run):
+                    s['best'], s['worst'] = (s['max'], s['min']) if maximize else (s['min'], s['max'])
+            self.generation[name] = stats
+            self.run[name] = run
+
+
+def population_statistics(population, num_generations, num_evaluations, args):
+    """Return the ``RunningStatistics`` of the run, updated for this generation.
+
+    The statistics are created on first use, tracking the responses in
+    *res*, and kept in ``args['_running_statistics']``. They are computed
+    once per generation, however many observers and terminators ask for
+    them.
+
+    .. Arguments:
+       population -- the population of Individuals
+       num_generations -- the number of elapsed generations
+       num_evaluations -- the number of candidate solution evaluations
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *res* -- the names of the responses to track (default none)
+    - *statistics_quantiles* -- the quantiles tracked besides the median
+      (default (0.25, 0.75))
+
+    """
+    try:
+        stats = args['_running_statistics']
+    except KeyError:
+        stats = RunningStatistics(args.get('res', ()), args.get('statistics_quantiles', (0.25, 0.75)))
+        args['_running_statistics'] = stats
+    key = (num_generations, num_evaluations)
+    if stats.key != key:
+        ec = args.get('_ec')
+        stats.update(population, ec.maximize if ec is not None else True)
+        stats.key = key
+    return stats
@@ -1,125 +1,497 @@
-"""
-    ===============================================
-    Changed version of inspyred.ec.terminators
-    ===============================================
-    
-    -- Fixes user_termination
-    -- Addes convergence_termination
-
-    original author: Aaron Garrett <aaron.lee.garrett@gmail.com>
-
-    modified by: Andreas Tsichritzis <tsadreas@gmail.com>
-"""
-
-import itertools
-import sys
-import time
-import csv
-from collections import defaultdict
-
-
-
-def user_termination(population, num_generations, num_evaluations, args):
-    """Return True if user presses the ESC key when prompted.
-
-    This function prompts the user to press the ESC key to terminate the
-    evolution. The prompt persists for a specified number of seconds before
-    evolution continues. Additionally, the function can be customized to
-    allow any press of the ESC key to be stored until the next time this
-    function is called.
-
-    .. note::
-
-       This function makes use of the ``msvcrt`` (Windows) and ``curses``
-       (Unix) libraries. Other systems may not be supported.
-
-    .. Arguments:
-       population -- the population of Individuals
-       num_generations -- the number of elapsed generations
-       num_evaluations -- the number of candidate solution evaluations
-       args -- a dictionary of keyword arguments
-
-    Optional keyword arguments in args:
-
-    - *termination_response_timeout* -- the number of seconds to wait for
-      the user to press the ESC key (default 5)
-    - *clear_termination_buffer* -- whether the keyboard buffer should be
-      cleared before allowing the user to press a key (default True)
-
-    """
-    def getch():
-        unix = ('darwin', 'linux2')
-        if sys.platform not in unix:
-            try:
-                import msvcrt
-            except ImportError:
-                return -1
-            if msvcrt.kbhit():
-                return msvcrt.getch()
-            else:
-                return -1
-        elif sys.platform in unix:
-            def _getch(stdscr):
-                stdscr.nodelay(1)
-                ch = stdscr.getch()
-                stdscr.nodelay(0)
-                return ch
-            import curses
-            return curses.wrapper(_getch)
-
-    num_secs = args.get('termination_response_timeout', 5)
-    clear_buffer = args.get('clear_termination_buffer', True)
-    if clear_buffer:
-        while getch() > -1:
-            pass
-    sys.stdout.write('Press ESC to terminate (%d secs):' % num_secs)
-    count = 1
-    start = time.time()
-    while time.time() - start < num_secs:
-        ch = getch()
-        if ch > -1 and ch == 27:
-            sys.stdout.write('\n\n')
-            return True
-        elif time.time() - start == count:
-            sys.stdout.write('.')
-            count += 1
-    sys.stdout.write('\n')
-    return False
-
-
-
-def convergence_termination(population, num_generations, num_evaluations, args):
-    """Return True if criteria are fulfilled.
-
-    .. Arguments:
-       population -- the population of Individuals
-       num_generations -- the number of elapsed generations
-       num_evaluations -- the number of candidate solution evaluations
-       args -- a dictionary of keyword arguments
-
-    """
-    filename = args.get('statistics_file_name')
-    columns = defaultdict(list)
-    with open(filename) as f:
-        reader = csv.DictReader(f,skipinitialspace=True)
-        for row in reader: 
-            for (k,v) in row.items(): 
-                columns[k].append(v)
-    fit = []
-    for i in range(len(columns.get('Best Fit'))):
-        fit.append(float(columns.get('Best Fit')[i]))
-    if len(fit) > 3 and abs(fit[-1] - fit[-2]) <= abs(fit[-1]*args.get('tol')):
-        if args.get('c_maximize'):
-            if fit[-1] >= fit[-2] and fit[-1]>= max(fit):
-                stop = True
-            else:
-                stop = False
-        else:
-            if fit[-1] <= fit[-2] and fit[-1]<= min(fit):
-                stop = True
-            else:
-                stop = False
-    else:
-        stop = False
-    return stop
-
+"""
+    ===============================================
+    Changed version of inspyred.ec.terminators
+    ===============================================
+    
+    -- Fixes user_termination
+    -- Non-blocking control channel (signals and control file)
+    -- Wall-clock budget terminator with generation time forecasting
+    -- Target fitness terminator recording the evaluations to target
+    -- Addes convergence_termination, checked on an in-memory history
+
+    original author: Aaron Garrett <aaron.lee.garrett@gmail.com>
+
+    modified by: Andreas Tsichritzis <tsadreas@gmail.com>
+"""
+
+import itertools
+import os
+import signal
+import sys
+import threading
+import time
+from collections import deque
+import numpy as np
+import custom_statistics
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+
+
+def user_termination(population, num_generations, num_evaluations, args):
+    """Return True if user presses the ESC key when prompted.
+
+    This function prompts the user to press the ESC key to terminate the
+    evolution. The prompt persists for a specified number of seconds before
+    evolution continues. Additionally, the function can be customized to
+    allow any press of the ESC key to be stored until the next time this
+    function is called.
+
+    .. note::
+
+       This function makes use of the ``msvcrt`` (Windows) and ``curses``
+       (Unix) libraries. Other systems may not be supported.
+
+    .. Arguments:
+       population -- the population of Individuals
+       num_generations -- the number of elapsed generations
+       num_evaluations -- the number of candidate solution evaluations
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *termination_response_timeout* -- the number of seconds to wait for
+      the user to press the ESC key (default 5)
+    - *clear_termination_buffer* -- whether the keyboard buffer should be
+      cleared before allowing the user to press a key (default True)
+
+    .. note::
+
+       This function waits up to *termination_response_timeout* seconds
+       every generation; ``control_termination`` stops a run without
+       waiting.
+
+    """
+    def getch():
+        unix = sys.platform.startswith(('linux', 'darwin'))
+        if not unix:
+            try:
+                import msvcrt
+            except ImportError:
+                return -1
+            if msvcrt.kbhit():
+                return msvcrt.getch()
+            else:
+                return -1
+        else:
+            def _getch(stdscr):
+                stdscr.nodelay(1)
+                ch = stdscr.getch()
+                stdscr.nodelay(0)
+                return ch
+            import curses
+            return curses.wrapper(_getch)
+
+    num_secs = args.get('termination_response_timeout', 5)
+    clear_buffer = args.get('clear_termination_buffer', True)
+    if clear_buffer:
+        while getch() > -1:
+            pass
+    sys.stdout.write('Press ESC to terminate (%d secs):' % num_secs)
+    count = 1
+    start = time.time()
+    while time.time() - start < num_secs:
+        ch = getch()
+        if ch > -1 and ch == 27:
+            sys.stdout.write('\n\n')
+            return True
+        elif time.time() - start == count:
+            sys.stdout.write('.')
+            count += 1
+    sys.stdout.write('\n')
+    return False
+
+
+
+class ControlChannel(object):
+    """Out-of-band commands for a running evolution.
+
+    Commands arrive through signals and through a control file and are
+    queued until the next call of ``control_termination``; neither
+    source is polled by the generation loop itself.
+
+    - ``SIGINT`` (Ctrl-C) -- stop after the current generation; a second
+      ``SIGINT`` raises ``KeyboardInterrupt`` as usual
+    - ``SIGUSR1`` -- write a checkpoint
+    - control file -- a background thread checks every *poll_interval*
+      seconds whether the file exists, reads one command per line and
+      deletes it: ``stop``, ``checkpoint`` or ``<keyword> <value>`` to
+      change a numeric keyword argument such as ``max_evaluations``
+
+    The control file should be written under another name and renamed,
+    so that it is never read half-written. Signal handlers can only be
+    installed from the main thread; elsewhere only the file is watched.
+
+    """
+    def __init__(self, control_file=None, poll_interval=1.0, signals=True):
+        self.control_file = control_file
+        self.poll_interval = poll_interval
+        self.signals = signals
+        self.commands = deque()
+        self._handlers = {}
+        self._closed = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.signals and threading.current_thread().name == 'MainThread':
+            for name, handler in (('SIGINT', self._on_interrupt), ('SIGUSR1', self._on_checkpoint)):
+                signum = getattr(signal, name, None)
+                if signum is not None:
+                    self._handlers[signum] = signal.signal(signum, handler)
+        if self.control_file is not None:
+            self._thread = threading.Thread(target=self._watch, name='control-file-watcher')
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Restore the signal handlers and stop watching the control file."""
+        self._closed.set()
+        for signum, handler in self._handlers.items():
+            signal.signal(signum, handler)
+        self._handlers = {}
+
+    def pending(self):
+        """Remove and return the queued commands."""
+        commands = []
+        while self.commands:
+            commands.append(self.commands.popleft())
+        return commands
+
+    def _on_interrupt(self, signum, frame):
+        if ('stop',) in self.commands:
+            raise KeyboardInterrupt
+        self.commands.append(('stop',))
+
+    def _on_checkpoint(self, signum, frame):
+        self.commands.append(('checkpoint',))
+
+    def _watch(self):
+        while not self._closed.wait(self.poll_interval):
+            if not os.path.exists(self.control_file):
+                continue
+            taken = self.control_file + '.read'
+            try:
+                os.rename(self.control_file, taken)
+                with open(taken) as f:
+                    lines = f.read().splitlines()
+                os.remove(taken)
+            except (IOError, OSError):
+                continue
+            for line in lines:
+                command = self._parse(line)
+                if command is not None:
+                    self.commands.append(command)
+
+    def _parse(self, line):
+        words = line.split()
+        if words in (['stop'], ['checkpoint']):
+            return (words[0],)
+        if len(words) == 2:
+            try:
+                value = float(words[1])
+            except ValueError:
+                return None
+            return ('set', words[0], int(value) if value.is_integer() else value)
+        return None
+
+
+def write_checkpoint(population, num_generations, num_evaluations, args):
+    """Pickle the state of the population to *checkpoint_file*.
+
+    The file holds a dictionary with the generation, the number of
+    evaluations and the candidate, fitness and responses of every
+    individual. It is replaced atomically.
+
+    Optional keyword arguments in args:
+
+    - *checkpoint_file* -- the file name (default 'inspyred-checkpoint.pkl')
+
+    """
+    filename = args.get('checkpoint_file', 'inspyred-checkpoint.pkl')
+    state = {'num_generations': num_generations,
+             'num_evaluations': num_evaluations,
+             'population': [(p.candidate, p.fitness, getattr(p, 'responses', None)) for p in population]}
+    with open(filename + '.tmp', 'wb') as f:
+        pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+    getattr(os, 'replace', os.rename)(filename + '.tmp', filename)
+
+
+def control_termination(population, num_generations, num_evaluations, args):
+    """Return True if a stop command was received through the control channel.
+
+    The ``ControlChannel`` (kept in ``args['_control']``) is opened by the
+    EC when the evolution starts, before the initial population is
+    evaluated, so commands sent during that phase are queued and acted on
+    at the first check; without an EC that does so it is opened by the
+    first call. While no command is queued, a call costs one check of the
+    queue. A
+    ``stop`` command ends the evolution, ``checkpoint`` calls the
+    *checkpoint* function and ``<keyword> <value>`` sets that keyword
+    argument, so e.g. ``max_evaluations 5000`` changes the budget of
+    ``evaluation_termination``.
+
+    .. Arguments:
+       population -- the population of Individuals
+       num_generations -- the number of elapsed generations
+       num_evaluations -- the number of candidate solution evaluations
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *control_file* -- the control file to watch (default None, signals
+      only)
+    - *control_poll_interval* -- seconds between checks of the control file
+      (default 1)
+    - *checkpoint* -- the function called for a checkpoint, with the
+      signature of an observer (default ``write_checkpoint``)
+
+    """
+    channel = open_control(args)
+    if not channel.commands:
+        return False
+
+    logger = args['_ec'].logger
+    stop = False
+    for command in channel.pending():
+        if command[0] == 'stop':
+            stop = True
+        elif command[0] == 'checkpoint':
+            args.get('checkpoint', write_checkpoint)(population, num_generations, num_evaluations, args)
+        else:
+            args[command[1]] = command[2]
+        logger.info('control command {0} at generation {1}'.format(' '.join(str(c) for c in command), num_generations))
+    if stop:
+        close_control(args)
+    return stop
+
+
+def open_control(args):
+    """Return the control channel of the run, starting it if needed.
+
+    The channel is configured by the *control_file* and
+    *control_poll_interval* keyword arguments of ``control_termination``.
+
+    """
+    try:
+        return args['_control']
+    except KeyError:
+        channel = ControlChannel(args.get('control_file'), args.get('control_poll_interval', 1.0)).start()
+        args['_control'] = channel
+        return channel
+
+
+def close_control(args):
+    """Close the control channel started by ``control_termination``, if any."""
+    channel = args.pop('_control', None)
+    if channel is not None:
+        channel.close()
+
+
+class _GenerationTimer(object):
+    """Running mean and variance of the wall-clock time of a generation."""
+    def __init__(self, start, smoothing):
+        self.last_call = start
+        self.smoothing = smoothing
+        self.last = None
+        self.mean = None
+        self.var = 0.0
+
+    def add(self, now):
+        duration = now - self.last_call
+        self.last_call = now
+        self.last = duration
+        if self.mean is None:
+            self.mean = duration
+        else:
+            # exponentially weighted mean and variance
+            delta = duration - self.mean
+            self.mean += self.smoothing * delta
+            self.var = (1 - self.smoothing) * (self.var + self.smoothing * delta * delta)
+
+    def forecast(self, sigmas):
+        return max(self.last, self.mean + sigmas * self.var ** 0.5)
+
+
+def time_budget_termination(population, num_generations, num_evaluations, args):
+    """Return True if another generation would not finish within the time budget.
+
+    The wall-clock time of every generation (selection to observation,
+    including the evaluations) is measured between calls; the first
+    "generation" is the creation and evaluation of the initial population.
+    The duration of the next generation is forecast from an exponentially
+    weighted mean and standard deviation of the past ones (never less than
+    the last one), and the evolution stops when the forecast would run
+    past the deadline, so the run ends cleanly instead of being killed in
+    the middle of a generation. The forecast is stored in
+    ``args['time_forecast']``.
+
+    .. Arguments:
+       population -- the population of Individuals
+       num_generations -- the number of elapsed generations
+       num_evaluations -- the number of candidate solution evaluations
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args (one of *max_time* and *deadline*
+    is required):
+
+    - *max_time* -- the time budget in seconds, counted from *start_time*
+    - *deadline* -- the absolute deadline, as a ``time.time()`` value
+    - *start_time* -- the start of the run (default set by the EC when the
+      evolution starts)
+    - *forecast_sigmas* -- the number of standard deviations added to the
+      mean generation time (default 2)
+    - *forecast_smoothing* -- the weight of the latest generation in the
+      running mean (default 0.3)
+
+    """
+    now = time.time()
+    start_time = args.setdefault('start_time', now)
+    try:
+        timer = args['_generation_timer']
+    except KeyError:
+        timer = _GenerationTimer(start_time, args.setdefault('forecast_smoothing', 0.3))
+        args['_generation_timer'] = timer
+    timer.add(now)
+
+    deadline = args.get('deadline')
+    if deadline is None:
+        deadline = start_time + args['max_time']
+    forecast = timer.forecast(args.setdefault('forecast_sigmas', 2))
+    args['time_forecast'] = forecast
+    if now + forecast > deadline:
+        args['_ec'].logger.debug('time_budget_termination: {0:.1f} s left, next generation forecast at {1:.1f} s'.format(deadline - now, forecast))
+        return True
+    return False
+
+
+def target_termination(population, num_generations, num_evaluations, args):
+    """Return True if the best fitness so far is within *target_epsilon* of the target.
+
+    The target is usually the ``optimum_value`` of a benchmark problem.
+    The check is made once per generation on the shared population
+    statistics, so the number of evaluations and the time it took to reach
+    the target are those at the end of the generation in which it was
+    first reached. They are stored in ``args['evaluations_to_target']`` and
+    ``args['time_to_target']`` (seconds from *start_time*). Without a
+    *target_fitness* the terminator never stops the evolution.
+
+    .. Arguments:
+       population -- the population of Individuals
+       num_generations -- the number of elapsed generations
+       num_evaluations -- the number of candidate solution evaluations
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *target_fitness* -- the fitness to reach (default None)
+    - *target_epsilon* -- the absolute tolerance on the target (default 1e-4)
+
+    """
+    target = args.get('target_fitness')
+    if target is None:
+        return False
+    epsilon = args.setdefault('target_epsilon', 1e-4)
+    best = custom_statistics.population_statistics(population, num_generations, num_evaluations, args).run['fitness']['best']
+    # a fitness beyond the target counts as reaching it
+    gap = target - best if args['_ec'].maximize else best - target
+    if not gap <= epsilon:
+        return False
+    if 'evaluations_to_target' not in args:
+        args['evaluations_to_target'] = num_evaluations
+        args['time_to_target'] = time.time() - args.setdefault('start_time', time.time())
+        args['_ec'].logger.debug('target_termination: target {0} reached after {1} evaluations'.format(target, num_evaluations))
+    return True
+
+
+class _ConvergenceHistory(object):
+    """The best fitness so far over a sliding window of generations."""
+    def __init__(self, window):
+        self.window = deque(maxlen=window + 1)
+        self.best = None
+
+    def add(self, best, num_evaluations):
+        # best-so-far as a score in which larger is better
+        self.best = best if self.best is None else max(self.best, best)
+        self.window.append((self.best, num_evaluations))
+
+    @property
+    def full(self):
+        return len(self.window) == self.window.maxlen
+
+
+def convergence_termination(population, num_generations, num_evaluations, args):
+    """Return True if the search has converged.
+
+    The best fitness so far is kept in memory over a window of the last
+    *stall_generations* generations, so every check takes constant time.
+    The evolution ends as soon as one of the enabled criteria holds:
+
+    - stall -- the best fitness improved by no more than
+      ``atol + tol * |best|`` over the window (enabled by *tol* or *atol*)
+    - improvement rate -- the best fitness improved by less than
+      *min_improvement_rate* per evaluation over the window
+    - diversity -- the mean standard deviation of the candidate values
+      across the population fell below *min_diversity*
+
+    No criterion is checked before *min_generations* generations. The
+    criterion that ended the run is stored in ``args['convergence_cause']``.
+    The direction of the optimization is taken from the EC.
+
+    .. Arguments:
+       population -- the population of Individuals
+       num_generations -- the number of elapsed generations
+       num_evaluations -- the number of candidate solution evaluations
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *tol* -- the relative tolerance of the stall criterion (default None)
+    - *atol* -- the absolute tolerance of the stall criterion (default None)
+    - *stall_generations* -- the number of generations in the window
+      (default 1)
+    - *min_improvement_rate* -- the improvement per evaluation below which
+      the search is stalled (default None)
+    - *min_diversity* -- the population diversity below which the search has
+      converged (default None)
+    - *min_generations* -- the number of generations before any criterion is
+      checked (default 3)
+
+    """
+    maximize = args['_ec'].maximize
+    window = args.setdefault('stall_generations', 1)
+    try:
+        history = args['_convergence_history']
+    except KeyError:
+        history = _ConvergenceHistory(window)
+        args['_convergence_history'] = history
+
+    best = custom_statistics.population_statistics(population, num_generations, num_evaluations, args).generation['fitness']['best']
+    if best == best:
+        history.add(best if maximize else -best, num_evaluations)
+    if num_generations < args.setdefault('min_generations', 3) or not history.full:
+        return False
+
+    (old_best, old_evaluations), (new_best, new_evaluations) = history.window[0], history.window[-1]
+    improvement = new_best - old_best
+    cause = None
+    tol = args.get('tol')
+    atol = args.get('atol')
+    if (tol is not None or atol is not None) and improvement <= (atol or 0) + (tol or 0) * abs(new_best):
+        cause = 'stall'
+    rate = args.get('min_improvement_rate')
+    if cause is None and rate is not None and new_evaluations > old_evaluations:
+        if improvement / float(new_evaluations - old_evaluations) < rate:
+            cause = 'improvement rate'
+    min_diversity = args.get('min_diversity')
+    if cause is None and min_diversity is not None:
+        candidates = np.asarray([p.candidate for p in population], dtype=float)
+        if len(candidates) > 1 and candidates.std(axis=0).mean() < min_diversity:
+            cause = 'diversity'
+    if cause is not None:
+        args['convergence_cause'] = cause
+        args['_ec'].logger.debug('convergence_termination: {0} criterion met at generation {1}'.format(cause, num_generations))
+        return True
+    return False
@@ -0,0 +1,103 @@
+'''
+    ===============================================
+    Binary columnar trajectory log
+    ===============================================
+
+    -- Every individual of every generation as one float64 record
+       (generation, index, candidate, fitness, responses) in a ``.npy``
+       file with named fields
+    -- Appended in chunks, one per generation, with the header updated
+       after each chunk so the file can be read while the run goes on
+    -- Read back with numpy.load(..., mmap_mode='r')
+
+    author: Andreas Tsichritzis <tsadreas@gmail.com>
+'''
+
+import struct
+import numpy as np
+
+_MAGIC = b'\x93NUMPY'
+# room for the largest row count in the shape of the header
+_SHAPE_DIGITS = 20
+
+
+def _as_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+class TrajectoryWriter(object):
+    """Appends generations of individuals to a ``.npy`` trajectory file.
+
+    The file holds a one-dimensional array of records with one float64
+    field per column: ``Gen``, ``Ind``, one field per parameter,
+    ``Fitness`` and one field per response, so the column names travel
+    with the data. The header is written with a fixed length and is
+    rewritten with the new number of rows after every chunk; the file is
+    opened only while a chunk is appended, so there is nothing to close
+    at the end of the run.
+
+    Public Attributes:
+
+    - *filename* -- the name of the trajectory file
+    - *dtype* -- the record type of the rows
+    - *rows* -- the number of rows written so far
+
+    """
+    def __init__(self, filename, parameters, responses=()):
+        self.filename = filename
+        self.parameters = list(parameters)
+        self.responses = list(responses)
+        names = ['Gen', 'Ind'] + self.parameters + ['Fitness'] + self.responses
+        self.dtype = np.dtype([(str(n), '<f8') for n in names])
+        self.rows = 0
+        with open(self.filename, 'wb') as f:
+            f.write(self._header())
+
+    def _header(self):
+        header = "{{'descr': {0!r}, 'fortran_order': False, 'shape': ({1},), }}".format(
+            np.lib.format.dtype_to_descr(self.dtype), self.rows)
+        fixed = len(header) - len(str(self.rows)) + _SHAPE_DIGITS
+        if fixed + 11 < 2**16:
+            version, size = b'\x01\x00', struct.pack('<H', 0)
+        else:
+            version, size = b'\x02\x00', struct.pack('<I', 0)
+        prefix = len(_MAGIC) + len(version) + len(size)
+        # pad with spaces so the data starts on a 64-byte boundary
+        total = -(-(prefix + fixed + 1) // 64) * 64
+        header = header.ljust(total - prefix - 1) + '\n'
+        size = struct.pack('<H' if version == b'\x01\x00' else '<I', len(header))
+        return _MAGIC + version + size + header.encode('latin1')
+
+    def append(self, num_generations, population):
+        """Append one generation of *population* as a chunk of rows."""
+        chunk = np.empty(len(population), dtype=self.dtype)
+        values = chunk.view('<f8').reshape(len(population), len(self.dtype.names))
+        values[:, 0] = num_generations
+        values[:, 1] = np.arange(len(population))
+        n = len(self.parameters)
+        for i, p in enumerate(population):
+            values[i, 2:2 + n] = [_as_float(c) for c in p.candidate]
+            values[i, 2 + n] = _as_float(p.fitness)
+            responses = p.responses or {}
+            values[i, 3 + n:] = [_as_float(responses.get(r)) for r in self.responses]
+        with open(self.filename, 'r+b') as f:
+            f.seek(0, 2)
+            f.write(chunk.tobytes())
+            self.rows += len(chunk)
+            f.seek(0)
+            f.write(self._header())
+
+
+def read_trajectory(filename):
+    """Return the rows of a trajectory file as a read-only memory map.
+
+    The result is a record array; ``rows['Fitness']`` or
+    ``rows[parameter]`` give the columns and
+    ``rows[rows['Gen'] == g]`` the individuals of generation *g*, without
+    reading the whole file into memory.
+
+    """
+    return np.load(filename, mmap_mode='r')
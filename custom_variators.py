@@ -0,0 +1,289 @@
+'''
+    ===============================================
+    Array-based variators based on inspyred.ec.variators
+    ===============================================
+
+    -- Crossovers and mutations that transform the whole offspring
+       matrix at once instead of looping over candidates and genes
+
+    author: Andreas Tsichritzis <tsadreas@gmail.com>
+'''
+
+import numpy as np
+from custom_ec import bound_candidates
+from custom_random import np_random
+
+
+def _bounds(args, num_genes):
+    """Return the lower and upper bounds of the EC's bounder as arrays."""
+    bounder = args['_ec'].bounder
+    if hasattr(bounder, 'bounds'):
+        return bounder.bounds(num_genes)
+    lower = getattr(bounder, 'lower_bound', None)
+    upper = getattr(bounder, 'upper_bound', None)
+    if lower is None or upper is None:
+        return np.full(num_genes, -np.inf), np.full(num_genes, np.inf)
+    lower = np.array([lo for lo, _ in zip(lower, range(num_genes))], dtype=float)
+    upper = np.array([hi for hi, _ in zip(upper, range(num_genes))], dtype=float)
+    return lower, upper
+
+
+def _bound(offspring, args, parents):
+    return bound_candidates(args['_ec'].bounder, offspring, args, parents)
+
+
+def _pairs(candidates):
+    """Split the candidates into the parent matrices of the mating pairs.
+
+    Mothers are the even and fathers the odd candidates, as in inspyred. If
+    the number of candidates is odd, the last one is passed on unchanged.
+
+    """
+    parents = np.array(candidates, dtype=float)
+    num_pairs = len(parents) // 2
+    return parents, parents[0:2*num_pairs:2], parents[1:2*num_pairs:2]
+
+
+def _recombine(parents, moms, dads, mask):
+    """Swap the genes selected by *mask* between mothers and fathers."""
+    offspring = parents.copy()
+    offspring[0:2*len(moms):2] = np.where(mask, dads, moms)
+    offspring[1:2*len(moms):2] = np.where(mask, moms, dads)
+    return offspring
+
+
+def _mating(rng, num_pairs, args):
+    crossover_rate = float(args.setdefault('crossover_rate', 1.0))
+    return rng.random(num_pairs) < crossover_rate
+
+
+def n_point_crossover(random, candidates, args):
+    """Return the offspring of n-point crossover on the candidates.
+
+    Each pair of parents crosses with probability *crossover_rate*; the
+    crossover points of all pairs are drawn and applied in one step.
+
+    .. Arguments:
+       random -- the random number generator object
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *crossover_rate* -- the rate at which crossover is performed
+      (default 1.0)
+    - *num_crossover_points* -- the number of crossover points used
+      (default 1)
+
+    """
+    rng = np_random(random, args)
+    parents, moms, dads = _pairs(candidates)
+    num_pairs, num_genes = moms.shape
+    if num_pairs == 0 or num_genes < 2:
+        return _bound(parents, args, parents)
+    num_points = min(args.setdefault('num_crossover_points', 1), num_genes - 1)
+    points = np.argsort(rng.random((num_pairs, num_genes - 1)), axis=1)[:, :num_points] + 1
+    crossings = (np.arange(num_genes)[None, None, :] >= points[:, :, None]).sum(axis=1)
+    mask = (crossings % 2 == 1) & _mating(rng, num_pairs, args)[:, None]
+    return _bound(_recombine(parents, moms, dads, mask), args, parents)
+
+
+def uniform_crossover(random, candidates, args):
+    """Return the offspring of uniform crossover on the candidates.
+
+    .. Arguments:
+       random -- the random number generator object
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *crossover_rate* -- the rate at which crossover is performed
+      (default 1.0)
+    - *ux_bias* -- the probability that a gene is swapped (default 0.5)
+
+    """
+    rng = np_random(random, args)
+    parents, moms, dads = _pairs(candidates)
+    ux_bias = args.setdefault('ux_bias', 0.5)
+    mask = (rng.random(moms.shape) < ux_bias) & _mating(rng, len(moms), args)[:, None]
+    return _bound(_recombine(parents, moms, dads, mask), args, parents)
+
+
+def blend_crossover(random, candidates, args):
+    """Return the offspring of blend crossover (BLX-alpha) on the candidates.
+
+    Both children are drawn uniformly from the interval spanned by the
+    parents, extended on each side by *blx_alpha* times its width.
+
+    .. Arguments:
+       random -- the random number generator object
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *crossover_rate* -- the rate at which crossover is performed
+      (default 1.0)
+    - *blx_alpha* -- the blending rate (default 0.1)
+
+    """
+    rng = np_random(random, args)
+    parents, moms, dads = _pairs(candidates)
+    blx_alpha = args.setdefault('blx_alpha', 0.1)
+    low = np.minimum(moms, dads)
+    width = np.abs(moms - dads)
+    low = low - blx_alpha * width
+    width = width * (1 + 2 * blx_alpha)
+    mating = _mating(rng, len(moms), args)[:, None]
+    offspring = parents.copy()
+    offspring[0:2*len(moms):2] = np.where(mating, low + rng.random(moms.shape) * width, moms)
+    offspring[1:2*len(moms):2] = np.where(mating, low + rng.random(moms.shape) * width, dads)
+    return _bound(offspring, args, parents)
+
+
+def sbx_crossover(random, candidates, args):
+    """Return the offspring of simulated binary crossover on the candidates.
+
+    This is the bounded SBX of Deb and Agrawal: the spread of the children
+    around the parents follows a polynomial distribution of index
+    *sbx_distribution_index* that is truncated at the bounder's limits.
+    Each gene of a mating pair is recombined with probability 0.5.
+
+    .. Arguments:
+       random -- the random number generator object
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *crossover_rate* -- the rate at which crossover is performed
+      (default 1.0)
+    - *sbx_distribution_index* -- the non-negative distribution index
+      (default 10)
+
+    """
+    rng = np_random(random, args)
+    parents, moms, dads = _pairs(candidates)
+    eta = args.setdefault('sbx_distribution_index', 10)
+    lower, upper = _bounds(args, parents.shape[1])
+    y1 = np.minimum(moms, dads)
+    y2 = np.maximum(moms, dads)
+    spread = y2 - y1
+    active = ((rng.random(moms.shape) < 0.5) & (spread > 1e-14)
+              & _mating(rng, len(moms), args)[:, None])
+    spread = np.where(active, spread, 1.0)
+    u = rng.random(moms.shape)
+
+    def betaq(beta):
+        alpha = 2.0 - np.power(beta, -(eta + 1.0))
+        return np.where(u <= 1.0 / alpha,
+                        np.power(u * alpha, 1.0 / (eta + 1.0)),
+                        np.power(1.0 / (2.0 - u * alpha), 1.0 / (eta + 1.0)))
+
+    with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+        c1 = 0.5 * ((y1 + y2) - betaq(1.0 + 2.0 * (y1 - lower) / spread) * spread)
+        c2 = 0.5 * ((y1 + y2) + betaq(1.0 + 2.0 * (upper - y2) / spread) * spread)
+    c1 = np.clip(c1, lower, upper)
+    c2 = np.clip(c2, lower, upper)
+    swap = rng.random(moms.shape) < 0.5
+    c1, c2 = np.where(swap, c2, c1), np.where(swap, c1, c2)
+    offspring = parents.copy()
+    offspring[0:2*len(moms):2] = np.where(active, c1, moms)
+    offspring[1:2*len(moms):2] = np.where(active, c2, dads)
+    return _bound(offspring, args, parents)
+
+
+def _mutation_mask(rng, shape, args):
+    mutation_rate = float(args.setdefault('mutation_rate', 0.1))
+    return rng.random(shape) < mutation_rate
+
+
+def gaussian_mutation(random, candidates, args):
+    """Return the mutants produced by Gaussian mutation on the candidates.
+
+    .. Arguments:
+       random -- the random number generator object
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
+    - *gaussian_mean* -- the mean used in the Gaussian function (default 0)
+    - *gaussian_stdev* -- the standard deviation used in the Gaussian
+      function (default 1)
+
+    """
+    rng = np_random(random, args)
+    parents = np.array(candidates, dtype=float)
+    mutants = parents.copy()
+    mean = float(args.setdefault('gaussian_mean', 0.0))
+    stdev = float(args.setdefault('gaussian_stdev', 1.0))
+    mask = _mutation_mask(rng, mutants.shape, args)
+    mutants += np.where(mask, rng.normal(mean, stdev, mutants.shape), 0.0)
+    return _bound(mutants, args, parents)
+
+
+def uniform_mutation(random, candidates, args):
+    """Return the mutants produced by uniform mutation on the candidates.
+
+    Mutated genes are replaced by a value drawn uniformly between the
+    bounder's lower and upper bounds.
+
+    .. Arguments:
+       random -- the random number generator object
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
+
+    """
+    rng = np_random(random, args)
+    parents = np.array(candidates, dtype=float)
+    mutants = parents.copy()
+    lower, upper = _bounds(args, mutants.shape[1])
+    mask = _mutation_mask(rng, mutants.shape, args)
+    mutants = np.where(mask, lower + rng.random(mutants.shape) * (upper - lower), mutants)
+    return _bound(mutants, args, parents)
+
+
+def polynomial_mutation(random, candidates, args):
+    """Return the mutants produced by polynomial mutation on the candidates.
+
+    This is Deb's bounded polynomial mutation: the perturbation follows a
+    polynomial distribution of index *pm_distribution_index* that never
+    leaves the bounder's limits.
+
+    .. Arguments:
+       random -- the random number generator object
+       candidates -- the candidate solutions
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+
+    - *mutation_rate* -- the rate at which mutation is performed (default 0.1)
+    - *pm_distribution_index* -- the non-negative distribution index
+      (default 20)
+
+    """
+    rng = np_random(random, args)
+    parents = np.array(candidates, dtype=float)
+    mutants = parents.copy()
+    eta = args.setdefault('pm_distribution_index', 20)
+    lower, upper = _bounds(args, mutants.shape[1])
+    width = upper - lower
+    mask = _mutation_mask(rng, mutants.shape, args)
+    u = rng.random(mutants.shape)
+    power = 1.0 / (eta + 1.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta1 = (mutants - lower) / width
+        delta2 = (upper - mutants) / width
+        low_side = 2.0 * u + (1.0 - 2.0 * u) * np.power(1.0 - delta1, eta + 1.0)
+        high_side = 2.0 * (1.0 - u) + 2.0 * (u - 0.5) * np.power(1.0 - delta2, eta + 1.0)
+        deltaq = np.where(u < 0.5, np.power(low_side, power) - 1.0, 1.0 - np.power(high_side, power))
+        mutated = np.clip(mutants + deltaq * width, lower, upper)
+    mutants = np.where(mask & np.isfinite(width), mutated, mutants)
+    return _bound(mutants, args, parents)
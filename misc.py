@@ -14,6 +14,7 @@ import csv
 import numpy as np
 from collections import defaultdict
 from operator import itemgetter
+import custom_trajectory
 
 path = os.getcwd()
 
@@ -43,9 +44,12 @@ def structure(case):
     shutil.copytree(inputfold,dest)
 
 
-def report(x,par,total_time):
+def report(x,par,total_time,evaluations_to_target=None):
     """Create and fill Report file
 
+    The number of evaluations needed to reach the target fitness is
+    written when it is given.
+
     """
 
     file = open("Report.txt", "w+")
@@ -92,14 +96,30 @@ def report(x,par,total_time):
     file.write('{0}\n\n'.format(' '.join(map(str, line))))
 
     file.write('Calculation Time: {0}'.format(total_time))
+    if evaluations_to_target is not None:
+        file.write('\nEvaluations to Target: {0}'.format(evaluations_to_target))
     file.close()
 
 
-def find_best(filename,pop):
-    """Find best of each generation, global and initial best
+def _as_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def read_columns(filename):
+    """Read an individuals file into a dictionary of columns
+
+    *filename* is the CSV file of ``file_observer`` or the ``.npy``
+    trajectory of ``binary_observer``, which is memory-mapped.
 
     """
 
+    if filename.endswith('.npy'):
+        rows = custom_trajectory.read_trajectory(filename)
+        return dict((k, rows[k].tolist()) for k in rows.dtype.names)
+
     columns = defaultdict(list) # each value in each column is appended to a list
 
     with open(filename) as f:
@@ -107,16 +127,33 @@ def find_best(filename,pop):
         for row in reader: # read a row as {column1: value1, column2: value2,...}
             for (k,v) in row.items(): # go over each column name and value
                 columns[k].append(v) # append the value into the appropriate list
+    return columns
+
+
+def find_best(filename,pop,maximize=True):
+    """Find best of each generation, global and initial best
+
+    *filename* is the individuals CSV file or the binary trajectory file.
+    The best individual of a generation is the one with the best value in
+    the Fitness column, whatever its position.
+
+    """
+
+    columns = read_columns(filename)
     temp = columns.get('Gen')
-    temp = [float(i) for i in temp]
-    m_temp = max(temp)
+    temp = np.array([float(i) for i in temp])
+    score = np.array([_as_float(i) for i in columns.get('Fitness')])
+    if not maximize:
+        score = -score
+    score[np.isnan(score)] = -np.inf
 
+    # best row of each generation, in generation order
     b = []
-    for i,v in enumerate(temp):
-        if v == m_temp and columns.get('Ind')[i] == '0' or columns.get('Ind')[i] == '0.0':
-            gb = i
-        if columns.get('Ind')[i] == '0' or columns.get('Ind')[i] == '0.0':
-            b.append(i)
+    for g in np.unique(temp):
+        rows = np.flatnonzero(temp == g)
+        b.append(int(rows[np.argmax(score[rows])]))
+    gb = max(b, key=lambda i: score[i])
+    ib = b[0]
 
     global_best = dict()
     keys = columns.keys()
@@ -125,7 +162,7 @@ def find_best(filename,pop):
 
     initial_best = dict()
     for k in keys:
-        initial_best[k] = columns.get(k)[0]
+        initial_best[k] = columns.get(k)[ib]
 
     best = dict()
     for k in keys:
@@ -18,7 +18,9 @@ import numpy as np
 import plot_results
 import misc
 import logging
+import custom_logging
 import pyDOE
+import custom_ec
 import GA_ec
 import DEA_ec
 import custom_swarm
@@ -26,6 +28,8 @@ import custom_evaluators
 import custom_observers
 import custom_terminators
 import custom_mutators
+import custom_variators
+import custom_selectors
 import custom_benchmarks
 
 path = os.getcwd()
@@ -34,11 +38,11 @@ case = str(sys.argv[1])
 # get algorithm from input
 algorithm = str(sys.argv[2])
 
-if algorithm != 'PSO':
+if algorithm in ('DEA', 'GA'):
     # get mutation rate from input
-    F = str(sys.argv[3])
+    F = float(sys.argv[3])
     # get crossover rate from input
-    CR = str(sys.argv[4])
+    CR = float(sys.argv[4])
 
 
 def evaluator(x, args):
@@ -66,15 +70,9 @@ def main(prng=None, display=False):
 
     os.makedirs(path + '/' + case)
 
-    ############### logging
-    logfile = case + '/inspyred.log'
-    logger = logging.getLogger('inspyred.ec')
-    logger.setLevel(logging.DEBUG)
-    file_handler = logging.FileHandler(logfile, mode='w')
-    file_handler.setLevel(logging.DEBUG)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    ############### logging (JSON lines written by a background thread)
+    logfile = case + '/inspyred.jsonl'
+    event_log = custom_logging.start_event_log(logfile, 'inspyred.ec', level=logging.INFO)
 
     ############### confirm start of run and delete old files
     os.chdir(path + '/' + case)
@@ -98,126 +96,198 @@ def main(prng=None, display=False):
     projdir = os.getcwd()
     stat_file_name = '{0}/statistics.csv'.format(projdir)
     ind_file_name = '{0}/individuals.csv'.format(projdir)
+    traj_file_name = '{0}/trajectory.npy'.format(projdir)
     stat_file = open(stat_file_name, 'w')
     ind_file = open(ind_file_name, 'w')
 
-
-    ############### build initial population using DOE (Latin Hypercube)
-    initial_population = pyDOE.lhs(len(parameters), samples = population, criterion = 'center')
-
-    ############### specify algorithm
-    if algorithm == 'DEA':
-        """ Differential Evolutionary Algorithm
-
-            * can be used with different mutators/crossovers/selectors/replacers,
-              or with one of the following strategies:
-                  * DE/best/1/exp
-                  * DE/rand/1/exp
-                  * DE/rand-to-best/1/exp
-                  * DE/best/2/exp
-                  * DE/rand/2/exp
-                  * DE/best/1/bin
-                  * DE/rand/1/bin
-                  * DE/rand-to-best/1/bin
-                  * DE/best/2/bin
-                  * DE/rand/2/bin
-
-            * Dont set both strategy and specific mutators/crossovers/selectors/replacers!!!
-            * Strategies to be used with populations > 6!!!
-            * If one of the strategies is used: ea = DEA_ec.DEA(prng)
-            * If other mutators/crossovers/selectors/replacers: ea = GA_ec.DEA(prng)
-
-        """
-        ea = DEA_ec.DEA(prng)
-
-        ea.terminator = inspyred.ec.terminators.evaluation_termination
-        ea.observer = custom_observers.file_observer
-        ea.strategy = 'DE/best/2/exp'
-
-
-        ############### solve
-        final_pop = ea.evolve(generator = problem.generator,
-                              evaluator = custom_evaluators.parallel_evaluation_mp,
-                              mp_evaluator = evaluator,
-                              mp_nprocs = 2,
-                              pop_size = population,
-                              bounder = problem.bounder,
-                              maximize = problem.maximize,
-                              crossover_rate = CR,
-                              mutation_rate = F,
-                              gaussian_mean = 0,
-                              gaussian_stdev = 1,
-                              max_evaluations = 100,
-                              statistics_file = stat_file,
-                              statistics_file_name = stat_file_name,
-                              individuals_file = ind_file,
-                              par = parameters,
-                              res = responses,
-                              tol = 0.5,
-                              c_maximize = problem.maximize,
-                              initial_pop = initial_population)
-
-    elif algorithm == 'GA':
-        """ Genetic Algorithm """
-        ea = GA_ec.GA(prng)
-
-        ea.terminator = inspyred.ec.terminators.evaluation_termination
-        ea.observer = custom_observers.file_observer
-        ea.selection = inspyred.ec.selectors.rank_selection
-        ea.variator = [inspyred.ec.variators.n_point_crossover,
-                       inspyred.ec.variators.gaussian_mutation]
-
-        ############### solve
-        final_pop = ea.evolve(generator = problem.generator,
-                              evaluator = custom_evaluators.parallel_evaluation_mp,
-                              mp_evaluator = evaluator,
-                              mp_nprocs = 2,
-                              pop_size = population,
-                              bounder = problem.bounder,
-                              maximize = problem.maximize,
-                              crossover_rate = CR,
-                              mutation_rate = F,
-                              max_evaluations = 100,
-                              statistics_file = stat_file,
-                              statistics_file_name = stat_file_name,
-                              individuals_file = ind_file,
-                              par = parameters,
-                              res = responses,
-                              tol = 0.5,
-                              c_maximize = problem.maximize,
-                              initial_pop = initial_population)
-
-    elif algorithm == 'PSO':
-        """ Particle Swarm Optimization """
-        ea = custom_swarm.PSO(prng)
-        ea.terminator = inspyred.ec.terminators.evaluation_termination
-        ea.observer = custom_observers.file_observer
-        ea.topology = inspyred.swarm.topologies.star_topology
-        final_pop = ea.evolve(generator = problem.generator,
-                                evaluator = custom_evaluators.parallel_evaluation_mp,
-                                mp_evaluator = evaluator,
-                                mp_nprocs = 2,
-                                pop_size = population,
-                                bounder = problem.bounder,
-                                maximize = problem.maximize,
-                                max_evaluations = 240,
-                                inetria = 0.5,
-                                cognitive_rate = 2.1,
-                                social_rate = 2.1,
-                                statistics_file = stat_file,
-                                statistics_file_name = stat_file_name,
-                                individuals_file = ind_file,
-                                par = parameters,
-                                res = responses,
-                                tol = 0.05,
-                                c_maximize = problem.maximize,
-                                initial_pop = initial_population)
-
-
-
-    ############### close observer files
-    stat_file.close()
-    ind_file.close()
+    ############### run the algorithm; the control channel, the files and the event log
+    ############### are closed even if the run fails or is interrupted
+    ea = None
+    try:
+        ############### build initial population using DOE (Latin Hypercube)
+        initial_population = pyDOE.lhs(len(parameters), samples = population, criterion = 'center')
+
+        ############### specify algorithm
+        if algorithm == 'DEA':
+            """ Differential Evolutionary Algorithm
+
+                * can be used with different mutators/crossovers/selectors/replacers,
+                  or with one of the following strategies:
+                      * DE/best/1/exp
+                      * DE/rand/1/exp
+                      * DE/rand-to-best/1/exp
+                      * DE/best/2/exp
+                      * DE/rand/2/exp
+                      * DE/best/1/bin
+                      * DE/rand/1/bin
+                      * DE/rand-to-best/1/bin
+                      * DE/best/2/bin
+                      * DE/rand/2/bin
+                  or with one of the self-adaptive strategies, which learn F and CR
+                  (starting from mutation_rate and crossover_rate) and accept
+                  pbest_rate, archive_rate and min_pop_size:
+                      * JADE
+                      * SHADE
+
+                * Dont set both strategy and specific mutators/crossovers/selectors/replacers!!!
+                * Strategies to be used with populations > 6!!!
+                * If one of the strategies is used: ea = DEA_ec.DEA(prng)
+                * If other mutators/crossovers/selectors/replacers: ea = GA_ec.DEA(prng)
+                * Out-of-bounds mutants are handled by problem.bounder.policy:
+                  'clip', 'reflect', 'wrap', 'random' or 'midpoint'
+
+            """
+            ea = DEA_ec.DEA(prng)
+            # mutants leaving the design space are re-drawn inside it
+            problem.bounder.policy = 'random'
+
+            ea.terminator = [inspyred.ec.terminators.evaluation_termination, custom_terminators.control_termination,
+                             custom_terminators.target_termination]
+            ea.observer = [custom_observers.file_observer, custom_observers.binary_observer]
+            ea.strategy = 'DE/best/2/exp'
+
+
+            ############### solve (duplicate trials of a generation are evaluated once)
+            final_pop = ea.evolve(generator = problem.generator,
+                                  evaluator = custom_evaluators.dedup_evaluation,
+                                  dedup_evaluator = custom_evaluators.parallel_evaluation_mp,
+                                  mp_evaluator = evaluator,
+                                  mp_nprocs = 2,
+                                  pop_size = population,
+                                  bounder = problem.bounder,
+                                  maximize = problem.maximize,
+                                  target_fitness = problem.optimum_value,
+                                  crossover_rate = CR,
+                                  mutation_rate = F,
+                                  gaussian_mean = 0,
+                                  gaussian_stdev = 1,
+                                  max_evaluations = 100,
+                                  statistics_file = stat_file,
+                                  statistics_file_name = stat_file_name,
+                                  individuals_file = ind_file,
+                                  trajectory_file = traj_file_name,
+                                  par = parameters,
+                                  res = responses,
+                                  tol = 0.5,
+                                  c_maximize = problem.maximize,
+                                  initial_pop = initial_population)
+
+        elif algorithm == 'GA':
+            """ Genetic Algorithm
+
+                * variation can use the inspyred operators, which loop over every
+                  candidate and gene, or the array-based ones of custom_variators,
+                  which transform the whole offspring matrix at once:
+                      * crossover: n_point_crossover, uniform_crossover,
+                        blend_crossover, sbx_crossover
+                      * mutation: gaussian_mutation, uniform_mutation,
+                        polynomial_mutation
+                * selection likewise: custom_selectors works on the fitness vector:
+                      * rank_selection, tournament_selection,
+                        truncation_selection, sus_selection
+
+            """
+            ea = GA_ec.GA(prng)
+
+            ea.terminator = [inspyred.ec.terminators.evaluation_termination, custom_terminators.control_termination,
+                             custom_terminators.target_termination]
+            ea.observer = [custom_observers.file_observer, custom_observers.binary_observer]
+            ea.selector = custom_selectors.rank_selection
+            ea.variator = [custom_variators.n_point_crossover,
+                           custom_variators.gaussian_mutation]
+
+            ############### solve
+            final_pop = ea.evolve(generator = problem.generator,
+                                  evaluator = custom_evaluators.parallel_evaluation_mp,
+                                  mp_evaluator = evaluator,
+                                  mp_nprocs = 2,
+                                  pop_size = population,
+                                  bounder = problem.bounder,
+                                  maximize = problem.maximize,
+                                  target_fitness = problem.optimum_value,
+                                  crossover_rate = CR,
+                                  mutation_rate = F,
+                                  max_evaluations = 100,
+                                  statistics_file = stat_file,
+                                  statistics_file_name = stat_file_name,
+                                  individuals_file = ind_file,
+                                  trajectory_file = traj_file_name,
+                                  par = parameters,
+                                  res = responses,
+                                  tol = 0.5,
+                                  c_maximize = problem.maximize,
+                                  initial_pop = initial_population)
+
+        elif algorithm == 'PSO':
+            """ Particle Swarm Optimization """
+            ea = custom_swarm.PSO(prng)
+            ea.terminator = [inspyred.ec.terminators.evaluation_termination, custom_terminators.control_termination,
+                             custom_terminators.target_termination]
+            ea.observer = [custom_observers.file_observer, custom_observers.binary_observer]
+            ea.topology = inspyred.swarm.topologies.star_topology
+            final_pop = ea.evolve(generator = problem.generator,
+                                    evaluator = custom_evaluators.parallel_evaluation_mp,
+                                    mp_evaluator = evaluator,
+                                    mp_nprocs = 2,
+                                    pop_size = population,
+                                    bounder = problem.bounder,
+                                    maximize = problem.maximize,
+                                    target_fitness = problem.optimum_value,
+                                    max_evaluations = 240,
+                                    inetria = 0.5,
+                                    cognitive_rate = 2.1,
+                                    social_rate = 2.1,
+                                    statistics_file = stat_file,
+                                    statistics_file_name = stat_file_name,
+                                    individuals_file = ind_file,
+                                    trajectory_file = traj_file_name,
+                                    par = parameters,
+                                    res = responses,
+                                    tol = 0.05,
+                                    c_maximize = problem.maximize,
+                                    initial_pop = initial_population)
+
+        elif algorithm == 'CMAES':
+            """ Covariance Matrix Adaptation Evolution Strategy
+
+                * samples pop_size candidates per generation and evaluates them
+                  as one batch
+                * restarts with a doubled population size (IPOP) once the search
+                  converges; sigma is the initial step size in the normalized
+                  design space
+
+            """
+            ea = custom_ec.CMAES(prng)
+            ea.terminator = [inspyred.ec.terminators.evaluation_termination, custom_terminators.control_termination,
+                             custom_terminators.target_termination]
+            ea.observer = [custom_observers.file_observer, custom_observers.binary_observer]
+            final_pop = ea.evolve(generator = problem.generator,
+                                    evaluator = custom_evaluators.parallel_evaluation_mp,
+                                    mp_evaluator = evaluator,
+                                    mp_nprocs = 2,
+                                    pop_size = population,
+                                    bounder = problem.bounder,
+                                    maximize = problem.maximize,
+                                    target_fitness = problem.optimum_value,
+                                    max_evaluations = 240,
+                                    sigma = 0.3,
+                                    statistics_file = stat_file,
+                                    statistics_file_name = stat_file_name,
+                                    individuals_file = ind_file,
+                                    trajectory_file = traj_file_name,
+                                    par = parameters,
+                                    res = responses,
+                                    tol = 0.05,
+                                    c_maximize = problem.maximize,
+                                    initial_pop = initial_population)
+
+    finally:
+        ############### close control channel (Ctrl-C stops after a generation), observer files and event log
+        if ea is not None:
+            custom_terminators.close_control(ea._kwargs)
+        stat_file.close()
+        ind_file.close()
+        event_log.stop()
 
     ############### count execution time
     total_time_s = time() - start_time
@@ -225,7 +295,7 @@ def main(prng=None, display=False):
     total_time = misc.formatTD(total_time)
 
     ################ find best solution
-    x = misc.find_best(ind_file_name,population)
+    x = misc.find_best(traj_file_name,population,problem.maximize)
 
     ################ plot Fitness Stats during generations
     plot_results.generation_plot(stat_file_name,case)
@@ -235,7 +305,7 @@ def main(prng=None, display=False):
 
     ################# print report
     os.chdir(projdir)
-    misc.report(x,parameters,total_time)
+    misc.report(x,parameters,total_time,ea._kwargs.get('evaluations_to_target'))
 
 if __name__ == '__main__':
     main(display=True)
\ No newline at end of file
@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+import pytest
+
+import custom_ec
+import custom_replacer
+
+
+def generator(random, args):
+    return [random.random() for _ in range(3)]
+
+
+def evaluator(candidates, args):
+    # proposals in part of the space fail to evaluate
+    fitness = [None if c[0] > 0.7 else float(np.sum(np.square(c))) for c in candidates]
+    return fitness, [{} for _ in candidates]
+
+
+def seeds(n):
+    return [[0.1 * (i % 7), 0.5, 0.5] for i in range(n)]
+
+
+@pytest.mark.parametrize('engine', [custom_ec.SA, custom_ec.PT])
+def test_none_fitness_keeps_chains(engine):
+    ea = engine(random.Random(1))
+    calls = []
+    replacer = ea.replacer
+
+    def checked_replacer(random, population, parents, offspring, args):
+        calls.append((len(parents), len(offspring), len(args.get('_temperatures', ()))))
+        return replacer(random=random, population=population, parents=parents, offspring=offspring, args=args)
+
+    ea.replacer = checked_replacer
+    ea.terminator = custom_ec.terminators.generation_termination
+    population = ea.evolve(generator, evaluator, seeds=seeds(8), maximize=False,
+                           bounder=custom_ec.Bounder([0] * 3, [1] * 3), num_chains=8,
+                           max_generations=30, gaussian_stdev=0.3, mutation_rate=1.0, seed=2)
+    assert len(population) == 8
+    assert len(calls) == 30
+    for parents, offspring, temperatures in calls:
+        assert parents == offspring == 8
+        assert temperatures in (0, 8)
+    assert all(p.fitness is not None for p in population)
+
+
+def test_tempering_rejects_none_offspring():
+    ea = custom_ec.PT(random.Random(1))
+    args = {'_ec': ea, '_temperatures': np.full(4, 1e6), 'seed': 3}
+    ea.maximize = False
+    ea.num_generations = 1
+    parents = []
+    offspring = []
+    for i in range(4):
+        parent = custom_ec.Individual([float(i)], maximize=False)
+        parent.fitness = float(i)
+        parents.append(parent)
+        child = custom_ec.Individual([10.0 + i], maximize=False)
+        child.fitness = None
+        offspring.append(child)
+    chains = custom_replacer.tempering_replacement(random.Random(1), parents, parents, offspring, args)
+    assert len(chains) == 4
+    assert all(c.fitness is not None for c in chains)
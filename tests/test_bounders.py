@@ -0,0 +1,27 @@
+import numpy as np
+
+import custom_ec
+
+
+def test_discrete_bounder_keeps_integer_values():
+    bounder = custom_ec.DiscreteBounder([4, 8, 16])
+    snapped = bounder.bound([[5.0, 13.0, 100.0], [-3.0, 6.0, 11.0]], {})
+    assert snapped.dtype.kind == 'i'
+    assert snapped.tolist() == [[4, 16, 16], [4, 4, 8]]
+    candidate = bounder([7.9, 12.5], {})
+    assert candidate == [8, 16]
+    assert all(type(v) is int for v in candidate)
+
+
+def test_discrete_bounder_keeps_mixed_types():
+    bounder = custom_ec.DiscreteBounder([[1, 2, 3], None, [0.5, 1.0]], 0, 10)
+    snapped = custom_ec.bound_candidates(bounder, [[2.6, 11.0, 0.7], [0.0, -1.0, 0.8]], {})
+    assert snapped == [[3, 10.0, 0.5], [1, 0.0, 1.0]]
+    assert [type(v) for v in snapped[0]] == [int, float, float]
+
+
+def test_discrete_bounder_float_values():
+    bounder = custom_ec.DiscreteBounder([0.25, 0.5, 1.0])
+    snapped = bounder.bound(np.array([[0.3, 0.9]]), {})
+    assert snapped.dtype == float
+    assert snapped.tolist() == [[0.25, 1.0]]
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from custom_random import RandomStreams
+
+
+@pytest.mark.parametrize('n, k', [(2, 1), (4, 3), (10, 3), (10, 5), (2000, 5)])
+def test_distinct_indices(n, k):
+    chosen = RandomStreams(1).distinct_indices(n, k)
+    assert chosen.shape == (n, k)
+    assert chosen.min() >= 0 and chosen.max() < n
+    for i, row in enumerate(chosen.tolist()):
+        assert len(set(row)) == k
+        assert i not in row
+
+
+def test_distinct_indices_needs_more_individuals():
+    with pytest.raises(ValueError):
+        RandomStreams(1).distinct_indices(3, 3)
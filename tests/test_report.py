@@ -0,0 +1,59 @@
+import csv
+import io
+import random
+
+import numpy as np
+
+import DEA_ec
+import custom_ec
+import custom_observers
+import misc
+
+
+def generator(random, args):
+    return [random.random() for _ in range(3)]
+
+
+def evaluator(candidates, args):
+    fitness = []
+    responses = []
+    for c in candidates:
+        x = 10 * np.asarray(c) - 5
+        f = float(np.sum(x ** 4 - 16 * x ** 2 + 5 * x) / 2)
+        fitness.append(f)
+        responses.append({'r1': f - 5})
+    return fitness, responses
+
+
+def read_table(text):
+    return list(csv.DictReader(io.StringIO(text), skipinitialspace=True))
+
+
+def test_report_names_the_best_solutions(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    statistics_file = io.StringIO()
+    individuals_name = str(tmp_path / 'individuals.csv')
+    ea = DEA_ec.DEA(random.Random(4))
+    ea.strategy = 'DE/rand/1/bin'
+    ea.terminator = custom_ec.terminators.generation_termination
+    ea.observer = custom_observers.file_observer
+    with open(individuals_name, 'w') as individuals_file:
+        ea.evolve(generator, evaluator, pop_size=12, maximize=False,
+                  bounder=custom_ec.Bounder([0] * 3, [1] * 3), mutation_rate=0.5, crossover_rate=0.7,
+                  max_generations=8, seed=5, par=['x1', 'x2', 'x3'], res=['r1'],
+                  statistics_file=statistics_file, individuals_file=individuals_file)
+
+    statistics = read_table(statistics_file.getvalue())
+    x = misc.find_best(individuals_name, 12, maximize=False)
+    misc.report(x, ['x1', 'x2', 'x3'], '0 s')
+    with open('Report.txt') as f:
+        lines = f.read().splitlines()
+    header = lines[2].split()
+    initial = dict(zip(header, lines[3].split()))
+    header = lines[7].split()
+    final = dict(zip(header, lines[8].split()))
+
+    best = [float(row['Best Fit']) for row in statistics]
+    assert abs(float(initial['Fitness']) - best[0]) < 1e-3
+    assert abs(float(final['Fitness']) - min(best)) < 1e-3
+    assert [abs(float(f) - b) < 1e-3 for f, b in zip(x['best']['Fitness'], best)] == [True] * len(best)